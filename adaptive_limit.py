@@ -0,0 +1,142 @@
+# adaptive_limit.py
+"""
+지연 시간/차단 신호로 동시 요청 수를 스스로 맞추는 조절기(상세 추출·자막 공용).
+- 한 창(window = 현재 동시 수 × 2건)마다 판단
+  · 오류 0건이고 지연 중앙값이 기준(가장 빨랐던 창)의 1.3배 이내 → +1
+  · 지연 중앙값이 기준의 1.8배 초과 → -1
+  · 429/차단 → 바로 절반, 시간 초과 → 바로 ×0.75 (창을 기다리지 않음)
+- 기준 지연은 창마다 조금씩 올려서(×1.02) 네트워크 상태가 바뀌어도 따라가게
+- 배운 동시 수는 CACHE_ROOT/concurrency.json에 이름별로 저장 → 다음 실행은 그 값에서 시작
+"""
+import os, json, atexit, threading, statistics
+
+from yt_cache import CACHE_ROOT
+
+STATE_PATH = os.path.join(CACHE_ROOT, "concurrency.json")
+
+OK, THROTTLED, TIMEOUT, ERROR = "ok", "throttled", "timeout", "error"
+
+GROW_RATIO, SHRINK_RATIO, BASELINE_DRIFT = 1.3, 1.8, 1.02
+
+_state_lock = threading.Lock()
+_limits = []
+
+
+def _load_state(path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class AdaptiveLimit:
+    def __init__(self, name, max_limit, start=4, min_limit=1, state_path=STATE_PATH):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.state_path = state_path
+        saved = _load_state(state_path).get(name)
+        self.limit = self._clamp(saved if isinstance(saved, int) else start)
+        self._cond = threading.Condition()
+        self._active = 0
+        self._window = []
+        self._window_errors = 0
+        self._baseline = None
+        self._saved = self.limit
+        self.counts = {OK: 0, THROTTLED: 0, TIMEOUT: 0, ERROR: 0}
+        with _state_lock:
+            _limits.append(self)
+
+    def _clamp(self, n):
+        return max(self.min_limit, min(self.max_limit, int(n)))
+
+    # ---- 자리 잡기(직접 세마포어처럼 쓸 때) ----
+    def acquire(self, cancelled=None):
+        """동시 수 상한 아래로 내려올 때까지 대기. cancelled()가 참이 되면 False."""
+        with self._cond:
+            while self._active >= self.limit:
+                if cancelled is not None and cancelled():
+                    return False
+                self._cond.wait(0.5)
+            self._active += 1
+            return True
+
+    def release(self, latency, outcome=OK):
+        with self._cond:
+            self._active -= 1
+            self._record(latency, outcome)
+            self._cond.notify_all()
+
+    # ---- 결과 기록(창 단위 판단) ----
+    def record(self, latency, outcome=OK):
+        """acquire 없이 호출자가 동시 수를 직접 맞출 때(제출 창)"""
+        with self._cond:
+            self._record(latency, outcome)
+            self._cond.notify_all()
+
+    def _record(self, latency, outcome):
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+        if outcome == THROTTLED:
+            self._set(self.limit // 2)
+            return
+        if outcome == TIMEOUT:
+            self._set(self.limit * 3 // 4)
+            return
+        if outcome == ERROR:
+            self._window_errors += 1
+        else:
+            self._window.append(latency)
+        if len(self._window) + self._window_errors < self.limit * 2:
+            return
+        med = statistics.median(self._window) if self._window else None
+        errors = self._window_errors
+        self._window, self._window_errors = [], 0
+        if med is None:
+            return
+        if self._baseline is None or med < self._baseline:
+            self._baseline = med
+        if med > self._baseline * SHRINK_RATIO:
+            self._set(self.limit - 1)
+        elif not errors and med <= self._baseline * GROW_RATIO:
+            self._set(self.limit + 1)
+        self._baseline *= BASELINE_DRIFT
+
+    def _set(self, n):
+        n = self._clamp(n)
+        if n != self.limit:
+            self.limit = n
+            self._window, self._window_errors = [], 0
+
+    def failures(self) -> int:
+        return self.counts[THROTTLED] + self.counts[TIMEOUT] + self.counts[ERROR]
+
+    def stats(self) -> dict:
+        with self._cond:
+            return dict(self.counts, name=self.name, limit=self.limit, active=self._active,
+                        baseline_s=round(self._baseline, 3) if self._baseline else None)
+
+    def save(self):
+        """바뀌었을 때만 파일에 반영(다른 이름의 값은 유지)"""
+        if self.limit == self._saved:
+            return
+        with _state_lock:
+            state = _load_state(self.state_path)
+            state[self.name] = self.limit
+            try:
+                os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+                tmp = self.state_path + ".part"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+                os.replace(tmp, self.state_path)
+                self._saved = self.limit
+            except OSError:
+                pass
+
+
+@atexit.register
+def save_all():
+    with _state_lock:
+        items = list(_limits)
+    for lim in items:
+        lim.save()
@@ -1,8 +1,9 @@
 # app.py
-import sys
+import sys, multiprocessing
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import QApplication, QMainWindow, QTabWidget
+from chrome_governor import GOVERNOR
 from community_tab import CommunityCrawlerWidget
 from youtube_tab import YouTubeSearchWidget
 
@@ -17,6 +18,8 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(tabs)
 
 if __name__ == "__main__":
+    # 상세 추출 프로세스 백엔드(yt_procpool)가 exe로 묶였을 때도 자식 프로세스를 띄울 수 있게
+    multiprocessing.freeze_support()
     # High DPI
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
@@ -30,6 +33,9 @@ if __name__ == "__main__":
         pass
 
     app = QApplication(sys.argv)
+    # 이전 실행이 남긴 chromedriver/크롬 정리, 종료 시 이번 실행분 정리
+    GOVERNOR.reap_orphans()
+    app.aboutToQuit.connect(GOVERNOR.shutdown)
     w = MainWindow()
     w.show()
     sys.exit(app.exec())
@@ -0,0 +1,245 @@
+# chrome_governor.py
+"""
+크롬/크롬드라이버 프로세스 관리.
+- 앱이 띄운 모든 브라우저를 추적(pid 기록 파일 포함)
+- 동시 브라우저 수 / 전체 RSS 예산 초과 시 새 세션은 대기열에서 기다림
+- 메모리 한도를 넘긴 브라우저는 재시작 대상으로 알려줌(needs_recycle)
+- 앱 시작/종료 시 이 앱이 띄웠다가 남겨진 chromedriver·크롬 자식 프로세스 정리(기록 파일에 있는 것만)
+psutil이 없으면 개수 제한과 정상 종료(driver.quit)만 동작한다.
+"""
+import os, json, atexit, threading
+
+try:
+    import psutil
+except ImportError:  # 선택 의존성 (requirements-app.txt)
+    psutil = None
+
+# 환경변수로 조절: CRAWL_MAX_BROWSERS=3, CRAWL_CHROME_RSS_BUDGET_MB=4096, CRAWL_CHROME_RECYCLE_MB=1500
+MAX_BROWSERS = int(os.environ.get("CRAWL_MAX_BROWSERS", "2"))
+RSS_BUDGET_MB = int(os.environ.get("CRAWL_CHROME_RSS_BUDGET_MB", "3072"))
+RECYCLE_MB = int(os.environ.get("CRAWL_CHROME_RECYCLE_MB", "1200"))
+
+REGISTRY_PATH = os.path.join(
+    os.getenv("LOCALAPPDATA") or os.path.expanduser("~"),
+    "OneInsight", "UnifiedCrawler", "chrome_pids.json"
+)
+
+
+def _driver_pid(driver):
+    try:
+        return driver.service.process.pid
+    except Exception:
+        return None
+
+
+def _proc(pid, create_time=None):
+    """살아있는 psutil.Process. create_time이 다르면(pid 재사용) None."""
+    if psutil is None or not pid:
+        return None
+    try:
+        p = psutil.Process(pid)
+        if create_time is not None and abs(p.create_time() - create_time) > 1.0:
+            return None
+        return p
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def _tree(p):
+    try:
+        return [p] + p.children(recursive=True)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return [p]
+
+
+def tree_rss_mb(pid) -> float:
+    """chromedriver + 자식(크롬 렌더러 등) RSS 합계(MB). psutil 없으면 0."""
+    p = _proc(pid)
+    if p is None:
+        return 0.0
+    total = 0
+    for c in _tree(p):
+        try:
+            total += c.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total / (1024 * 1024)
+
+
+def kill_tree(pid, create_time=None, timeout=3.0):
+    p = _proc(pid, create_time)
+    if p is None:
+        return 0
+    return kill_procs(_tree(p), timeout)
+
+
+def _snapshot(p):
+    """[[pid, create_time], ...] — 기록 파일용. chromedriver가 먼저 죽어도 크롬 트리를 찾을 수 있게."""
+    out = []
+    for c in _tree(p):
+        try:
+            out.append([c.pid, c.create_time()])
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return out
+
+
+def _app_ident():
+    p = _proc(os.getpid())
+    return [os.getpid(), p.create_time() if p is not None else None]
+
+
+def kill_procs(procs, timeout=3.0):
+    procs = [c for c in procs if c.is_running()]
+    for c in procs:
+        try:
+            c.kill()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    psutil.wait_procs(procs, timeout=timeout)
+    return len(procs)
+
+
+class ChromeGovernor:
+    def __init__(self, max_browsers=MAX_BROWSERS, rss_budget_mb=RSS_BUDGET_MB, recycle_mb=RECYCLE_MB,
+                 registry_path=REGISTRY_PATH):
+        self.max_browsers = max(1, max_browsers)
+        self.rss_budget_mb = rss_budget_mb
+        self.recycle_mb = recycle_mb
+        self.registry_path = registry_path
+        self._cond = threading.Condition()
+        self._slots = 0            # acquire~release 사이 세션 수(생성 중 포함)
+        self._active = {}          # id(driver) -> (driver, pid, create_time, 기록용 트리 스냅샷)
+
+    # ---- 대기열 ----
+    def total_rss_mb(self) -> float:
+        with self._cond:
+            pids = [e[1] for e in self._active.values()]
+        return sum(tree_rss_mb(pid) for pid in pids)
+
+    def acquire(self, log=None, should_abort=None, poll=1.0):
+        """브라우저 한 대 자리 확보. 개수/메모리 예산을 넘으면 자리가 날 때까지 대기."""
+        waited = False
+        with self._cond:
+            while True:
+                over_count = self._slots >= self.max_browsers
+                over_rss = (psutil is not None and self._active and self.rss_budget_mb
+                            and self.total_rss_mb() >= self.rss_budget_mb)
+                if not over_count and not over_rss:
+                    self._slots += 1
+                    return
+                if should_abort and should_abort():
+                    raise RuntimeError("브라우저 대기 중 중단됨")
+                if log and not waited:
+                    why = f"브라우저 {self._slots}/{self.max_browsers}대" if over_count else \
+                        f"크롬 메모리 예산 {self.rss_budget_mb}MB 초과"
+                    log(f"[Chrome] {why} → 빈 자리 대기")
+                    waited = True
+                self._cond.wait(poll)
+
+    def release_slot(self):
+        with self._cond:
+            self._slots = max(0, self._slots - 1)
+            self._cond.notify_all()
+
+    # ---- 추적 ----
+    def register(self, driver):
+        pid = _driver_pid(driver)
+        p = _proc(pid)
+        ctime = p.create_time() if p is not None else None
+        snap = _snapshot(p) if p is not None else []
+        with self._cond:
+            self._active[id(driver)] = (driver, pid, ctime, snap)
+        self._save_registry()
+
+    def release(self, driver):
+        """driver.quit() 후 남은 자식까지 정리하고 자리 반납. 여러 번 불러도 안전."""
+        with self._cond:
+            entry = self._active.pop(id(driver), None)
+        if entry is None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return
+        _, pid, ctime, _ = entry
+        # quit 후에는 chromedriver가 사라져 자식을 못 찾으므로 트리를 먼저 잡아둔다
+        p = _proc(pid, ctime)
+        procs = _tree(p) if p is not None else []
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        if procs:
+            kill_procs(procs)
+        self._save_registry()
+        self.release_slot()
+
+    def rss_mb(self, driver) -> float:
+        return tree_rss_mb(_driver_pid(driver))
+
+    def needs_recycle(self, driver) -> float | None:
+        """메모리 한도를 넘었으면 현재 RSS(MB), 아니면 None"""
+        if psutil is None or not self.recycle_mb:
+            return None
+        mb = self.rss_mb(driver)
+        return mb if mb >= self.recycle_mb else None
+
+    def shutdown(self):
+        """앱 종료 시: 추적 중인 브라우저 전부 정리"""
+        with self._cond:
+            drivers = [e[0] for e in self._active.values()]
+        for d in drivers:
+            self.release(d)
+
+    # ---- 기록 파일/고아 정리 ----
+    def _save_registry(self):
+        app = _app_ident()
+        with self._cond:
+            mine = [{"app": app, "procs": e[3]} for e in self._active.values() if e[3]]
+        try:
+            others = [e for e in self._load_registry() if (e.get("app") or [None])[0] != app[0]]
+            self._write_registry(others + mine)
+        except Exception:
+            pass
+
+    def _load_registry(self):
+        try:
+            with open(self.registry_path, "r", encoding="utf-8") as f:
+                return json.load(f) or []
+        except Exception:
+            return []
+
+    def _write_registry(self, entries):
+        os.makedirs(os.path.dirname(self.registry_path), exist_ok=True)
+        with open(self.registry_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+
+    def reap_orphans(self, log=None) -> int:
+        """
+        이전 실행이 남긴 프로세스 정리(앱 시작 시 1회).
+        기록 파일에 있고 띄운 앱이 이미 죽은 chromedriver/크롬 트리만(pid+생성시각 일치 확인).
+        기록에 없는 프로세스는 부모가 없어도 건드리지 않는다 — 같은 PC의 다른 도구/사용자의 셀레니움 작업일 수 있음.
+        """
+        if psutil is None:
+            return 0
+        killed = 0
+        keep = []
+        for e in self._load_registry():
+            app_pid, app_ctime = (e.get("app") or [None, None])[:2]
+            if _proc(app_pid, app_ctime) is not None:
+                keep.append(e)
+                continue
+            for pid, ctime in e.get("procs") or []:
+                killed += kill_tree(pid, ctime)
+        try:
+            self._write_registry(keep)
+        except Exception:
+            pass
+        if killed and log:
+            log(f"[Chrome] 남아있던 브라우저 프로세스 {killed}개 정리")
+        return killed
+
+
+GOVERNOR = ChromeGovernor()
+atexit.register(GOVERNOR.shutdown)
@@ -1,17 +1,19 @@
 from datetime import datetime, timedelta
 import os
 
-import pandas as pd
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import Qt, QThread, Signal, QAbstractTableModel, QModelIndex, QUrl
+from PySide6.QtGui import QDesktopServices, QColor
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QComboBox, QSpinBox, QCheckBox, QFileDialog, QTextEdit, QMessageBox, QDialog
+    QComboBox, QSpinBox, QCheckBox, QFileDialog, QTextEdit, QMessageBox, QDialog,
+    QTableView, QHeaderView, QSplitter
 )
 
 import crawling as community
+import text_analysis as ta
 from licensing.license_manager import (
     verify_license_text, load_license_from_disk, save_license_to_disk,
-    sign_license_with_private_pem, watermark_excel
+    sign_license_with_private_pem, watermark_excel, watermark_csv
 )
 
 
@@ -21,11 +23,13 @@ def ts():
 
 class CrawlerThread(QThread):
     log_line = Signal(str)
+    rows_batch = Signal(list)
     done = Signal(str, int)
     warn = Signal(str)
     fail = Signal(str)
 
-    def __init__(self, comm, url, days, hours, out_path, show_browser, lic_payload):
+    def __init__(self, comm, url, days, hours, out_path, show_browser, lic_payload, use_http=False, mobile=False,
+                 max_minutes=0, max_posts=0):
         super().__init__()
         self.comm = comm
         self.url = url
@@ -34,6 +38,16 @@ class CrawlerThread(QThread):
         self.out_path = out_path
         self.show_browser = show_browser
         self.lic_payload = lic_payload
+        self.use_http = use_http
+        self.mobile = mobile
+        # 예산(0 = 무제한)
+        self.max_minutes = max_minutes
+        self.max_posts = max_posts
+        self.control = community.CrawlControl(max_seconds=max_minutes * 60, max_posts=max_posts)
+
+    def request_stop(self, reason="사용자 중지"):
+        """다음 페이지/상세 요청 전에 멈추고, 그때까지의 결과는 정상 저장한다."""
+        self.control.cancel(reason)
 
     def run(self):
         try:
@@ -45,47 +59,219 @@ class CrawlerThread(QThread):
 
             self.log_line.emit(
                 f"실행: {self.comm} | 최근 {self.days}일 {self.hours}시간 (총 {total_hours}시간) | "
-                f"화면보기={self.show_browser} | cutoff={cutoff:%Y-%m-%d %H:%M}"
+                f"화면보기={self.show_browser} | 모바일={self.mobile} | cutoff={cutoff:%Y-%m-%d %H:%M}"
+                + (f" | 시간 제한 {self.max_minutes}분" if self.max_minutes else "")
+                + (f" | 최대 {self.max_posts}건" if self.max_posts else "")
             )
 
-            if self.comm == "FMKorea":
-                rows = community.crawl_fmkorea(self.url, cutoff, self.show_browser, _log)
-            elif self.comm == "DCInside":
-                rows = community.crawl_dcinside(self.url, cutoff, self.show_browser, _log)
-            elif self.comm == "TheQoo":
-                rows = community.crawl_theqoo(self.url, cutoff, self.show_browser, _log)
-            else:
-                self.fail.emit("지원하지 않는 커뮤니티입니다.")
+            use_http = self.use_http and self.comm in ("DCInside", "TheQoo")
+            if use_http and not community.http_mode_available():
+                self.log_line.emit("HTTP 병렬 모드를 쓸 수 없습니다(httpx/lxml 미설치) → 브라우저 모드로 진행")
+                use_http = False
+
+            try:
+                stream = community.iter_community(self.comm, self.url, cutoff, self.show_browser, _log,
+                                                 use_http=use_http, mobile=self.mobile,
+                                                 control=self.control)
+            except ValueError as e:
+                self.fail.emit(str(e))
                 return
 
-            if not rows:
-                self.warn.emit("수집 결과가 없습니다.")
+            # 같은 스트림을 화면(rows_batch)과 엑셀 저장에 함께 흘려보냄
+            writer = None
+            dt_min = dt_max = None
+            brief = []   # 분석용(제목/날짜/사이트/링크만)
+            for batch in community.iter_batches(stream, control=self.control):
+                self.rows_batch.emit(batch)
+                if writer is None:
+                    writer = community.XlsxStreamWriter(self.out_path)
+                writer.write_rows(batch)
+                brief.extend({k: r.get(k) for k in ("Title", "DateISO", "Site", "Link")} for r in batch)
+                for r in batch:
+                    iso = r.get("DateISO")
+                    if iso:
+                        try:
+                            dt = datetime.strptime(iso, "%Y-%m-%d %H:%M:%S")
+                        except Exception:
+                            continue
+                        dt_min = dt if dt_min is None or dt < dt_min else dt_min
+                        dt_max = dt if dt_max is None or dt > dt_max else dt_max
+
+            reason = self.control.stop_reason
+            if reason:
+                self.log_line.emit(f"{ts()} | 조기 종료: {reason} (수집분 {writer.count if writer else 0}건 저장)")
+
+            if writer is None:
+                self.warn.emit("수집 결과가 없습니다." + (f" ({reason})" if reason else ""))
                 return
 
-            df = pd.DataFrame(rows)
-            cols = [c for c in ["Site", "Title", "Date", "Views", "Link"] if c in df.columns]
-            df = df[cols]
-            community.ensure_dir_for_file(self.out_path)
-            df.to_excel(self.out_path, index=False)
-            watermark_excel(self.out_path, self.lic_payload)
-
-            dts = []
-            for r in rows:
-                iso = r.get("DateISO")
-                if iso:
-                    try:
-                        dts.append(datetime.strptime(iso, "%Y-%m-%d %H:%M:%S"))
-                    except Exception:
-                        pass
-            if dts:
+            self._add_analysis(writer, brief)
+            writer.save()
+            watermark_excel(self.out_path, self.lic_payload, extra={
+                "site": self.comm,
+                "rows": writer.count,
+                "elapsed_sec": f"{self.control.elapsed():.0f}",
+                "stop_reason": reason or "완료",
+            })
+
+            if dt_min:
                 self.log_line.emit(
-                    f"수집된 시각 범위: {min(dts):%Y-%m-%d %H:%M:%S} ~ {max(dts):%Y-%m-%d %H:%M:%S}"
+                    f"수집된 시각 범위: {dt_min:%Y-%m-%d %H:%M:%S} ~ {dt_max:%Y-%m-%d %H:%M:%S}"
                 )
 
-            self.log_line.emit(f"완료! 저장: {self.out_path} | 수집 {len(df)}건")
-            self.done.emit(self.out_path, len(df))
+            self.log_line.emit(
+                f"완료! 저장: {self.out_path} | 수집 {writer.count}건" + (f" | 부분 저장({reason})" if reason else "")
+            )
+            self.done.emit(self.out_path, writer.count)
+        except Exception as e:
+            self.fail.emit(str(e))
+
+    def _add_analysis(self, writer, rows):
+        """제목 키워드/추세 분석 시트(numpy 없거나 실패하면 건너뜀 — 본문 저장은 그대로)"""
+        if not ta.available():
+            self.log_line.emit(f"{ts()} | 분석 시트 생략(numpy 미설치)")
+            return
+        try:
+            t0 = datetime.now()
+            res = ta.analyze(rows, ("Title",), "Site", "DateISO")
+            items = (["Title", "Link"], [[r["Title"], r["Link"]] for r in rows])
+            for name, (cols, vals) in ta.analysis_sheets(res, items).items():
+                writer.add_sheet(name, cols, vals)
+            self.log_line.emit(f"{ts()} | 분석 시트 추가: 글 {res['docs']}건 · n-gram {res['vocab']}개 "
+                               f"({(datetime.now() - t0).total_seconds():.1f}초)")
+        except Exception as e:
+            self.log_line.emit(f"{ts()} | 분석 시트 생략: {e}")
+
+
+class MonitorThread(QThread):
+    """
+    모니터 모드: 중지할 때까지 목록 1페이지만 반복 확인해 새 글을 날짜별 CSV에 이어 씀.
+    조회수 변화는 <이름>_views_YYYYMMDD.csv에 (링크, 조회수, 시각)으로 따로 쌓인다.
+    CSV마다 라이선스 워터마크를 옆 파일(<csv>.meta.json)로 남김(종료 때 수집 건수/종료 사유로 갱신).
+    """
+    log_line = Signal(str)
+    rows_batch = Signal(list)
+    views_update = Signal(list)
+    status = Signal(str)
+    done = Signal(str, int)
+    fail = Signal(str)
+
+    def __init__(self, comm, url, out_path, show_browser, lic_payload, use_http=False, mobile=False,
+                 max_minutes=0, max_posts=0):
+        super().__init__()
+        self.comm = comm
+        self.url = url
+        self.out_path = out_path
+        self.show_browser = show_browser
+        self.lic_payload = lic_payload
+        self.use_http = use_http
+        self.mobile = mobile
+        self.control = community.CrawlControl(max_seconds=max_minutes * 60, max_posts=max_posts)
+
+    def request_stop(self, reason="사용자 중지"):
+        self.control.cancel(reason)
+
+    def run(self):
+        def _log(m):
+            self.log_line.emit(f"{ts()} | {m}")
+
+        def _watermark(path, **extra):
+            watermark_csv(path, self.lic_payload, extra=dict({"site": self.comm, "mode": "monitor"}, **extra))
+
+        stem = os.path.splitext(self.out_path)[0]
+        writer = community.RollingCsvWriter(stem, community.EXPORT_COLUMNS, on_open=_watermark)
+        views = community.RollingCsvWriter(stem + "_views", ["Link", "Views", "At"], on_open=_watermark)
+        failed = False
+        try:
+            _log(f"모니터 시작: {self.comm} | 저장: {stem}_YYYYMMDD.csv")
+            for kind, payload in community.iter_monitor(self.comm, self.url, self.show_browser, _log,
+                                                         use_http=self.use_http, mobile=self.mobile,
+                                                         control=self.control):
+                if kind == "new":
+                    writer.write_rows(payload)
+                    self.rows_batch.emit(payload)
+                    _log(f"새 글 {len(payload)}건 (누적 {writer.count}건)")
+                elif kind == "views":
+                    views.write_rows(payload)
+                    self.views_update.emit(payload)
+                else:
+                    self.status.emit(f"다음 확인까지 {payload['interval']}초 · 이번 새 글 {payload['new']}건"
+                                     + (" · 2페이지까지 확인" if payload["pages"] == 2 else ""))
         except Exception as e:
+            failed = True
             self.fail.emit(str(e))
+        finally:
+            writer.close()
+            views.close()
+        reason = "오류" if failed else self.control.stop_reason or "완료"
+        if writer.path:
+            _watermark(writer.path, rows_total=writer.count, elapsed_sec=f"{self.control.elapsed():.0f}", stop_reason=reason)
+        if failed:
+            return
+        _log(f"모니터 종료: {reason} | 새 글 {writer.count}건")
+        self.done.emit(stem, writer.count)
+
+
+class ResultsModel(QAbstractTableModel):
+    """수집 행(dict) 리스트를 그대로 보여주는 모델. 화면에 보이는 칸만 그려진다."""
+    COLUMNS = [("Site", "사이트"), ("Title", "제목"), ("Date", "날짜"), ("Views", "조회수"), ("Link", "링크")]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        key = self.COLUMNS[index.column()][0]
+        v = self._rows[index.row()].get(key)
+        if role == Qt.DisplayRole:
+            return "" if v is None else str(v)
+        if role == Qt.ToolTipRole and key in ("Title", "Link"):
+            return v
+        if role == Qt.TextAlignmentRole and key == "Views":
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == Qt.ForegroundRole and key == "Link":
+            return QColor(Qt.blue)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][1]
+        return super().headerData(section, orientation, role)
+
+    def append_rows(self, rows):
+        if not rows:
+            return
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+    def update_views(self, updates):
+        """[{"Link", "Views"}...] → 같은 링크 행의 조회수 칸만 다시 그림"""
+        col = [k for k, _ in self.COLUMNS].index("Views")
+        by_link = {u["Link"]: u["Views"] for u in updates}
+        for i, r in enumerate(self._rows):
+            v = by_link.get(r.get("Link"))
+            if v is not None and v != r.get("Views"):
+                r["Views"] = v
+                idx = self.index(i, col)
+                self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def row_at(self, r):
+        return self._rows[r]
 
 
 class AdminIssueDialog(QDialog):
@@ -193,13 +379,40 @@ class CommunityCrawlerWidget(QWidget):
         self.days = QSpinBox(); self.days.setRange(0, 365); self.days.setValue(1)
         self.hours = QSpinBox(); self.hours.setRange(0, 23); self.hours.setValue(0)
         self.show_browser = QCheckBox("크롤링 화면 보기(브라우저 표시)")
+        self.use_http = QCheckBox("HTTP 병렬 모드(DC/더쿠, 브라우저 없이)")
+        self.use_http.setToolTip("다음 페이지들을 미리 병렬로 받아 빠르게 수집합니다. FMKorea는 항상 브라우저 모드.")
+        self.mobile = QCheckBox("모바일 페이지로 수집(DC/FMK)")
+        self.mobile.setToolTip("m.dcinside.com / m.fmkorea.com의 가벼운 페이지를 읽습니다. 링크는 PC 주소로 저장됩니다.")
         line2.addWidget(QLabel("최근")); line2.addWidget(self.days); line2.addWidget(QLabel("일"))
         line2.addSpacing(8)
         line2.addWidget(self.hours); line2.addWidget(QLabel("시간"))
         line2.addSpacing(20)
-        line2.addWidget(self.show_browser); line2.addStretch()
+        line2.addWidget(self.show_browser)
+        line2.addSpacing(12)
+        line2.addWidget(self.use_http)
+        line2.addSpacing(12)
+        line2.addWidget(self.mobile); line2.addStretch()
         lay.addLayout(line2)
 
+        # 작업 예산(0 = 무제한): 넘으면 그때까지 모은 글로 정상 저장
+        line2b = QHBoxLayout()
+        self.max_minutes = QSpinBox(); self.max_minutes.setRange(0, 24 * 60); self.max_minutes.setValue(0)
+        self.max_minutes.setSpecialValueText("무제한")
+        self.max_posts = QSpinBox(); self.max_posts.setRange(0, 1_000_000); self.max_posts.setValue(0)
+        self.max_posts.setSpecialValueText("무제한")
+        line2b.addWidget(QLabel("시간 제한(분)")); line2b.addWidget(self.max_minutes)
+        line2b.addSpacing(12)
+        line2b.addWidget(QLabel("최대 글 수")); line2b.addWidget(self.max_posts)
+        line2b.addSpacing(20)
+        self.monitor = QCheckBox("모니터 모드(새 글 계속 확인)")
+        self.monitor.setToolTip("중지할 때까지 목록 첫 페이지만 반복 확인해 새 글을 날짜별 CSV에 이어 씁니다.\n"
+                                "확인 간격은 글이 올라오는 속도에 맞춰 자동 조절되고, 기간 설정은 쓰지 않습니다.")
+        line2b.addWidget(self.monitor)
+        self.lbl_monitor = QLabel("")
+        line2b.addWidget(self.lbl_monitor)
+        line2b.addStretch()
+        lay.addLayout(line2b)
+
         line3 = QHBoxLayout()
         default_path = os.path.join(community.DEFAULT_DESKTOP, f"크롤링_결과_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
         self.out_path = QLineEdit(default_path)
@@ -213,17 +426,52 @@ class CommunityCrawlerWidget(QWidget):
         self.btn_license.clicked.connect(self.on_license_load)
         self.btn_run = QPushButton("실행")
         self.btn_run.clicked.connect(self.on_run)
+        self.btn_stop = QPushButton("중지(수집분 저장)")
+        self.btn_stop.setEnabled(False)
+        self.btn_stop.clicked.connect(self.on_stop)
         admin = QPushButton("라이선스 발급(관리자)")
         admin.clicked.connect(self.on_admin_issue)
         line4.addWidget(self.btn_license)
         line4.addWidget(self.btn_run)
+        line4.addWidget(self.btn_stop)
         line4.addWidget(admin)
         line4.addStretch()
         lay.addLayout(line4)
 
-        lay.addWidget(QLabel("로그"))
+        # 결과 표(실시간) + 로그
+        self.results = ResultsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.results)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setWordWrap(False)
+        vh = self.table.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.Fixed)  # 고정 높이 → 행 수와 무관하게 스크롤 가벼움
+        vh.setDefaultSectionSize(22)
+        hh = self.table.horizontalHeader()
+        hh.setSectionResizeMode(QHeaderView.Interactive)
+        hh.setSectionResizeMode(1, QHeaderView.Stretch)
+        self.table.setColumnWidth(0, 80); self.table.setColumnWidth(2, 140)
+        self.table.setColumnWidth(3, 70); self.table.setColumnWidth(4, 320)
+        self.table.doubleClicked.connect(self.on_result_double_click)
+        self.lbl_count = QLabel("결과 0건")
+
+        log_box = QWidget()
+        log_lay = QVBoxLayout(log_box); log_lay.setContentsMargins(0, 0, 0, 0)
+        log_lay.addWidget(QLabel("로그"))
         self.log = QTextEdit(); self.log.setReadOnly(True)
-        lay.addWidget(self.log, 1)
+        log_lay.addWidget(self.log, 1)
+
+        res_box = QWidget()
+        res_lay = QVBoxLayout(res_box); res_lay.setContentsMargins(0, 0, 0, 0)
+        res_lay.addWidget(self.lbl_count)
+        res_lay.addWidget(self.table, 1)
+
+        split = QSplitter(Qt.Vertical)
+        split.addWidget(res_box)
+        split.addWidget(log_box)
+        split.setStretchFactor(0, 3)
+        split.setStretchFactor(1, 1)
+        lay.addWidget(split, 1)
 
         tail = QLabel("원초적인사이트 데이터수집 프로그램")
         lay.addWidget(tail)
@@ -279,6 +527,21 @@ class CommunityCrawlerWidget(QWidget):
     def append_log(self, m: str):
         self.log.append(m)
 
+    def on_stop(self):
+        if self.thread is not None and self.thread.isRunning():
+            self.thread.request_stop()
+            self.btn_stop.setEnabled(False)
+            self.append_log(f"{ts()} | 중지 요청 — 진행 중인 요청이 끝나면 수집분을 저장합니다")
+
+    def on_rows_batch(self, rows):
+        self.results.append_rows(rows)
+        self.lbl_count.setText(f"결과 {self.results.rowCount()}건")
+
+    def on_result_double_click(self, index):
+        link = self.results.row_at(index.row()).get("Link")
+        if link:
+            QDesktopServices.openUrl(QUrl(link))
+
     def on_admin_issue(self):
         dlg = AdminIssueDialog(self)
         dlg.exec()
@@ -297,11 +560,12 @@ class CommunityCrawlerWidget(QWidget):
         if not url:
             QMessageBox.warning(self, "입력 확인", "목록 URL을 입력하세요.")
             return
+        monitor = self.monitor.isChecked()
         if days < 0 or hours < 0 or hours > 23:
             QMessageBox.warning(self, "입력 확인", "일은 0 이상, 시간은 0~23 범위로 입력해 주세요.")
             return
         total_hours = days * 24 + hours
-        if total_hours < 1:
+        if total_hours < 1 and not monitor:
             QMessageBox.warning(self, "입력 확인", "총 시간이 1시간 이상이어야 합니다.")
             return
         host = community.urlparse(url).netloc.lower()
@@ -316,12 +580,40 @@ class CommunityCrawlerWidget(QWidget):
             return
 
         self.btn_run.setEnabled(False)
+        self.results.clear()
+        self.lbl_count.setText("결과 0건")
         self.append_log(f"{ts()} | 작업 시작")
 
-        self.thread = CrawlerThread(comm, url, days, hours, outp, show, self.license_payload)
+        if monitor:
+            use_http = self.use_http.isChecked() and comm in ("DCInside", "TheQoo")
+            self.thread = MonitorThread(comm, url, outp, show, self.license_payload,
+                                        use_http=use_http, mobile=self.mobile.isChecked(),
+                                        max_minutes=int(self.max_minutes.value()),
+                                        max_posts=int(self.max_posts.value()))
+            self.thread.log_line.connect(self.append_log)
+            self.thread.rows_batch.connect(self.on_rows_batch)
+            self.thread.views_update.connect(self.results.update_views)
+            self.thread.status.connect(self.lbl_monitor.setText)
+            self.thread.done.connect(lambda p, c: self.append_log(f"{ts()} | 모니터 저장: {p}_*.csv (새 글 {c}건)"))
+            self.thread.fail.connect(lambda m: (self.append_log(f"{ts()} | 오류: {m}"), QMessageBox.critical(self, "오류", m)))
+            self.thread.finished.connect(self._on_thread_finished)
+            self.thread.start()
+            self.btn_stop.setEnabled(True)
+            return
+
+        self.thread = CrawlerThread(comm, url, days, hours, outp, show, self.license_payload,
+                                    use_http=self.use_http.isChecked(), mobile=self.mobile.isChecked(),
+                                    max_minutes=int(self.max_minutes.value()), max_posts=int(self.max_posts.value()))
         self.thread.log_line.connect(self.append_log)
+        self.thread.rows_batch.connect(self.on_rows_batch)
         self.thread.done.connect(lambda p,c: QMessageBox.information(self, "완료", f"저장 완료\n{p}\n총 {c}건"))
         self.thread.warn.connect(lambda m: (self.append_log(f"{ts()} | {m}"), QMessageBox.information(self, "알림", m)))
         self.thread.fail.connect(lambda m: (self.append_log(f"{ts()} | 오류: {m}"), QMessageBox.critical(self, "오류", m)))
-        self.thread.finished.connect(lambda: self.btn_run.setEnabled(True))
+        self.thread.finished.connect(self._on_thread_finished)
         self.thread.start()
+        self.btn_stop.setEnabled(True)
+
+    def _on_thread_finished(self):
+        self.lbl_monitor.setText("")
+        self.btn_run.setEnabled(True)
+        self.btn_stop.setEnabled(False)
@@ -1,5 +1,6 @@
-import os, re, sys, time, random, json
+import os, re, sys, time, queue, random, json, threading
 from datetime import datetime, timedelta
+from functools import partial
 from urllib.parse import urlparse, urljoin, urlunparse, urlencode, parse_qs
 
 import pandas as pd  # 일부 유틸에서 사용
@@ -11,6 +12,20 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from chrome_governor import GOVERNOR
+from fetch_scheduler import FetchScheduler, run_async_iter, http_available, SPECULATIVE_PAGES, HOST_CONCURRENCY
+from fetch_scheduler import HEADERS as HTTP_HEADERS
+
+try:
+    import httpx  # 모니터 모드 HTTP 세션(선택)
+except ImportError:
+    httpx = None
+
+try:
+    from lxml import html as lxml_html  # HTTP 병렬 모드용 파서(선택)
+except ImportError:
+    lxml_html = None
+
 APP_TITLE = "커뮤니티 크롤러 (최근 일+시간 + 화면 표시)"
 USER_HOME = os.path.expanduser("~")
 DEFAULT_DESKTOP = os.path.join(USER_HOME, "Desktop")
@@ -18,6 +33,10 @@ DEFAULT_DESKTOP = os.path.join(USER_HOME, "Desktop")
 MAX_PAGES_SOFT = 300
 STALE_PAGE_LIMIT = 3
 
+# 모바일 모드(m.dcinside.com / m.fmkorea.com)용 UA
+MOBILE_UA = ("Mozilla/5.0 (Linux; Android 14; SM-S918N) AppleWebKit/537.36 "
+             "(KHTML, like Gecko) Chrome/128.0 Mobile Safari/537.36")
+
 # ---------- 공통 유틸 ----------
 def ts():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -46,6 +65,68 @@ def add_or_replace_query_param(url: str, key: str, value) -> str:
 def rsleep(min_s=0.1, max_s=0.5):
     time.sleep(random.uniform(min_s, max_s))
 
+class CrawlControl:
+    """
+    협조적 중단 + 작업별 예산(경과 시간/수집 글 수).
+    크롤러는 페이지/상세 요청 사이마다 should_stop()을 확인하고, 참이면 그때까지의 결과로 정상 종료한다.
+    cancel()은 다른 스레드(GUI)에서 불러도 안전하다.
+    """
+
+    def __init__(self, max_seconds: float | None = None, max_posts: int | None = None):
+        self.max_seconds = max_seconds or None
+        self.max_posts = max_posts or None
+        self.started = time.monotonic()
+        self.posts = 0
+        self.stop_reason = None
+        self._cancel = threading.Event()
+
+    def cancel(self, reason: str = "사용자 중지"):
+        if self.stop_reason is None:
+            self.stop_reason = reason
+        self._cancel.set()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def should_stop(self) -> bool:
+        if self._cancel.is_set():
+            return True
+        if self.max_seconds and self.elapsed() >= self.max_seconds:
+            self.cancel(f"시간 예산 {self.max_seconds:.0f}초 초과")
+        elif self.max_posts and self.posts >= self.max_posts:
+            self.cancel(f"글 수 예산 {self.max_posts}건 도달")
+        return self._cancel.is_set()
+
+    def wait(self, seconds: float) -> bool:
+        """seconds만큼 쉬되 중단되면 바로 깨어남. 중단됐으면 True."""
+        return self._cancel.wait(seconds)
+
+def _stopped(control, log, tag) -> bool:
+    if control is not None and control.should_stop():
+        log(f"{tag} 중단: {control.stop_reason}")
+        return True
+    return False
+
+def public_row(r: dict) -> dict:
+    """내부용 키(_dt 등) 제거"""
+    return {k: v for k, v in r.items() if not k.startswith("_")}
+
+# ---------- HTML 파싱(HTTP 모드) ----------
+def http_mode_available() -> bool:
+    return http_available() and lxml_html is not None
+
+def _parse_html(html: str):
+    if lxml_html is None:
+        raise RuntimeError("HTTP 병렬 모드에는 lxml이 필요합니다. 'pip install httpx lxml'을 실행하세요.")
+    return lxml_html.fromstring(html or "<html></html>")
+
+def _xcls(name: str) -> str:
+    """CSS '.name'에 해당하는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+def _xtext(el) -> str:
+    return (el.text_content() or "").strip() if el is not None else ""
+
 # ---------- 드라이버 초기화 ----------
 def _load_driver_path_from_json():
     candidates = []
@@ -74,12 +155,52 @@ def _load_driver_path_from_json():
 
 
 # crawling.py (실행폴더 → ENV → JSON)
-def initialize_driver(show_browser: bool):
+def _start_driver(path, options, log=None, control=None):
+    """
+    거버너에서 자리(개수/메모리 예산)를 받은 뒤 크롬을 띄우고 추적에 등록.
+    생성 중 실패하면 이미 뜬 chromedriver까지 내리고 자리를 돌려준다.
+    """
+    GOVERNOR.acquire(log=log, should_abort=control.should_stop if control is not None else None)
+    service = Service(path)
+    try:
+        driver = webdriver.Chrome(service=service, options=options)
+    except BaseException:
+        try:
+            service.stop()
+        except Exception:
+            pass
+        GOVERNOR.release_slot()
+        raise
+    GOVERNOR.register(driver)
+    driver.set_page_load_timeout(25)
+    return driver
+
+def quit_driver(driver):
+    """driver.quit() + 남은 크롬 자식 정리 + 거버너 자리 반납"""
+    if driver is not None:
+        GOVERNOR.release(driver)
+
+def recycle_if_bloated(driver, show_browser, log, mobile=False, control=None):
+    """브라우저 트리 메모리가 한도를 넘으면 새 브라우저로 교체해 돌려준다."""
+    mb = GOVERNOR.needs_recycle(driver)
+    if mb is None:
+        return driver
+    log(f"[Chrome] 메모리 {mb:.0f}MB ≥ {GOVERNOR.recycle_mb}MB → 브라우저 재시작")
+    quit_driver(driver)
+    return initialize_driver(show_browser, mobile=mobile, log=log, control=control)
+
+def initialize_driver(show_browser: bool, mobile: bool = False, log=None, control=None):
     options = Options()
     if not show_browser:
         options.add_argument("--headless=new")
     options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
+    if mobile:
+        # 모바일 페이지 + 이미지 차단 → 전송량/렌더링 최소화
+        options.add_argument("--window-size=412,915")
+        options.add_argument(f"--user-agent={MOBILE_UA}")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    else:
+        options.add_argument("--window-size=1920,1080")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
 
@@ -111,26 +232,17 @@ def initialize_driver(show_browser: bool):
     # 로컬 드라이버 우선 사용
     for p in local_candidates:
         if os.path.exists(p):
-            service = Service(p)
-            driver = webdriver.Chrome(service=service, options=options)
-            driver.set_page_load_timeout(25)
-            return driver
+            return _start_driver(p, options, log, control)
 
     # 1) 환경변수
     env_path = os.environ.get("CHROMEDRIVER_PATH")
     if env_path and os.path.exists(env_path):
-        service = Service(env_path)
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.set_page_load_timeout(25)
-        return driver
+        return _start_driver(env_path, options, log, control)
 
     # 2) JSON (ProgramData 등)
     json_path = _load_driver_path_from_json()
     if json_path and os.path.exists(json_path):
-        service = Service(json_path)
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.set_page_load_timeout(25)
-        return driver
+        return _start_driver(json_path, options, log, control)
 
     raise RuntimeError(
         "ChromeDriver를 찾을 수 없습니다.\n"
@@ -186,6 +298,23 @@ def parse_dt_dc_flexible(text: str):
         return hh
     return None
 
+_REL_DT_RE = re.compile(r"^(\d+)\s*(분|시간|일)\s*전$")
+
+def parse_dt_relative(text: str):
+    """모바일 목록의 상대 시각: '방금', 'N 분 전', 'N 시간 전', 'N 일 전'"""
+    if not text:
+        return None
+    s = text.strip()
+    now = datetime.now().replace(second=0, microsecond=0)
+    if s in ("방금", "방금 전"):
+        return now
+    m = _REL_DT_RE.match(s)
+    if not m:
+        return None
+    n, unit = int(m.group(1)), m.group(2)
+    delta = {"분": timedelta(minutes=n), "시간": timedelta(hours=n), "일": timedelta(days=n)}[unit]
+    return now - delta
+
 # ---------- FMKorea ----------
 FM_LINK_PATTERNS = [
     re.compile(r"/\d{5,}$"),
@@ -238,25 +367,107 @@ def fmk_get_content(link, driver):
         title, date_text, views = "제목 없음", "", None
     return title, date_text, views
 
-def crawl_fmkorea(list_url, cutoff, show_browser, log):
-    rows = []
-    driver = initialize_driver(show_browser)
+# FMKorea 모바일(m.fmkorea.com): 같은 document_srl, 가벼운 목록/상세
+def fmk_to_mobile_url(url: str) -> str:
+    parts = list(urlparse(url))
+    parts[1] = "m.fmkorea.com"
+    return urlunparse(parts)
+
+def fmk_to_desktop_link(url: str) -> str:
+    """모바일/데스크톱 어떤 링크든 정규 데스크톱 링크(https://www.fmkorea.com/<srl>)로"""
+    u = urlparse(url)
+    m = re.search(r"/(\d{5,})$", u.path)
+    srl = m.group(1) if m else (parse_qs(u.query).get("document_srl") or [""])[0]
+    if srl.isdigit():
+        return f"https://www.fmkorea.com/{srl}"
+    return urlunparse(u._replace(netloc="www.fmkorea.com"))
+
+def fmk_parse_mobile_list_html(html: str, base_url: str):
+    """모바일 목록 → 상세 링크(모바일 호스트, 페이지 순서)"""
+    doc = _parse_html(html)
+    links, seen = [], set()
+    anchors = doc.xpath(f"//h3[{_xcls('title')}]//a[@href]") or doc.xpath("//li//a[@href]")
+    for a in anchors:
+        href = urljoin(base_url, a.get("href"))
+        if any(p.search(href) for p in FM_LINK_PATTERNS) and href not in seen:
+            seen.add(href)
+            links.append(href)
+    return links
+
+def fmk_parse_mobile_detail_html(html: str):
+    """모바일 상세 → (제목, 날짜 문자열, 조회수)"""
+    doc = _parse_html(html)
+    t = doc.xpath(f"//span[{_xcls('np_18px_span')}]")
+    title_text = _xtext(t[0]) if t else "제목 없음"
+    if t and doc.xpath(f"//h1[{_xcls('np_18px')}]/span[{_xcls('STAR-BEST_T')}]"):
+        title_text = f"포텐: {title_text}"
+    d = doc.xpath(f"//span[{_xcls('date')}]")
+    date_text = _xtext(d[0]) if d else ""
+    v = doc.xpath("//span[contains(text(), '조회 수')]/b")
+    views = to_int_or_none(_xtext(v[0])) if v else None
+    return title_text, date_text, views
+
+def fmk_get_content_mobile(link, driver):
+    driver.get(link); rsleep()
+    try:
+        WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, ".np_18px_span")))
+        return fmk_parse_mobile_detail_html(driver.page_source)
+    except Exception as e:
+        print("Error extracting content from", link, ":", e)
+        return "제목 없음", "", None
+
+def fmk_get_post(href, driver, mobile=False):
+    """상세 한 건 → 행(_dt 포함, 날짜를 못 읽으면 _dt=None). Link는 데스크톱 정규 링크."""
+    if mobile:
+        title_text, date_text, views = fmk_get_content_mobile(href, driver)
+        post_time = parse_dt_dot(date_text) or parse_dt_relative(date_text)
+        if post_time and not parse_dt_dot(date_text):
+            date_text = post_time.strftime("%Y.%m.%d %H:%M")
+        href = fmk_to_desktop_link(href)
+    else:
+        title_text, date_text, views = fmk_get_content(href, driver)
+        post_time = parse_dt_dot(date_text)
+    return {
+        "Site": "FMKorea",
+        "Title": title_text,
+        "Date": date_text,
+        "DateISO": post_time.strftime("%Y-%m-%d %H:%M:%S") if post_time else "",
+        "Views": views,
+        "Link": href,
+        "_dt": post_time,
+    }
+
+def iter_fmkorea(list_url, cutoff, show_browser, log, mobile=False, control=None):
+    """
+    파싱되는 즉시 행을 내보내는 제너레이터. 중간에 close()해도 드라이버는 정리된다.
+    mobile=True: m.fmkorea.com 목록/상세를 읽고 Link는 데스크톱 정규 링크로 기록.
+    """
+    tag = "[FMK/M]" if mobile else "[FMK]"
+    if mobile:
+        list_url = fmk_to_mobile_url(list_url)
+    driver = initialize_driver(show_browser, mobile=mobile, log=log, control=control)
     try:
         page = 1
         stale_pages = 0
         while page <= MAX_PAGES_SOFT:
+            if _stopped(control, log, tag):
+                break
+            driver = recycle_if_bloated(driver, show_browser, log, mobile, control)
             current_url = add_or_replace_query_param(list_url, "page", page)
-            log(f"[FMK] 목록 로드 page={page} | {current_url}")
+            log(f"{tag} 목록 로드 page={page} | {current_url}")
             driver.get(current_url); rsleep()
 
-            links = fmk_collect_links_by_user_selector(driver)
-            if not links:
-                links = collect_links_fallback_regex(driver)
-            log(f"[FMK] 후보 링크 {len(links)}개")
+            if mobile:
+                links = fmk_parse_mobile_list_html(driver.page_source, driver.current_url)
+            else:
+                links = fmk_collect_links_by_user_selector(driver)
+                if not links:
+                    links = collect_links_fallback_regex(driver)
+            log(f"{tag} 후보 링크 {len(links)}개")
             if not links:
                 stale_pages += 1
                 if stale_pages >= STALE_PAGE_LIMIT:
-                    log("[FMK] 링크 없음/오래된 페이지 연속 → 종료")
+                    log(f"{tag} 링크 없음/오래된 페이지 연속 → 종료")
                     break
                 page += 1
                 continue
@@ -265,37 +476,81 @@ def crawl_fmkorea(list_url, cutoff, show_browser, log):
 
             found_older_post = False
             for href in links:
-                title_text, date_text, views = fmk_get_content(href, driver); rsleep()
-                post_time = parse_dt_dot(date_text)
+                if _stopped(control, log, tag):
+                    return
+                post = fmk_get_post(href, driver, mobile); rsleep()
+                post_time = post.pop("_dt")
                 if not post_time:
-                    log(f"[FMK] 날짜 파싱 실패 → 건너뜀: {date_text} | {href}")
+                    log(f"{tag} 날짜 파싱 실패 → 건너뜀: {post['Date']} | {post['Link']}")
                     continue
-                rows.append({
-                    "Site": "FMKorea",
-                    "Title": title_text,
-                    "Date": date_text,
-                    "DateISO": post_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "Views": views,
-                    "Link": href
-                })
+                yield post
                 if post_time < cutoff:
                     found_older_post = True
             if found_older_post:
-                log("[FMK] 오래된 글 감지 → 이 페이지 전부 수집 후 종료")
+                log(f"{tag} 오래된 글 감지 → 이 페이지 전부 수집 후 종료")
                 break
             page += 1
     finally:
-        driver.quit()
-    return rows
+        quit_driver(driver)
 
 # ---------- DCInside ----------
-def crawl_dcinside(list_url, cutoff, show_browser, log):
-    rows = []
-    driver = initialize_driver(show_browser)
+def dc_parse_date(title_attr: str, cell_text: str):
+    """
+    목록 td.gall_date → (datetime|None, 표시용 문자열).
+    title 속성(전체 시각)이 우선, 없으면 셀 텍스트(HH:MM / MM.DD).
+    """
+    title_attr = (title_attr or "").strip()
+    cell_text = (cell_text or "").strip()
+    if title_attr:
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
+            try:
+                return datetime.strptime(title_attr, fmt), title_attr
+            except ValueError:
+                continue
+    now = datetime.now()
+    m = re.match(r"^(\d{1,2}):(\d{2})$", cell_text)
+    if m:
+        h, mi = map(int, m.groups())
+        try:
+            dt = datetime(now.year, now.month, now.day, h, mi)
+        except ValueError:
+            return None, title_attr or cell_text
+        return dt, title_attr or f"{now.year}-{now.month:02d}-{now.day:02d} {h:02d}:{mi:02d}"
+    m = re.match(r"^(\d{2})\.(\d{2})$", cell_text)
+    if m:
+        M, d2 = map(int, m.groups())
+        try:
+            dt = datetime(now.year, M, d2, 0, 0)
+        except ValueError:
+            return None, title_attr or cell_text
+        return dt, title_attr or f"{now.year}-{M:02d}-{d2:02d} 00:00"
+    return None, title_attr or cell_text
+
+def _dc_row(title, date_text, dt, views, href):
+    return {
+        "Site": "DCInside",
+        "Title": title or "제목 없음",
+        "Date": date_text,
+        "DateISO": dt.strftime("%Y-%m-%d %H:%M:%S") if dt else "",
+        "Views": views,
+        "Link": href,
+        "_dt": dt,
+    }
+
+def iter_dcinside(list_url, cutoff, show_browser, log, mobile=False, control=None):
+    if mobile:
+        log(f"[DC/M] cutoff = {cutoff:%Y-%m-%d %H:%M:%S} | 모바일 목록: {dc_to_mobile_url(list_url)}")
+        pages = _dc_mobile_driver_pages(list_url, show_browser, log, control)
+        yield from _dc_consume_pages(pages, cutoff, log, "[DC/M]", control)
+        return
+    driver = initialize_driver(show_browser, log=log, control=control)
     log(f"[DC] cutoff = {cutoff:%Y-%m-%d %H:%M:%S}")
     try:
         stale_pages = 0
         for page in range(1, MAX_PAGES_SOFT + 1):
+            if _stopped(control, log, "[DC]"):
+                break
+            driver = recycle_if_bloated(driver, show_browser, log, control=control)
             url = add_or_replace_query_param(list_url, "page", page)
             log(f"[DC] 목록 page={page} | {url}")
             driver.get(url); rsleep()
@@ -314,30 +569,7 @@ def crawl_dcinside(list_url, cutoff, show_browser, log):
             if page >= 2:
                 try:
                     d0 = trs[0].find_element(By.CSS_SELECTOR, "td.gall_date")
-                    title_attr = (d0.get_attribute("title") or "").strip()
-                    cell_text = (d0.text or "").strip()
-                    first_txt = title_attr or cell_text
-                    first_dt = None
-                    if title_attr:
-                        try:
-                            first_dt = datetime.strptime(title_attr, "%Y-%m-%d %H:%M:%S")
-                        except ValueError:
-                            try:
-                                first_dt = datetime.strptime(title_attr, "%Y-%m-%d %H:%M")
-                            except ValueError:
-                                first_dt = None
-                    if first_dt is None and cell_text:
-                        m = re.match(r"^(\d{1,2}):(\d{2})$", cell_text)
-                        if m:
-                            h, mi = map(int, m.groups())
-                            now = datetime.now()
-                            first_dt = datetime(now.year, now.month, now.day, h, mi)
-                        else:
-                            m = re.match(r"^(\d{2})\.(\d{2})$", cell_text)
-                            if m:
-                                M, d2 = map(int, m.groups())
-                                now = datetime.now()
-                                first_dt = datetime(now.year, M, d2, 0, 0)
+                    first_dt, first_txt = dc_parse_date(d0.get_attribute("title"), d0.text)
                     if first_dt and first_dt < cutoff:
                         log(f"[DC] page={page} 첫 글 {first_txt} < cutoff → 종료")
                         break
@@ -352,47 +584,15 @@ def crawl_dcinside(list_url, cutoff, show_browser, log):
                     title = a.text.strip() or (a.get_attribute("title") or "").strip()
 
                     d = tr.find_element(By.CSS_SELECTOR, "td.gall_date")
-                    title_attr = (d.get_attribute("title") or "").strip()
-                    cell_text = (d.text or "").strip()
-
-                    dt = None
-                    date_text = ""
-                    if title_attr:
-                        try:
-                            dt = datetime.strptime(title_attr, "%Y-%m-%d %H:%M:%S")
-                        except ValueError:
-                            try:
-                                dt = datetime.strptime(title_attr, "%Y-%m-%d %H:%M")
-                            except ValueError:
-                                dt = None
-                        date_text = title_attr
-                    else:
-                        m = re.match(r"^(\d{1,2}):(\d{2})$", cell_text)
-                        if m:
-                            h, mi = map(int, m.groups())
-                            now = datetime.now()
-                            dt = datetime(now.year, now.month, now.day, h, mi)
-                            date_text = f"{now.year}-{now.month:02d}-{now.day:02d} {h:02d}:{mi:02d}"
-                        else:
-                            m = re.match(r"^(\d{2})\.(\d{2})$", cell_text)
-                            if m:
-                                M, d2 = map(int, m.groups())
-                                now = datetime.now()
-                                dt = datetime(now.year, M, d2, 0, 0)
-                                date_text = f"{now.year}-{M:02d}-{d2:02d} 00:00"
+                    dt, date_text = dc_parse_date(d.get_attribute("title"), d.text)
 
                     v = tr.find_element(By.CSS_SELECTOR, "td.gall_count")
                     views = to_int_or_none(v.text)
 
                     if dt and dt >= cutoff:
-                        rows.append({
-                            "Site": "DCInside",
-                            "Title": title or "제목 없음",
-                            "Date": date_text or (title_attr or cell_text),
-                            "DateISO": dt.strftime("%Y-%m-%d %H:%M:%S"),
-                            "Views": views,
-                            "Link": href,
-                        })
+                        if _stopped(control, log, "[DC]"):
+                            return
+                        yield public_row(_dc_row(title, date_text, dt, views, href))
                         found_recent = True
                 except Exception as e:
                     log(f"[DC] 행 파싱 실패: {e}")
@@ -405,8 +605,169 @@ def crawl_dcinside(list_url, cutoff, show_browser, log):
             else:
                 stale_pages = 0
     finally:
-        driver.quit()
-    return rows
+        quit_driver(driver)
+
+def dc_parse_list_html(html: str, base_url: str):
+    """목록 HTML → 글 목록(페이지 순서, _dt 포함). Selenium 경로와 같은 셀렉터."""
+    doc = _parse_html(html)
+    posts = []
+    for tr in doc.xpath(f"//tr[{_xcls('ub-content')} and {_xcls('us-post')}]"):
+        a = tr.xpath(f".//td[{_xcls('gall_tit')}]//a[@href]")
+        d = tr.xpath(f".//td[{_xcls('gall_date')}]")
+        if not a or not d:
+            continue
+        v = tr.xpath(f".//td[{_xcls('gall_count')}]")
+        title = _xtext(a[0]) or (a[0].get("title") or "").strip()
+        dt, date_text = dc_parse_date(d[0].get("title"), _xtext(d[0]))
+        views = to_int_or_none(_xtext(v[0])) if v else None
+        posts.append(_dc_row(title, date_text, dt, views, urljoin(base_url, a[0].get("href"))))
+    return posts
+
+# DCInside 모바일(m.dcinside.com): 목록 한 장에 제목/시각/조회수가 다 있고 훨씬 가벼움
+def dc_gallery_of(url: str):
+    """목록/상세 URL → (갤러리 종류 'board'|'mgallery'|'mini', 갤러리 id)"""
+    u = urlparse(url)
+    if u.netloc.lower().startswith("m."):
+        parts = [p for p in u.path.split("/") if p]
+        kind = "mini" if parts and parts[0] == "mini" else "board"
+        return kind, parts[1] if len(parts) > 1 else ""
+    kind = "mgallery" if "/mgallery/" in u.path else "mini" if "/mini/" in u.path else "board"
+    return kind, (parse_qs(u.query).get("id") or [""])[0]
+
+def dc_to_mobile_url(list_url: str) -> str:
+    kind, gid = dc_gallery_of(list_url)
+    url = f"https://m.dcinside.com/{'mini' if kind == 'mini' else 'board'}/{gid}"
+    q = parse_qs(urlparse(list_url).query)
+    if (q.get("exception_mode") or [""])[0] == "recommend":  # 개념글
+        url = add_or_replace_query_param(url, "recommend", 1)
+    return url
+
+def dc_to_desktop_link(mobile_href: str, kind: str = "board") -> str:
+    """m.dcinside.com/board/<id>/<no> → gall.dcinside.com/[mgallery/|mini/]board/view/?id=<id>&no=<no>"""
+    parts = [p for p in urlparse(mobile_href).path.split("/") if p]
+    if len(parts) >= 3 and parts[2].isdigit():
+        prefix = {"mgallery": "mgallery/", "mini": "mini/"}.get(kind, "")
+        return f"https://gall.dcinside.com/{prefix}board/view/?id={parts[1]}&no={parts[2]}"
+    return mobile_href
+
+_DC_M_DATE_RE = re.compile(r"^(\d{1,2}:\d{2}|\d{2}\.\d{2}|\d{2}\.\d{2}\.\d{2})$")
+
+def dc_parse_mobile_list_html(html: str, base_url: str, kind: str = "board"):
+    """모바일 목록 HTML → 글 목록(_dt 포함, Link는 데스크톱 정규 링크). 공지/광고 제외."""
+    doc = _parse_html(html)
+    posts = []
+    for li in doc.xpath(f"//ul[{_xcls('gall-detail-lst')}]/li"):
+        a = li.xpath(f".//a[{_xcls('lt')} and @href]")
+        if not a or li.xpath(f".//*[{_xcls('sp-lst-notice')}]"):
+            continue
+        href = urljoin(base_url, a[0].get("href"))
+        if not re.search(r"/\d+(?:\?|$)", href):
+            continue
+        t = a[0].xpath(f".//*[{_xcls('subjectin')}]")
+        title = _xtext(t[0]) if t else _xtext(a[0])
+        dt, date_text, views = None, "", None
+        for info in a[0].xpath(f".//ul[{_xcls('ginfo')}]/li"):
+            txt = _xtext(info)
+            if txt == "공지":
+                dt = False
+                break
+            if _DC_M_DATE_RE.match(txt):
+                date_text = txt
+                dt = parse_dt_theqoo(txt)  # HH:MM / MM.DD / YY.MM.DD 형식이 같음
+            elif txt.startswith("조회"):
+                views = to_int_or_none(txt)
+        if dt is False:
+            continue
+        if dt:
+            date_text = dt.strftime("%Y-%m-%d %H:%M")
+        posts.append(_dc_row(title, date_text, dt, views, dc_to_desktop_link(href, kind)))
+    return posts
+
+def _dc_consume_pages(pages, cutoff, log, tag, control=None):
+    """
+    (page, posts|예외) 스트림 → cutoff 이후 행. 목록만으로 충분한 경로(HTTP/모바일) 공용.
+    종료 조건은 브라우저 경로와 같다(2페이지 이후 첫 글이 cutoff 이전 / 최근 글 없는 페이지 연속).
+    """
+    stale_pages = 0
+    try:
+        if _stopped(control, log, tag):
+            return
+        for page, posts in pages:
+            if isinstance(posts, Exception):
+                log(f"{tag} page={page} 로드 실패: {posts}")
+                posts = []
+            log(f"{tag} 목록 page={page} | 행 {len(posts)}")
+            if page >= 2 and posts and posts[0]["_dt"] and posts[0]["_dt"] < cutoff:
+                log(f"{tag} page={page} 첫 글 {posts[0]['Date']} < cutoff → 종료")
+                break
+            recent = [p for p in posts if p["_dt"] and p["_dt"] >= cutoff]
+            for p in recent:
+                if _stopped(control, log, tag):
+                    return
+                yield public_row(p)
+            if recent:
+                stale_pages = 0
+                if _stopped(control, log, tag):
+                    break
+                continue
+            stale_pages += 1
+            if stale_pages >= STALE_PAGE_LIMIT:
+                log(f"{tag} 최근 글 없음 연속 → 종료")
+                break
+            if _stopped(control, log, tag):
+                break
+    finally:
+        pages.close()
+
+def _dc_mobile_driver_pages(list_url, show_browser, log, control=None):
+    """브라우저(모바일 UA)로 모바일 목록을 차례로 읽어 (page, posts)로 내보냄"""
+    kind, _ = dc_gallery_of(list_url)
+    m_url = dc_to_mobile_url(list_url)
+    driver = initialize_driver(show_browser, mobile=True, log=log, control=control)
+    try:
+        for page in range(1, MAX_PAGES_SOFT + 1):
+            if control is not None and control.should_stop():
+                break
+            driver = recycle_if_bloated(driver, show_browser, log, True, control)
+            driver.get(add_or_replace_query_param(m_url, "page", page)); rsleep()
+            try:
+                posts = dc_parse_mobile_list_html(driver.page_source, driver.current_url, kind)
+            except Exception as e:
+                posts = e
+            yield page, posts
+    finally:
+        quit_driver(driver)
+
+def iter_dcinside_http(list_url, cutoff, log, speculative=SPECULATIVE_PAGES, concurrency=HOST_CONCURRENCY,
+                       mobile=False, control=None):
+    """
+    브라우저 없이 목록 HTML만으로 수집(DC 목록에 제목/시각/조회수가 모두 있음).
+    다음 K 페이지를 미리 받아두고, cutoff 이전 글이 보이면 남은 요청은 취소.
+    mobile=True면 m.dcinside.com 목록을 받는다(Link는 데스크톱 정규 링크).
+    """
+    tag = "[DC/HTTP/M]" if mobile else "[DC/HTTP]"
+    log(f"{tag} cutoff = {cutoff:%Y-%m-%d %H:%M:%S} | 추측 {speculative}페이지, 동시 {concurrency}")
+
+    if mobile:
+        kind, _ = dc_gallery_of(list_url)
+        base_url = dc_to_mobile_url(list_url)
+        parse = partial(dc_parse_mobile_list_html, kind=kind)
+        headers = {"User-Agent": MOBILE_UA}
+    else:
+        base_url, parse, headers = list_url, dc_parse_list_html, None
+
+    def _older(posts):
+        return any(p["_dt"] and p["_dt"] < cutoff for p in posts)
+
+    async def _pages():
+        async with FetchScheduler(speculative, concurrency, headers=headers) as s:
+            async for item in s.iter_pages(
+                lambda p: add_or_replace_query_param(base_url, "page", p),
+                parse, stop_when=_older, last_page=MAX_PAGES_SOFT,
+            ):
+                yield item
+
+    yield from _dc_consume_pages(run_async_iter(_pages()), cutoff, log, tag, control)
 
 # ---------- TheQoo ----------
 _DOT_FULL_RE = re.compile(r"^(\d{4})\.(\d{2})\.(\d{2})\s+(\d{2}):(\d{2})$")
@@ -508,6 +869,9 @@ def theqoo_parse_detail(driver, url):
         all_nums = re.findall(r"\d{1,3}(?:,\d{3})*|\d+", driver.page_source)
         if all_nums:
             views = max((to_int_or_none(n) for n in all_nums), default=None)
+    return _theqoo_row(title, date_text, views, url)
+
+def _theqoo_row(title, date_text, views, url):
     dt = parse_dt_dot(date_text) or parse_dt_theqoo(date_text)
     return {
         "Site": "TheQoo",
@@ -519,13 +883,16 @@ def theqoo_parse_detail(driver, url):
         "_dt": dt
     }
 
-def crawl_theqoo(list_url, cutoff, show_browser, log):
-    rows = []
-    driver = initialize_driver(show_browser)
+def iter_theqoo(list_url, cutoff, show_browser, log, control=None):
+    count = 0
+    driver = initialize_driver(show_browser, log=log, control=control)
     try:
         page = 1
         stale_pages = 0
         while page <= MAX_PAGES_SOFT:
+            if _stopped(control, log, "[TQ]"):
+                break
+            driver = recycle_if_bloated(driver, show_browser, log, control=control)
             page_url = add_or_replace_query_param(list_url, "page", page)
             log(f"[TQ] 목록 로드: page={page} | {page_url}")
             driver.get(page_url); rsleep()
@@ -542,21 +909,17 @@ def crawl_theqoo(list_url, cutoff, show_browser, log):
                 stale_pages = 0
             found_older = False
             for i, href in enumerate(links, 1):
+                if _stopped(control, log, "[TQ]"):
+                    return
                 try:
                     post = theqoo_parse_detail(driver, href); rsleep()
                     dt = post["_dt"]
-                    rows.append({
-                        "Site": post["Site"],
-                        "Title": post["Title"],
-                        "Date": post["Date"],
-                        "DateISO": post["DateISO"],
-                        "Views": post["Views"],
-                        "Link": post["Link"]
-                    })
+                    yield public_row(post)
+                    count += 1
                     if dt and dt < cutoff:
                         found_older = True
                     if i % 10 == 0 or i == len(links):
-                        log(f"[TQ] 진행 {i}/{len(links)} (누적 {len(rows)})")
+                        log(f"[TQ] 진행 {i}/{len(links)} (누적 {count})")
                 except Exception as e:
                     log(f"[TQ] 상세 파싱 실패: {e}")
             if found_older:
@@ -564,5 +927,498 @@ def crawl_theqoo(list_url, cutoff, show_browser, log):
                 break
             page += 1
     finally:
-        driver.quit()
-    return rows
\ No newline at end of file
+        quit_driver(driver)
+
+# TheQoo HTTP 모드: 목록은 추측 병렬, 상세는 호스트별 동시 로드
+_TQ_TITLE_XPATHS = [
+    f"//h1[{_xcls('title')}]", f"//*[{_xcls('title')}]//h1", f"//*[{_xcls('title')}]", "//h1", "//h2",
+]
+_TQ_DATE_XPATHS = [
+    f"//*[{_xcls('side')} and {_xcls('fr')}]//span", f"//*[{_xcls('date')}]",
+    f"//*[{_xcls('regdate')}]", f"//*[{_xcls('time')}]", "//time[@datetime]",
+]
+
+def theqoo_parse_list_html(html: str, base_url: str):
+    """목록 HTML → [{"Link", "_dt", "Views"}] (공지 제외). _dt/Views는 목록의 시각/조회 칸(있으면)."""
+    doc = _parse_html(html)
+    items, seen = [], set()
+    for td in doc.xpath(f"//td[{_xcls('title')}]"):
+        tr = next(td.iterancestors("tr"), None)
+        if tr is None:
+            continue
+        no = tr.xpath(f".//td[{_xcls('no')}]//strong")
+        if no and "공지" in _xtext(no[0]):
+            continue
+        a = td.xpath(f".//a[@href and not({_xcls('replyNum')})]")
+        if not a:
+            continue
+        href = urljoin(base_url, a[0].get("href"))
+        if href in seen:
+            continue
+        seen.add(href)
+        t = tr.xpath(f".//td[{_xcls('time')}]")
+        v = tr.xpath(f".//td[{_xcls('m_no')}]")
+        items.append({"Link": href, "_dt": parse_dt_theqoo(_xtext(t[0])) if t else None,
+                      "Views": to_int_or_none(_xtext(v[-1])) if v else None})
+    return items
+
+def theqoo_parse_detail_html(html: str, url: str):
+    """상세 HTML → 행(theqoo_parse_detail과 같은 규칙)"""
+    doc = _parse_html(html)
+    title = ""
+    for xp in _TQ_TITLE_XPATHS:
+        els = doc.xpath(xp)
+        if els and _xtext(els[0]):
+            title = _xtext(els[0])
+            break
+    date_text = ""
+    for xp in _TQ_DATE_XPATHS:
+        els = doc.xpath(xp)
+        if els:
+            t = (els[0].get("datetime") or _xtext(els[0])).strip()
+            if t:
+                date_text = t
+                break
+    if not date_text:
+        m = re.search(r"\d{4}\.\d{2}\.\d{2}\s+\d{2}:\d{2}", html)
+        if m:
+            date_text = m.group(0)
+    views = None
+    cnt = doc.xpath(f"//*[{_xcls('count_container')}]")
+    if cnt:
+        nums = re.findall(r"\d{1,3}(?:,\d{3})*|\d+", _xtext(cnt[0]))
+        if nums:
+            views = to_int_or_none(nums[0])
+    if views is None:
+        all_nums = re.findall(r"\d{1,3}(?:,\d{3})*|\d+", html)
+        if all_nums:
+            views = max((to_int_or_none(n) for n in all_nums), default=None)
+    return _theqoo_row(title or "제목 없음", date_text, views, url)
+
+def iter_theqoo_http(list_url, cutoff, log, speculative=SPECULATIVE_PAGES, concurrency=HOST_CONCURRENCY,
+                     control=None):
+    log(f"[TQ/HTTP] 추측 {speculative}페이지, 동시 {concurrency}")
+
+    def _older(items):
+        return any(it["_dt"] and it["_dt"] < cutoff for it in items)
+
+    async def _pages():
+        async with FetchScheduler(speculative, concurrency) as s:
+            pages = s.iter_pages(
+                lambda p: add_or_replace_query_param(list_url, "page", p),
+                theqoo_parse_list_html, stop_when=_older, last_page=MAX_PAGES_SOFT,
+            )
+            try:
+                async for page, items in pages:
+                    if isinstance(items, Exception):
+                        yield page, items, []
+                        continue
+                    # 다음 페이지들의 추측 로드는 그동안 계속 진행됨
+                    links = [it["Link"] for it in items]
+                    got = {}
+                    async for url, post in s.iter_details(links, theqoo_parse_detail_html):
+                        got[url] = post
+                    yield page, items, [got[u] for u in links]
+            finally:
+                await pages.aclose()
+
+    count = 0
+    stale_pages = 0
+    if _stopped(control, log, "[TQ/HTTP]"):
+        return
+    pages = run_async_iter(_pages())
+    try:
+        for page, items, posts in pages:
+            if isinstance(items, Exception):
+                log(f"[TQ/HTTP] page={page} 로드 실패: {items}")
+                items = []
+            log(f"[TQ/HTTP] page={page} 상세 후보(공지 제외) {len(items)}개")
+            if not items:
+                stale_pages += 1
+                if stale_pages >= STALE_PAGE_LIMIT:
+                    log("[TQ/HTTP] 링크 없음/오래된 페이지 연속 → 종료")
+                    break
+                continue
+            stale_pages = 0
+            found_older = _older(items)
+            for post in posts:
+                if isinstance(post, Exception):
+                    log(f"[TQ/HTTP] 상세 파싱 실패: {post}")
+                    continue
+                if _stopped(control, log, "[TQ/HTTP]"):
+                    return
+                yield public_row(post)
+                count += 1
+                if post["_dt"] and post["_dt"] < cutoff:
+                    found_older = True
+            log(f"[TQ/HTTP] 진행 page={page} (누적 {count})")
+            if found_older:
+                log("[TQ/HTTP] 오래된 글 감지 → 이 페이지 전부 수집 후 종료")
+                break
+            if _stopped(control, log, "[TQ/HTTP]"):
+                break
+    finally:
+        pages.close()
+
+# ---------- 스트리밍 API ----------
+# iter_*: 행을 파싱 즉시 내보냄 / crawl_*: 기존처럼 끝에 리스트 하나로 반환
+def crawl_fmkorea(list_url, cutoff, show_browser, log, mobile=False):
+    return list(iter_fmkorea(list_url, cutoff, show_browser, log, mobile=mobile))
+
+def crawl_dcinside(list_url, cutoff, show_browser, log, mobile=False):
+    return list(iter_dcinside(list_url, cutoff, show_browser, log, mobile=mobile))
+
+def crawl_theqoo(list_url, cutoff, show_browser, log):
+    return list(iter_theqoo(list_url, cutoff, show_browser, log))
+
+def crawl_dcinside_http(list_url, cutoff, log, **kw):
+    return list(iter_dcinside_http(list_url, cutoff, log, **kw))
+
+def crawl_theqoo_http(list_url, cutoff, log, **kw):
+    return list(iter_theqoo_http(list_url, cutoff, log, **kw))
+
+def iter_community(comm, list_url, cutoff, show_browser, log, use_http=False, mobile=False, control=None):
+    """
+    커뮤니티 이름으로 알맞은 제너레이터 선택. 지원하지 않으면 ValueError.
+    mobile은 DCInside/FMKorea에만 적용(TheQoo는 데스크톱 페이지 그대로).
+    control(CrawlControl)을 주면 내보낸 글 수를 세고 예산/중지 요청을 크롤러에 전달한다.
+    """
+    if comm == "DCInside":
+        if use_http:
+            stream = iter_dcinside_http(list_url, cutoff, log, mobile=mobile, control=control)
+        else:
+            stream = iter_dcinside(list_url, cutoff, show_browser, log, mobile=mobile, control=control)
+    elif comm == "TheQoo":
+        if use_http:
+            stream = iter_theqoo_http(list_url, cutoff, log, control=control)
+        else:
+            stream = iter_theqoo(list_url, cutoff, show_browser, log, control=control)
+    elif comm == "FMKorea":
+        stream = iter_fmkorea(list_url, cutoff, show_browser, log, mobile=mobile, control=control)
+    else:
+        raise ValueError("지원하지 않는 커뮤니티입니다.")
+    return stream if control is None else _counted(stream, control)
+
+def _counted(stream, control):
+    try:
+        for r in stream:
+            control.posts += 1
+            yield r
+    finally:
+        stream.close()
+
+BATCH_JOIN_TIMEOUT = 1.0   # 소비 쪽이 먼저 그만둘 때 크롤 스레드 정리를 기다리는 최대 시간(초) — 나머지는 그 스레드가 스스로 정리
+
+def iter_batches(rows, size=20, max_wait=1.0, control=None):
+    """
+    행 스트림 → 리스트 묶음. size개가 차거나, 묶음의 첫 행이 들어온 뒤 max_wait초가 지나면 내보낸다
+    (다음 행을 기다리지 않음 — 행 스트림은 별도 스레드에서 돌리고 크기 제한 큐로 받는다).
+    첫 행은 곧바로 내보내 첫 결과가 바로 보이도록 한다.
+    소비 쪽이 중간에 그만두면(저장 오류 등) control(CrawlControl)을 취소해 크롤러가 다음 확인 지점에서 멈추게 하고,
+    스트림은 그 스레드에서 닫힌다(정리는 BATCH_JOIN_TIMEOUT초까지만 기다림).
+    """
+    q = queue.Queue(maxsize=size * 8)
+    quit_ = threading.Event()
+
+    def _put(item) -> bool:
+        while not quit_.is_set():
+            try:
+                q.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        try:
+            for r in rows:
+                if not _put(("row", r)):
+                    break
+        except BaseException as e:
+            _put(("err", e))
+        finally:
+            close = getattr(rows, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
+            _put(("end", None))
+
+    producer = threading.Thread(target=_produce, name="crawl-stream", daemon=True)
+    producer.start()
+    batch, deadline, first, ended = [], None, True, False
+    try:
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                kind, val = q.get(timeout=timeout)
+            except queue.Empty:   # 시간 초과 — 모인 만큼 내보냄
+                yield batch
+                batch, deadline = [], None
+                continue
+            if kind == "end":
+                ended = True
+                break
+            if kind == "err":
+                ended = True
+                raise val
+            batch.append(val)
+            if first or len(batch) >= size:
+                yield batch
+                batch, deadline, first = [], None, False
+            elif deadline is None:
+                deadline = time.monotonic() + max_wait
+        if batch:
+            yield batch
+    finally:
+        quit_.set()
+        if not ended and control is not None:
+            control.cancel("결과 처리 중단")
+        producer.join(BATCH_JOIN_TIMEOUT)
+
+EXPORT_COLUMNS = ["Site", "Title", "Date", "Views", "Link"]
+
+class XlsxStreamWriter:
+    """openpyxl write_only 모드로 행을 흘려 쓰는 엑셀 저장기(행 수와 무관하게 메모리 일정)."""
+
+    def __init__(self, path, columns=EXPORT_COLUMNS):
+        from openpyxl import Workbook
+        self.path = path
+        self.columns = list(columns)
+        self.count = 0
+        self._wb = Workbook(write_only=True)
+        self._ws = self._wb.create_sheet("Sheet1")
+        self._ws.append(self.columns)
+
+    def write_rows(self, rows):
+        for r in rows:
+            self._ws.append([r.get(c) for c in self.columns])
+            self.count += 1
+
+    def add_sheet(self, name, columns, rows):
+        """본문 뒤에 시트 추가(분석 결과 등)"""
+        ws = self._wb.create_sheet(name)
+        ws.append(list(columns))
+        for r in rows:
+            ws.append(list(r))
+
+    def save(self):
+        ensure_dir_for_file(self.path)
+        self._wb.save(self.path)
+
+# ---------- 모니터 모드: 세션 하나로 목록 1페이지만 반복 확인 ----------
+# 간격은 글 올라오는 속도에 맞춰 MIN~MAX 사이에서 조절. 환경변수로 조절:
+# CRAWL_MONITOR_MIN_SEC=20, CRAWL_MONITOR_MAX_SEC=600, CRAWL_MONITOR_VIEWS_SEC=600(조회수 기록 주기)
+MONITOR_MIN_INTERVAL = float(os.environ.get("CRAWL_MONITOR_MIN_SEC", "20"))
+MONITOR_MAX_INTERVAL = float(os.environ.get("CRAWL_MONITOR_MAX_SEC", "600"))
+MONITOR_VIEWS_INTERVAL = float(os.environ.get("CRAWL_MONITOR_VIEWS_SEC", "600"))
+MONITOR_SEEN_MAX = 5000
+
+def post_key(link: str) -> str:
+    """같은 글이면 같은 키(목록 링크에 붙는 page 등 부가 파라미터는 무시)"""
+    u = urlparse(link or "")
+    q = parse_qs(u.query)
+    keep = [f"{k}={q[k][0]}" for k in ("id", "no", "document_srl") if q.get(k)]
+    key = u.netloc.lower().removeprefix("m.").removeprefix("www.") + u.path.rstrip("/")
+    return key + ("?" + "&".join(keep) if keep else "")
+
+class MonitorSession:
+    """
+    모니터 모드가 목록/상세를 읽는 통로. 브라우저 하나(또는 HTTP 클라이언트 하나)를 끝까지 유지.
+    list_page(n) → 목록 항목(DC는 목록만으로 완성된 행, 더쿠/FMK는 Link(+_dt/Views)만)
+    detail(item) → 완성된 행(_dt 포함)
+    """
+
+    def __init__(self, comm, list_url, show_browser, log, use_http=False, mobile=False, control=None):
+        if comm not in ("DCInside", "TheQoo", "FMKorea"):
+            raise ValueError("지원하지 않는 커뮤니티입니다.")
+        self.comm, self.log, self.control, self.show_browser = comm, log, control, show_browser
+        self.mobile = mobile and comm in ("DCInside", "FMKorea")
+        self.use_http = use_http and comm in ("DCInside", "TheQoo") and http_mode_available()
+        if use_http and not self.use_http:
+            log(f"[MON/{comm}] HTTP 모드를 쓸 수 없어 브라우저로 확인합니다.")
+        self.kind = dc_gallery_of(list_url)[0] if comm == "DCInside" else None
+        if comm == "DCInside" and self.mobile:
+            list_url = dc_to_mobile_url(list_url)
+        elif comm == "FMKorea" and self.mobile:
+            list_url = fmk_to_mobile_url(list_url)
+        self.list_url = list_url
+        self.driver = self._client = None
+        if self.use_http:
+            headers = dict(HTTP_HEADERS, **({"User-Agent": MOBILE_UA} if self.mobile else {}))
+            self._client = httpx.Client(headers=headers, timeout=15.0, follow_redirects=True)
+        else:
+            self.driver = initialize_driver(show_browser, mobile=self.mobile, log=log, control=control)
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+        quit_driver(self.driver)
+        self.driver = self._client = None
+
+    def _get(self, url):
+        """(html, 최종 URL)"""
+        if self._client is not None:
+            r = self._client.get(url)
+            r.raise_for_status()
+            return r.text, str(r.url)
+        self.driver = recycle_if_bloated(self.driver, self.show_browser, self.log, self.mobile, self.control)
+        self.driver.get(url); rsleep()
+        return self.driver.page_source, self.driver.current_url
+
+    def list_page(self, page):
+        html, base = self._get(add_or_replace_query_param(self.list_url, "page", page))
+        if self.comm == "DCInside":
+            if self.mobile:
+                return dc_parse_mobile_list_html(html, base, self.kind)
+            return dc_parse_list_html(html, base)
+        if self.comm == "TheQoo":
+            return theqoo_parse_list_html(html, base)
+        if self.mobile:
+            links = fmk_parse_mobile_list_html(html, base)
+        else:
+            links = fmk_collect_links_by_user_selector(self.driver) or collect_links_fallback_regex(self.driver)
+        return [{"Link": l} for l in links]
+
+    def detail(self, item):
+        if "Title" in item:   # 목록만으로 완성된 행(DC)
+            return item
+        if self.comm == "TheQoo":
+            if self._client is not None:
+                post = theqoo_parse_detail_html(self._get(item["Link"])[0], item["Link"])
+            else:
+                post = theqoo_parse_detail(self.driver, item["Link"])
+        else:
+            post = fmk_get_post(item["Link"], self.driver, self.mobile)
+        rsleep()
+        return post
+
+def iter_monitor(comm, list_url, show_browser, log, use_http=False, mobile=False, control=None,
+                 min_interval=MONITOR_MIN_INTERVAL, max_interval=MONITOR_MAX_INTERVAL,
+                 views_interval=MONITOR_VIEWS_INTERVAL):
+    """
+    control로 멈출 때까지 목록 1페이지를 반복 확인하며 이벤트를 내보냄.
+      ("new", [행...])            : 처음 보는 글(상세는 새 글만)
+      ("views", [{"Link", "Views", "At"}...]) : views_interval마다 목록에서 읽은 조회수 변화
+      ("poll", {"interval", "new", "pages"})  : 한 번 확인할 때마다(상태 표시용)
+    1페이지가 전부 새 글이면(그 사이 한 바퀴 넘어감) 2페이지까지 본다.
+    간격: 한 번 확인에 새 글이 목록의 1/3 정도 쌓이도록 게시 속도로 맞추고, 새 글이 없으면 1.5배씩 늘림.
+    """
+    tag = f"[MON/{comm}]"
+    sess = MonitorSession(comm, list_url, show_browser, log, use_http, mobile, control)
+    seen = {}                      # post_key -> 마지막으로 기록한 조회수
+    pending_views = {}             # Link -> 조회수(다음 기록 때 내보냄)
+    interval = min_interval * 2
+    last_poll = last_views = time.monotonic()
+    rate = None                    # 초당 새 글(EWMA)
+    first = True
+    try:
+        while not _stopped(control, log, tag):
+            pages = 1
+            try:
+                items = sess.list_page(1)
+                if not first and items and all(post_key(it["Link"]) not in seen for it in items):
+                    log(f"{tag} 1페이지가 전부 새 글 → 2페이지도 확인")
+                    items += sess.list_page(2)
+                    pages = 2
+            except Exception as e:
+                log(f"{tag} 목록 로드 실패: {e}")
+                items = []
+
+            fresh, fresh_keys, rows = [], set(), []
+            for it in items:
+                k = post_key(it["Link"])
+                if k in seen:
+                    if it.get("Views") is not None and it["Views"] != seen[k]:
+                        pending_views[it["Link"]] = it["Views"]
+                        seen[k] = it["Views"]
+                elif k not in fresh_keys:
+                    fresh_keys.add(k)
+                    fresh.append(it)
+            for it in fresh:
+                if _stopped(control, log, tag):
+                    return
+                try:
+                    post = sess.detail(it)
+                except Exception as e:
+                    log(f"{tag} 상세 실패: {e} | {it['Link']}")
+                    continue
+                seen[post_key(it["Link"])] = post.get("Views")
+                rows.append(public_row(post))
+            while len(seen) > MONITOR_SEEN_MAX:
+                seen.pop(next(iter(seen)))
+            if rows:
+                if control is not None:
+                    control.posts += len(rows)
+                yield "new", rows
+
+            now = time.monotonic()
+            if pending_views and now - last_views >= views_interval:
+                at = ts()
+                yield "views", [{"Link": l, "Views": v, "At": at} for l, v in pending_views.items()]
+                pending_views, last_views = {}, now
+
+            # 간격 조절(첫 확인은 기준 — 속도 계산에서 제외)
+            if not first:
+                r = len(fresh) / max(now - last_poll, 1.0)
+                rate = r if rate is None else 0.7 * rate + 0.3 * r
+                if pages == 2:
+                    interval /= 2
+                elif not fresh:
+                    interval *= 1.5
+                elif rate > 0:
+                    interval = max(len(items), 1) / 3 / rate
+                interval = max(min_interval, min(max_interval, interval))
+            first, last_poll = False, now
+            yield "poll", {"interval": round(interval), "new": len(rows), "pages": pages}
+            if control is not None and control.wait(interval):
+                break
+            if control is None:
+                time.sleep(interval)
+    finally:
+        sess.close()
+
+class RollingCsvWriter:
+    """
+    모니터 모드 출력: 날짜마다 새 CSV(<이름>_YYYYMMDD.csv)에 행을 이어 씀(엑셀 호환 UTF-8 BOM).
+    매 묶음마다 flush — 중간에 꺼져도 그때까지는 남는다.
+    on_open(path)은 날짜 파일을 열 때마다 호출(워터마크 등).
+    """
+
+    def __init__(self, base_path, columns, on_open=None):
+        stem, _ = os.path.splitext(base_path)
+        self.stem = stem
+        self.columns = list(columns)
+        self.on_open = on_open
+        self.count = 0
+        self._day = self._f = self.path = None
+
+    def _file(self):
+        import csv
+        day = datetime.now().strftime("%Y%m%d")
+        if day != self._day:
+            self.close()
+            path = f"{self.stem}_{day}.csv"
+            ensure_dir_for_file(path)
+            new = not os.path.exists(path)
+            self._f = open(path, "a", encoding="utf-8-sig" if new else "utf-8", newline="")
+            self._w = csv.writer(self._f)
+            if new:
+                self._w.writerow(self.columns)
+            self._day, self.path = day, path
+            if self.on_open is not None:
+                self.on_open(path)
+        return self._w
+
+    def write_rows(self, rows):
+        w = self._file()
+        for r in rows:
+            w.writerow(["" if r.get(c) is None else r.get(c) for c in self.columns])
+            self.count += 1
+        self._f.flush()
+
+    def close(self):
+        if self._f is not None:
+            self._f.close()
+            self._f = None
@@ -0,0 +1,164 @@
+# fetch_scheduler.py
+"""
+asyncio 기반 HTTP 수집 스케줄러.
+- 목록 페이지: 다음 K 페이지를 미리(추측) 병렬 로드, 순서대로 소비
+- 상세 페이지: 호스트별 세마포어 아래에서 동시 로드
+- cutoff 이전 글이 보이면 대기 중인 추측 요청은 즉시 취소
+브라우저 없이 HTML을 받을 수 있는 사이트(DCInside/TheQoo)용.
+"""
+import os, asyncio, random
+from urllib.parse import urlparse
+
+try:
+    import httpx
+except ImportError:  # 선택 의존성 (requirements-app.txt)
+    httpx = None
+
+# 기본값(환경변수로 조절: CRAWL_SPECULATIVE_PAGES=5, CRAWL_HOST_CONCURRENCY=6)
+SPECULATIVE_PAGES = int(os.environ.get("CRAWL_SPECULATIVE_PAGES", "3"))
+HOST_CONCURRENCY = int(os.environ.get("CRAWL_HOST_CONCURRENCY", "4"))
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/128.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
+}
+
+
+def http_available() -> bool:
+    return httpx is not None
+
+
+class FetchScheduler:
+    """
+    사용법:
+        async with FetchScheduler(speculative=3, per_host=4) as s:
+            async for page, items in s.iter_pages(page_url, parse, stop_when):
+                ...
+    메모리/소켓 상한: 추측 창(K페이지) + 호스트당 per_host 연결.
+    원문 HTML은 파싱 직후 버리고 파싱 결과만 보관한다.
+    """
+
+    def __init__(self, speculative: int = SPECULATIVE_PAGES, per_host: int = HOST_CONCURRENCY,
+                 timeout: float = 15.0, headers: dict | None = None, jitter=(0.05, 0.25)):
+        if httpx is None:
+            raise RuntimeError("HTTP 병렬 모드에는 httpx가 필요합니다. 'pip install httpx lxml'을 실행하세요.")
+        self.speculative = max(1, int(speculative))
+        self.per_host = max(1, int(per_host))
+        self.timeout = timeout
+        self.headers = dict(HEADERS, **(headers or {}))
+        self.jitter = jitter
+        self._sems: dict[str, asyncio.Semaphore] = {}
+        self._client = None
+
+    async def __aenter__(self):
+        # 전체 연결 수 = 추측 창 + 상세 동시성 정도로 묶어둔다(K를 올려도 소켓 폭주 없음)
+        limits = httpx.Limits(
+            max_connections=self.per_host + self.speculative,
+            max_keepalive_connections=self.per_host,
+        )
+        self._client = httpx.AsyncClient(
+            headers=self.headers, timeout=self.timeout, limits=limits, follow_redirects=True
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _sem(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        sem = self._sems.get(host)
+        if sem is None:
+            sem = self._sems[host] = asyncio.Semaphore(self.per_host)
+        return sem
+
+    async def fetch_text(self, url: str) -> tuple[str, str]:
+        """(최종 URL, 본문). 호스트별 동시성 제한 + 경미한 jitter."""
+        async with self._sem(url):
+            if self.jitter:
+                await asyncio.sleep(random.uniform(*self.jitter))
+            r = await self._client.get(url)
+            r.raise_for_status()
+            return str(r.url), r.text
+
+    async def _fetch_parsed(self, url, parse):
+        final_url, html = await self.fetch_text(url)
+        return parse(html, final_url)
+
+    async def iter_pages(self, page_url, parse, stop_when=None, first_page: int = 1, last_page: int = 300):
+        """
+        page_url(page) -> URL, parse(html, base_url) -> items.
+        (page, items)를 페이지 순서대로 내보낸다. 실패한 페이지는 items 자리에 예외 객체.
+        stop_when(items)가 참이거나 소비자가 중단하면 남은 추측 요청을 취소한다.
+        """
+        pending: dict[int, asyncio.Task] = {}
+        next_page = first_page
+        try:
+            for page in range(first_page, last_page + 1):
+                # 추측 창 채우기: page .. page+K-1
+                while next_page <= last_page and next_page < page + self.speculative:
+                    pending[next_page] = asyncio.ensure_future(self._fetch_parsed(page_url(next_page), parse))
+                    next_page += 1
+                task = pending.pop(page)
+                try:
+                    items = await task
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    items = e
+                yield page, items
+                if stop_when and not isinstance(items, Exception) and stop_when(items):
+                    break
+        finally:
+            await _cancel_all(pending.values())
+
+    async def _fetch_detail(self, url, parse):
+        try:
+            return url, await self._fetch_parsed(url, parse)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return url, e
+
+    async def iter_details(self, urls, parse):
+        """
+        상세 페이지를 호스트별 세마포어 아래에서 동시에 로드.
+        완료 순서대로 (url, result|예외)를 내보낸다.
+        """
+        tasks = [asyncio.ensure_future(self._fetch_detail(u, parse)) for u in urls]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                yield await fut
+        finally:
+            await _cancel_all(tasks)
+
+
+async def _cancel_all(tasks):
+    tasks = list(tasks)
+    for t in tasks:
+        if not t.done():
+            t.cancel()
+    if tasks:  # 이미 끝난 작업의 예외도 여기서 회수
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def run_async_iter(agen):
+    """
+    비동기 제너레이터를 일반 제너레이터로 감싼다(QThread/동기 코드에서 사용).
+    소비자가 중간에 멈추면(close) 남은 요청까지 정리하고 루프를 닫는다.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                item = loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                break
+            yield item
+    finally:
+        try:
+            loop.run_until_complete(agen.aclose())
+        finally:
+            loop.close()
@@ -101,7 +101,8 @@ def save_license_to_disk(text: str):
         f.write(text)
 
 
-def watermark_excel(path: str, payload: Dict[str, Any] | None):
+def watermark_excel(path: str, payload: Dict[str, Any] | None, extra: Dict[str, Any] | None = None):
+    """숨김 _meta 시트에 라이선스 정보 기록. extra(실행 정보 등)는 그 아래 행에 이어서 기록."""
     if not payload:
         return
     try:
@@ -112,6 +113,22 @@ def watermark_excel(path: str, payload: Dict[str, Any] | None):
         ws["A1"], ws["B1"] = "user", payload.get("user", "")
         ws["A2"], ws["B2"] = "device", payload.get("dev", "") or machine_id()
         ws["A3"], ws["B3"] = "exp", payload.get("exp", "")
+        for i, (k, v) in enumerate((extra or {}).items(), start=4):
+            ws[f"A{i}"], ws[f"B{i}"] = k, "" if v is None else str(v)
         wb.save(path)
     except Exception as e:
         print("워터마크 실패:", e)
+
+
+def watermark_csv(path: str, payload: Dict[str, Any] | None, extra: Dict[str, Any] | None = None):
+    """CSV는 숨김 시트가 없으므로 옆 파일(<path>.meta.json)에 같은 라이선스 정보와 extra를 기록(덮어씀)."""
+    if not payload:
+        return
+    try:
+        meta = {"user": payload.get("user", ""), "device": payload.get("dev", "") or machine_id(),
+                "exp": payload.get("exp", "")}
+        meta.update({k: "" if v is None else str(v) for k, v in (extra or {}).items()})
+        with open(path + ".meta.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=1)
+    except Exception as e:
+        print("워터마크 실패:", e)
@@ -1,10 +1,21 @@
 # pytube_util.py
-import os, re, time, random
+import os, re, sys, json, time, heapq, base64, random, atexit, threading
+from functools import lru_cache
+from http.cookiejar import MozillaCookieJar
+from collections import OrderedDict
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import requests
+from requests.adapters import HTTPAdapter
 from yt_dlp import YoutubeDL
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+from yt_cache import META_CACHE, SEARCH_CACHE, CHANNEL_CACHE, STALE
+import transcript_store as ts
+from transcript_store import LEGACY_DIR
+import transcript_index as tix   # import하면 자막 저장 때마다 검색 색인도 갱신
+import yt_procpool
+import adaptive_limit as al
 
 # --- 검색/상세 추출 옵션(빠르고 안정적으로) ---
 YDL_SEARCH = {
@@ -15,16 +26,27 @@ YDL_DETAIL = {
     "quiet": True, "skip_download": True, "noplaylist": True,
     "socket_timeout": 10,
 }
+# 채널 정보만(구독자 수) — 채널 탭 첫 페이지 한 번, 영상 목록은 펼치지 않음
+YDL_CHANNEL = {
+    "quiet": True, "skip_download": True, "extract_flat": True,
+    "playlistend": 1, "socket_timeout": 10,
+}
 
-# 병렬 스레드 수 (기본 12, 필요 시 환경변수로 조절: YT_META_WORKERS=20)
+# 상세 추출 동시 수는 지연/429에 맞춰 자동 조절(adaptive_limit, 배운 값은 다음 실행에도 유지).
+# YT_META_WORKERS: 저장된 값이 없을 때 시작값(기본 12), YT_META_MAX_WORKERS: 상한(= 풀 크기, 기본 32)
 MAX_WORKERS = int(os.environ.get("YT_META_WORKERS", "12"))
+META_MAX_WORKERS = max(MAX_WORKERS, int(os.environ.get("YT_META_MAX_WORKERS", "32")))
+META_LIMIT = al.AdaptiveLimit("meta", META_MAX_WORKERS, start=MAX_WORKERS)
+# 상세 추출 백엔드: thread(기본) | process — CPU를 많이 쓰는 대량 추출은 process가 유리
+# (tools/bench_meta_backend.py로 비교). 환경변수 YT_META_BACKEND=process
+META_BACKEND = os.environ.get("YT_META_BACKEND", "thread")
+# 자막 동시 요청도 자동 조절: 시작값 YT_CAPTION_WORKERS(기본 2), 상한 YT_CAPTION_MAX_WORKERS(기본 8)
+CAPTION_WORKERS = int(os.environ.get("YT_CAPTION_WORKERS", "2"))
+CAPTION_MAX_WORKERS = max(CAPTION_WORKERS, int(os.environ.get("YT_CAPTION_MAX_WORKERS", "8")))
+CAPTION_LIMIT = al.AdaptiveLimit("caption", CAPTION_MAX_WORKERS, start=CAPTION_WORKERS)
 
-# 자막 캐시(다시 보기 초고속)
-CACHE_DIR = os.path.join(
-    os.getenv("LOCALAPPDATA") or os.path.expanduser("~"),
-    "OneInsight", "UnifiedCrawler", "cache", "transcripts"
-)
-os.makedirs(CACHE_DIR, exist_ok=True)
+# 자막은 transcript_store(SQLite 한 파일)에 저장. 예전 영상별 .txt 캐시 위치는 옮기기용으로만 남김.
+CACHE_DIR = LEGACY_DIR
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -36,121 +58,6 @@ HEADERS = {
 def _is_video_id(s: str) -> bool:
     return bool(re.fullmatch(r"[0-9A-Za-z_-]{11}", s or ""))
 
-def get_caption_for_url(video_url: str, allow_non_ko: bool = True) -> str:
-    """
-    Transcript API만 사용. 한국어 우선, 없으면 번역.
-    cookies.txt 자동 적용(제한 영상 대비). 캐시 저장.
-    실패 시 이유 마커도 반환.
-    """
-    vid = _extract_id_from_url(video_url or "")
-    if not vid:
-        return "[NO_ID]"
-    # 캐시
-    cp = _cache_path(vid)
-    try:
-        if os.path.exists(cp):
-            with open(cp, "r", encoding="utf-8") as f:
-                cached = f.read()
-                if cached:
-                    return cached
-    except Exception:
-        pass
-
-    cookies_txt = _load_cookies_text()
-
-    try:
-        # 1) 한국어/자동한국어
-        try:
-            segs = YouTubeTranscriptApi.get_transcript(
-                vid, languages=['ko','ko-KR','a.ko'], cookies=cookies_txt
-            )
-        except (NoTranscriptFound, TranscriptsDisabled):
-            segs = None
-
-        # 2) 번역 폴백(영문/일본어/중국어 등 → ko)
-        if not segs:
-            tlist = YouTubeTranscriptApi.list_transcripts(vid, cookies=cookies_txt)
-            order = [
-                # (생성여부무관, 대상 언어들)
-                (False, ['en','en-US','en-GB']),
-                (False, ['ja']),
-                (False, ['zh-Hans','zh-Hant','zh']),
-                (False, ['es','es-419']),
-            ]
-            got = None
-            # 수동 자막 우선 번역
-            for _, langs in order:
-                try:
-                    tr = tlist.find_transcript(langs)
-                    try:
-                        got = tr.translate('ko').fetch()
-                    except Exception:
-                        if allow_non_ko:
-                            got = tr.fetch()
-                    if got: break
-                except Exception:
-                    continue
-            # 그래도 없으면 자동 자막 번역
-            if not got:
-                for _, langs in order:
-                    try:
-                        tr = tlist.find_generated_transcript(langs)
-                        try:
-                            got = tr.translate('ko').fetch()
-                        except Exception:
-                            if allow_non_ko:
-                                got = tr.fetch()
-                        if got: break
-                    except Exception:
-                        continue
-            segs = got
-
-        if not segs:
-            text = "(자막 없음)"  # 진짜 없는 케이스
-        else:
-            text = "\n".join(s.get('text','') for s in segs if s.get('text','').strip())
-
-    except Exception as e:
-        # 자동화 차단/권한/네트워크 등
-        msg = str(e)
-        if "Too Many Requests" in msg or "429" in msg:
-            text = "[COOLDOWN:429]"
-        elif "Forbidden" in msg or "403" in msg:
-            text = "[FORBIDDEN:403]"
-        else:
-            text = "[ERROR] " + msg[:200]
-
-    # 캐시 저장
-    try:
-        with open(cp, "w", encoding="utf-8") as f:
-            f.write(text)
-    except Exception:
-        pass
-
-    return text
-def _load_cookies_text() -> str | None:
-    """cookies.txt 내용 로드: ENV(YTDLP_COOKIES/ YT_COOKIES) → exe폴더 → 스크립트폴더 → CWD → 홈"""
-    for env in ("YTDLP_COOKIES", "YT_COOKIES"):
-        p = os.environ.get(env)
-        if p and os.path.exists(p):
-            try:
-                return open(p, "r", encoding="utf-8").read()
-            except Exception:
-                pass
-    bases = []
-    exe_dir = os.path.dirname(sys.executable) if getattr(sys, "frozen", False) else None
-    if exe_dir: bases.append(exe_dir)
-    bases += [os.path.dirname(os.path.abspath(__file__)), os.getcwd(), os.path.expanduser("~")]
-    for base in bases:
-        for name in ("cookies.txt", "yt_cookies.txt"):
-            path = os.path.join(base, name)
-            if os.path.exists(path):
-                try:
-                    return open(path, "r", encoding="utf-8").read()
-                except Exception:
-                    pass
-    return None
-
 def _extract_id_from_url(url: str) -> str | None:
     # 더 강하게: shorts/embed/youtu.be/파라미터 등 모두 커버
     m = re.search(
@@ -178,119 +85,850 @@ def _build_row(info: dict):
         "views": info.get("view_count") or 0,
         "subscribers": info.get("channel_follower_count") or 0,
         "upload_date": _fmt_upload_date(info.get("upload_date")),
-        "caption": ""  # 검색 단계에서는 자막 미로딩(지연 로딩)
+        "caption": "",  # 검색 단계에서는 자막 미로딩(지연 로딩)
+        "video_id": vid,
+        "channel_id": info.get("channel_id") or "",
+    }
+
+def _build_row_flat(entry: dict):
+    """
+    flat 검색 결과 항목만으로 행 구성(추가 요청 없음).
+    제목/채널/조회수는 있지만 구독자 수·업로드 날짜는 비어 있으므로 partial=True로 표시.
+    """
+    vid = _flat_video_id(entry)
+    ch_id = entry.get("channel_id") or ""
+    return {
+        "thumbnail": f"https://img.youtube.com/vi/{vid}/hqdefault.jpg",
+        "title": entry.get("title") or "",
+        "video_link": f"https://www.youtube.com/watch?v={vid}",
+        "channel": entry.get("channel") or entry.get("uploader") or "",
+        "channel_link": f"https://www.youtube.com/channel/{ch_id}" if ch_id else (entry.get("channel_url") or ""),
+        "views": entry.get("view_count") or 0,
+        "subscribers": entry.get("channel_follower_count") or 0,
+        "upload_date": _fmt_upload_date(entry.get("upload_date")),
+        "caption": "",
+        "video_id": vid,
+        "channel_id": ch_id,
+        "partial": True,
+    }
+
+def _failed_row(v: str):
+    # 실패해도 표는 채움
+    return {
+        "thumbnail": f"https://img.youtube.com/vi/{v}/hqdefault.jpg",
+        "title": "(불러오기 실패)",
+        "video_link": f"https://www.youtube.com/watch?v={v}",
+        "channel": "", "channel_link": "",
+        "views": 0, "subscribers": 0, "upload_date": "", "caption": "",
+        "video_id": v,
     }
 
+def _flat_video_id(e: dict) -> str | None:
+    """flat 항목 → 영상 ID (채널/플레이리스트면 None)"""
+    vid = e.get("id") or ""
+    if _is_video_id(vid):
+        return vid
+    m = re.search(r"v=([0-9A-Za-z_-]{11})", e.get("url") or "")
+    return m.group(1) if m else None
+
+# --- 스레드별 YoutubeDL 재사용 ---
+# 영상마다 YoutubeDL을 새로 만들면 추출기 등록/쿠키/HTTP 세션 생성과 TLS 연결이 매번 반복된다.
+# 워커 스레드마다 하나씩 만들어 앱 세션 동안 유지(각자 keep-alive 세션 보유)하고,
+# 오류가 나면 그 스레드 것만 버리고 다음 호출에서 새로 만든다.
+_ydl_local = threading.local()
+_ydl_all = set()
+_ydl_lock = threading.Lock()
+
+def _thread_ydl(opts: dict):
+    cache = getattr(_ydl_local, "cache", None)
+    if cache is None:
+        cache = _ydl_local.cache = {}
+    ydl = cache.get(id(opts))
+    if ydl is None:
+        ydl = cache[id(opts)] = YoutubeDL(opts)
+        with _ydl_lock:
+            _ydl_all.add(ydl)
+    return ydl
+
+def _drop_thread_ydl(opts: dict):
+    cache = getattr(_ydl_local, "cache", None) or {}
+    ydl = cache.pop(id(opts), None)
+    if ydl is not None:
+        with _ydl_lock:
+            _ydl_all.discard(ydl)
+        _close_ydl(ydl)
+
+def _close_ydl(ydl):
+    try:
+        ydl.close()
+    except Exception:
+        pass
+
+@atexit.register
+def _close_all_ydl():
+    with _ydl_lock:
+        items = list(_ydl_all)
+        _ydl_all.clear()
+    for ydl in items:
+        _close_ydl(ydl)
+
+def _ydl_extract(opts: dict, url: str):
+    ydl = _thread_ydl(opts)
+    try:
+        return ydl.extract_info(url, download=False)
+    except Exception:
+        _drop_thread_ydl(opts)
+        raise
+
+# 상세 워커 풀도 앱 세션 동안 유지(스레드가 살아 있어야 스레드별 YoutubeDL도 재사용됨).
+# 크기는 상한(META_MAX_WORKERS) 하나로 고정 — 동시 수는 호출 쪽 제출 창으로 조절하고 풀은 다시 만들지 않음
+# (다시 만들면 다른 반복자가 기다리던 작업이 취소되고 옛 스레드의 YoutubeDL도 남음)
+_detail_pool = None
+_pool_lock = threading.Lock()
+
+def _get_detail_pool() -> ThreadPoolExecutor:
+    global _detail_pool
+    with _pool_lock:
+        if _detail_pool is None:
+            _detail_pool = ThreadPoolExecutor(max_workers=META_MAX_WORKERS, thread_name_prefix="yt-meta")
+        return _detail_pool
+
 def _extract_detail(ref: str) -> dict:
     """단건 상세(제목/조회수 등). 빠르게 하려고 경미한 지연+jitter."""
     time.sleep(random.uniform(0.02, 0.12))
     url = ref if str(ref).startswith("http") else f"https://www.youtube.com/watch?v={ref}"
-    with YoutubeDL(YDL_DETAIL) as ydl:
-        info = ydl.extract_info(url, download=False)
-    return _build_row(info)
+    return _detail_row(_ydl_extract(YDL_DETAIL, url))
+
+def _detail_row(info: dict) -> dict:
+    """info(전체 또는 프로세스 백엔드가 줄인 것) → 행"""
+    row = _build_row(info)
+    # 상세에 딸려 온 채널 정보는 채널 캐시에, 구독자 수가 빠졌으면 캐시에서
+    if row["channel_id"]:
+        if row["subscribers"]:
+            CHANNEL_CACHE.put(_channel_part(row))
+        else:
+            hit = CHANNEL_CACHE.get_many([row["channel_id"]]).get(row["channel_id"])
+            if hit:
+                row["subscribers"] = hit["subscribers"]
+    return row
+
+def _load_outcome(e: Exception):
+    """추출 예외 → 동시성 조절 신호(영상 자체 문제면 None — 부하와 무관)"""
+    msg = str(e)
+    if "429" in msg or "Too Many Requests" in msg or "not a bot" in msg:
+        return al.THROTTLED
+    if isinstance(e, TimeoutError) or "timed out" in msg.lower():
+        return al.TIMEOUT
+    if any(k in msg for k in ("unavailable", "Private video", "removed", "members", "confirm your age")):
+        return None
+    return al.ERROR
+
+def _submit_detail(v: str, backend: str):
+    """풀 크기는 백엔드마다 고정(스레드: META_MAX_WORKERS, 프로세스: yt_procpool.PROCESSES)"""
+    if backend == "process":
+        return yt_procpool.get_pool().submit(yt_procpool.extract, v)
+    return _get_detail_pool().submit(_extract_detail, v)
+
+def _detail_result(fut, backend: str) -> dict:
+    """_submit_detail의 future → 행(프로세스 백엔드는 줄인 info를 여기서 행으로)"""
+    r = fut.result()
+    return _detail_row(r) if backend == "process" else r
 
-def get_keyword_videos(keyword: str, max_results: int = 50, with_captions: bool = False, **_ignored):
+# --- 채널 정보(구독자 수) 캐시: 같은 채널 영상 여러 개가 한 번의 조회를 공유 ---
+def _channel_part(row: dict) -> dict:
+    return {k: row.get(k) or (0 if k == "subscribers" else "")
+            for k in ("channel_id", "channel", "channel_link", "subscribers")}
+
+def _lookup_channel(cid: str) -> dict:
+    """채널 페이지 한 번으로 채널명/구독자 수"""
+    info = _ydl_extract(YDL_CHANNEL, f"https://www.youtube.com/channel/{cid}")
+    row = {
+        "channel_id": cid,
+        "channel": info.get("channel") or info.get("uploader") or info.get("title") or "",
+        "channel_link": f"https://www.youtube.com/channel/{cid}",
+        "subscribers": info.get("channel_follower_count") or 0,
+    }
+    CHANNEL_CACHE.put(row)
+    return row
+
+def apply_channel_cache(rows) -> set:
     """
-    검색 → 영상ID만 선별 → 상세를 병렬로 빠르게 가져옴.
-    기본 50개까지 한 번에 가능.
+    구독자 수가 빈 행을 채널 캐시로 채움(제자리 수정).
+    캐시에도 없는 채널 ID 집합을 돌려줌 — iter_channel_info로 채널당 한 번만 조회.
     """
-    # 1) 검색(한 번 호출로 N개 받음)
-    with YoutubeDL(YDL_SEARCH) as ydl:
-        res = ydl.extract_info(f"ytsearch{max_results}:{keyword}", download=False)
-    entries = (res or {}).get("entries") or []
-
-    # 2) 영상 ID만 수집 (채널/플리 제거)
-    ids = []
-    for e in entries:
-        vid = e.get("id") or ""
-        if _is_video_id(vid):
-            ids.append(vid)
-        else:
-            url = e.get("url") or ""
-            m = re.search(r"v=([0-9A-Za-z_-]{11})", url)
-            if m: ids.append(m.group(1))
-        if len(ids) >= max_results: break
-    if not ids: return []
+    need = {r["channel_id"] for r in rows if r.get("channel_id") and not r.get("subscribers")}
+    if not need:
+        return set()
+    cached = CHANNEL_CACHE.get_many(list(need))
+    for r in rows:
+        hit = cached.get(r.get("channel_id"))
+        if hit and not r.get("subscribers"):
+            r["subscribers"] = hit["subscribers"]
+            r["channel"] = r.get("channel") or hit["channel"]
+    return need - set(cached)
 
-    # 3) 상세를 병렬로(기본 12스레드; 필요 시 YT_META_WORKERS로 올리기)
-    rows = []
-    def worker(v):
+def iter_channel_info(channel_ids):
+    """채널별 조회를 상세 풀에서 병렬로 — 끝나는 순서대로 (channel_id, row|None)"""
+    ids = list(dict.fromkeys(channel_ids))
+    if not ids:
+        return
+    ex = _get_detail_pool()
+    futs = {ex.submit(_lookup_channel, c): c for c in ids}
+    try:
+        for fut in as_completed(futs):
+            try:
+                yield futs[fut], fut.result()
+            except Exception:
+                yield futs[fut], None
+    finally:
+        for fut in futs:
+            fut.cancel()
+
+# --- 검색: (키워드, 필터)별 결과 순서 캐시 + 이어서 페이지 받기 ---
+# 검색 필터 → results URL의 sp 값(protobuf: 1=정렬, 2={1=업로드 기간, 2=유형})
+SEARCH_SORTS = {"relevance": 0, "upload_date": 2, "view_count": 3}
+SEARCH_PERIODS = {"hour": 1, "today": 2, "week": 3, "month": 4, "year": 5}
+PAGE_SIZE = 50
+
+def _search_sp(sort: str = "relevance", period: str | None = None) -> str:
+    flt = b"\x10\x01"  # 유형=동영상(채널/플리 제외)
+    if period:
+        flt = bytes([0x08, SEARCH_PERIODS[period]]) + flt
+    raw = b""
+    if SEARCH_SORTS.get(sort or "relevance"):
+        raw += bytes([0x08, SEARCH_SORTS[sort]])
+    raw += bytes([0x12, len(flt)]) + flt
+    return base64.b64encode(raw).decode()
+
+class _SearchSession:
+    """
+    한 (키워드, 필터)의 검색 결과를 필요한 만큼만 받는다.
+    앞부분은 SEARCH_CACHE에서 바로 읽고, 모자라면 살아 있는 yt-dlp 항목 iterator를
+    이어서 돌려 다음 연속 페이지만 요청한다(처음부터 다시 검색하지 않음).
+    앱을 다시 켠 뒤 캐시 뒤쪽을 더 받을 때만 처음부터 훑되, 이미 받은 ID는 건너뛴다.
+    """
+
+    def __init__(self, keyword: str, sort: str = "relevance", period: str | None = None):
+        self.key = json.dumps([keyword.strip().lower(), sort or "relevance", period or ""], ensure_ascii=False)
+        self.url = "https://www.youtube.com/results?" + urlencode(
+            {"search_query": keyword.strip(), "sp": _search_sp(sort, period)})
+        self.lock = threading.Lock()
+        self._ydl = None   # 세션 전용(iterator가 다른 스레드에서 이어 돌 수 있으므로 스레드별 것과 분리)
+        self._it = None
+        self._seen = set()
+
+    def close(self):
+        with self.lock:
+            self._reset()
+
+    def _reset(self):
+        if self._ydl is not None:
+            _close_ydl(self._ydl)
+        self._ydl = self._it = None
+        self._seen = set()
+
+    def exhausted(self) -> bool:
+        return SEARCH_CACHE.state(self.key)[1]
+
+    def rows(self, start: int, count: int, refresh: bool = False) -> list:
+        with self.lock:
+            if refresh:   # 저장된 순서를 버리고 지금 결과로(감시 모드 등)
+                SEARCH_CACHE.drop(self.key)
+            have, exhausted = SEARCH_CACHE.state(self.key)
+            if have >= start + count or exhausted:
+                SEARCH_CACHE.hits += 1
+            else:
+                SEARCH_CACHE.misses += 1
+                if have == 0:   # 처음이거나 TTL 만료 → 새 검색
+                    self._reset()
+                self._fill(have, start + count)
+            return SEARCH_CACHE.read(self.key, start, count)
+
+    def _fill(self, have: int, need: int):
+        if self._it is None:
+            self._seen = set(SEARCH_CACHE.ids(self.key))
+            self._ydl = YoutubeDL(YDL_SEARCH)
+            try:
+                res = self._ydl.extract_info(self.url, download=False, process=False)
+            except Exception:
+                self._reset()
+                raise
+            self._it = iter((res or {}).get("entries") or [])
+        batch, exhausted = [], False
         try:
-            return _extract_detail(v)
+            while have + len(batch) < need:
+                try:
+                    e = next(self._it)
+                except StopIteration:
+                    exhausted = True
+                    break
+                vid = _flat_video_id(e) if e else None
+                if not vid or vid in self._seen:
+                    continue
+                self._seen.add(vid)
+                batch.append(_build_row_flat(e))
         except Exception:
-            # 실패해도 표는 채움
-            return {
-                "thumbnail": f"https://img.youtube.com/vi/{v}/hqdefault.jpg",
-                "title": "(불러오기 실패)",
-                "video_link": f"https://www.youtube.com/watch?v={v}",
-                "channel": "", "channel_link": "",
-                "views": 0, "subscribers": 0, "upload_date": "", "caption": ""
-            }
-
-    max_workers = min(MAX_WORKERS, len(ids))
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        for row in ex.map(worker, ids):
-            rows.append(row)
-    return rows
+            # 연속 페이지 요청 실패: 받은 만큼은 저장하고 다음 호출에서 iterator를 새로 만든다
+            self._reset()
+            if not batch:
+                raise
+        if batch or exhausted:
+            SEARCH_CACHE.append(self.key, batch, exhausted)
+
+_search_sessions = OrderedDict()
+_sessions_lock = threading.Lock()
+MAX_SEARCH_SESSIONS = 8
+
+def _search_session(keyword: str, sort: str = "relevance", period: str | None = None) -> _SearchSession:
+    s = _SearchSession(keyword, sort, period)
+    evicted = []
+    with _sessions_lock:
+        s = _search_sessions.setdefault(s.key, s)
+        _search_sessions.move_to_end(s.key)
+        while len(_search_sessions) > MAX_SEARCH_SESSIONS:
+            evicted.append(_search_sessions.popitem(last=False)[1])
+    for old in evicted:
+        old.close()
+    return s
+
+def search_page(keyword: str, start: int = 0, count: int = PAGE_SIZE,
+                sort: str = "relevance", period: str | None = None, refresh: bool = False) -> list:
+    """
+    검색 결과 start번째부터 count개(flat 행, partial=True). 결과가 끝나면 더 적게 돌려줌.
+    refresh=True: 캐시를 무시하고 새로 검색(조회수도 지금 값).
+    """
+    return _search_session(keyword, sort, period).rows(start, count, refresh)
+
+def iter_search_pages(keyword: str, total: int, page_size: int = PAGE_SIZE, start: int = 0,
+                      sort: str = "relevance", period: str | None = None):
+    """total개가 될 때까지 page_size씩 받아 페이지(list)마다 바로 내보냄(수천 개도 가능)"""
+    sess = _search_session(keyword, sort, period)
+    pos, end = start, start + total
+    while pos < end:
+        want = min(page_size, end - pos)
+        page = sess.rows(pos, want)
+        if page:
+            yield page
+        if len(page) < want:   # 결과 끝
+            return
+        pos += len(page)
+
+def search_exhausted(keyword: str, sort: str = "relevance", period: str | None = None) -> bool:
+    return _search_session(keyword, sort, period).exhausted()
+
+# 조회수 등만 오래된 캐시 행의 백그라운드 갱신(같은 영상 중복 제출 방지)
+_revalidating = set()
+_reval_lock = threading.Lock()
+
+def _revalidate(ids, backend: str = META_BACKEND):
+    with _reval_lock:
+        ids = [v for v in ids if v not in _revalidating]
+        _revalidating.update(ids)
+    if not ids:
+        return
+
+    def _done(fut, v):
+        with _reval_lock:
+            _revalidating.discard(v)
+        if not fut.cancelled() and fut.exception() is None:
+            META_CACHE.put(_detail_result(fut, backend))
+
+    for v in ids:
+        _submit_detail(v, backend).add_done_callback(lambda f, v=v: _done(f, v))
+
+def iter_video_details(ids, max_workers: int | None = None, use_cache: bool = True,
+                       backend: str = META_BACKEND):
+    """
+    상세를 병렬로 가져와 끝나는 순서대로 (video_id, row, ok)를 내보냄.
+    실패한 영상은 ok=False와 함께 자리표시 행.
+    use_cache=True: 캐시에 있는 영상은 풀에 보내지 않고 바로 내보냄.
+    조회수/구독자 TTL만 지난 행은 그대로 쓰고 백그라운드에서 갱신(다음 조회부터 반영).
+    backend: "thread" | "process"(yt_procpool) — 결과 행과 실패 행은 같음.
+    max_workers=None: 동시 수를 META_LIMIT가 조절(풀은 고정 크기로 두고 제출 창만 조절).
+    숫자를 주면 제출 창을 그 수로 고정(벤치마크용, 스레드 백엔드는 META_MAX_WORKERS,
+    프로세스 백엔드는 yt_procpool.PROCESSES를 넘는 만큼 풀 안에서 기다림).
+    """
+    adaptive = max_workers is None
+    ids = list(ids)
+    if not ids:
+        return
+    if use_cache:
+        cached = META_CACHE.get_many(ids)
+        _revalidate([v for v, (_, state) in cached.items() if state == STALE], backend)
+        for v, (row, _) in cached.items():
+            yield v, row, True
+        ids = [v for v in ids if v not in cached]
+        if not ids:
+            return
+    queue = list(reversed(ids))
+    futs = {}   # future -> (video_id, 제출 시각)
+
+    def _fill():
+        limit = META_LIMIT.limit if adaptive else max_workers
+        while queue and len(futs) < limit:
+            v = queue.pop()
+            futs[_submit_detail(v, backend)] = (v, time.monotonic())
+
+    try:
+        _fill()
+        while futs:
+            done, _ = wait(futs, return_when=FIRST_COMPLETED)
+            for fut in done:
+                v, t0 = futs.pop(fut)
+                try:
+                    row = _detail_result(fut, backend)
+                except Exception as e:
+                    outcome = _load_outcome(e)
+                    if adaptive and outcome:
+                        META_LIMIT.record(time.monotonic() - t0, outcome)
+                    yield v, _failed_row(v), False
+                    continue
+                if adaptive:
+                    META_LIMIT.record(time.monotonic() - t0, al.OK)
+                if use_cache:
+                    META_CACHE.put(row)
+                yield v, row, True
+            _fill()
+    finally:
+        # 소비자가 중간에 멈추면(새 검색 등) 아직 시작 안 한 작업은 취소
+        for fut in futs:
+            fut.cancel()
+        if adaptive:
+            META_LIMIT.save()
+
+def get_keyword_videos(keyword: str, max_results: int = 50, with_captions: bool = False, fast: bool = False,
+                       start: int = 0, sort: str = "relevance", period: str | None = None, **_ignored):
+    """
+    검색 → 영상ID만 선별 → 상세를 병렬로 빠르게 가져옴.
+    검색 결과 순서는 (키워드, 정렬, 기간)별로 캐시되고, start로 다음 페이지를 이어 받는다
+    (예: start=50, max_results=50 → 51~100번째).
+    fast=True: flat 검색 결과만으로 바로 반환(왕복 1회). 구독자 수/업로드 날짜는
+    비어 있으니(partial=True) 필요한 행만 iter_video_details로 나중에 채운다.
+    """
+    # 1) 검색(캐시에 있으면 바로, 모자란 부분만 이어서 요청)
+    rows = search_page(keyword, start, max_results, sort, period)
+    if not rows: return []
+    if fast:
+        # 캐시에 상세가 있으면 그대로 쓰고(partial 아님), 조회수는 flat 값으로
+        cached = META_CACHE.get_many([r["video_id"] for r in rows])
+        for i, r in enumerate(rows):
+            hit = cached.get(r["video_id"])
+            if hit:
+                rows[i] = dict(hit[0], views=r["views"] or hit[0].get("views") or 0)
+        apply_channel_cache(rows)
+        return rows
+
+    # 2) 캐시에 없는 것만 상세를 병렬로(기본 12스레드; 필요 시 YT_META_WORKERS로 올리기), 검색 순서 유지
+    ids = [r["video_id"] for r in rows]
+    got = {v: row for v, row, _ in iter_video_details(ids)}
+    return [got[v] for v in ids]
+
+# -------------------- 여러 키워드 한 번에(중복 영상은 한 번만) --------------------
+# 관련 키워드 수십 개는 결과가 많이 겹친다 → flat 검색만 키워드별로 하고, 상세는 고유 영상당 한 번.
+# 동시 검색 수: YT_BATCH_SEARCH_WORKERS=6
+BATCH_SEARCH_WORKERS = int(os.environ.get("YT_BATCH_SEARCH_WORKERS", "4"))
+
+def parse_keywords(text: str) -> list:
+    """줄바꿈/쉼표로 구분된 키워드 목록(빈 줄, #주석, 대소문자만 다른 중복 제외)"""
+    out, seen = [], set()
+    for line in (text or "").splitlines():
+        if line.strip().startswith("#"):
+            continue
+        for kw in line.split(","):
+            kw = kw.strip()
+            if kw and kw.lower() not in seen:
+                seen.add(kw.lower())
+                out.append(kw)
+    return out
+
+def iter_keyword_searches(keywords, count: int = PAGE_SIZE, sort: str = "relevance", period: str | None = None,
+                          max_workers: int = BATCH_SEARCH_WORKERS):
+    """키워드별 빠른 검색을 동시에 돌려 끝나는 순서대로 (keyword, rows, error)"""
+    keywords = list(keywords)
+    if not keywords:
+        return
+    ex = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keywords))), thread_name_prefix="yt-batch")
+    futs = {ex.submit(get_keyword_videos, kw, count, fast=True, sort=sort, period=period): kw for kw in keywords}
+    try:
+        for fut in as_completed(futs):
+            try:
+                yield futs[fut], fut.result(), None
+            except Exception as e:
+                yield futs[fut], [], str(e)
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
+class KeywordBatch:
+    """
+    여러 키워드 검색 결과를 영상 ID로 합침.
+    hits[video_id] = [(keyword, 순위), ...] — 어떤 키워드 몇 위로 잡혔는지(출처)
+    """
+
+    def __init__(self):
+        self.rows = OrderedDict()   # video_id -> 처음 받은 행(키워드 순서가 아니라 도착 순서)
+        self.hits = {}
+        self.keywords = []
+        self.errors = {}            # keyword -> 오류 메시지
+
+    def add(self, keyword: str, rows, error: str | None = None) -> list:
+        """한 키워드의 결과를 합치고, 처음 본 영상의 행만 돌려줌"""
+        self.keywords.append(keyword)
+        if error:
+            self.errors[keyword] = error
+        new = []
+        for rank, r in enumerate(rows, start=1):
+            vid = r["video_id"]
+            self.hits.setdefault(vid, []).append((keyword, rank))
+            if vid not in self.rows:
+                self.rows[vid] = r
+                new.append(r)
+        return new
+
+    def provenance(self, vid: str) -> dict:
+        hits = sorted(self.hits.get(vid, ()), key=lambda h: h[1])
+        return {
+            "keywords": ", ".join(f"{kw}({rank})" for kw, rank in hits),
+            "keyword_hits": len(hits),
+            "best_rank": hits[0][1] if hits else 0,
+        }
+
+    def stats(self) -> dict:
+        total = sum(len(h) for h in self.hits.values())
+        return {"keywords": len(self.keywords), "videos": len(self.rows), "hits": total,
+                "duplicates": total - len(self.rows), "errors": len(self.errors)}
 
 # -------------------- 자막: Transcript API 단일 경로 --------------------
-def _cache_path(video_id: str) -> str:
-    return os.path.join(CACHE_DIR, f"{video_id}.txt")
+# 쿠키 파일 탐색/로드, HTTP 세션, API 객체는 프로세스당 한 번만 만든다.
+# 영상당 요청: 자막 목록 1회 + 고른 트랙 1회(번역 실패 시에만 원문 1회 추가).
+_COOKIE_NAMES = ("cookies.txt", "yt_cookies.txt")
+
+# 실제 HTTP 응답 수(세션 훅으로 집계) — 영상당 요청 수 비교용
+CAPTION_STATS = {"videos": 0, "http_requests": 0}
+_stats_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _cookies_path() -> str | None:
+    """cookies.txt 위치: ENV(YTDLP_COOKIES/ YT_COOKIES) → exe폴더 → 스크립트폴더 → CWD → 홈"""
+    for env in ("YTDLP_COOKIES", "YT_COOKIES"):
+        p = os.environ.get(env)
+        if p and os.path.exists(p):
+            return p
+    bases = []
+    exe_dir = os.path.dirname(sys.executable) if getattr(sys, "frozen", False) else None
+    if exe_dir: bases.append(exe_dir)
+    bases += [os.path.dirname(os.path.abspath(__file__)), os.getcwd(), os.path.expanduser("~")]
+    for base in bases:
+        for name in _COOKIE_NAMES:
+            path = os.path.join(base, name)
+            if os.path.exists(path):
+                return path
+    return None
+
+def _count_response(resp, *args, **kwargs):
+    with _stats_lock:
+        CAPTION_STATS["http_requests"] += 1
+
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """자막 요청 공용 세션(keep-alive 연결 풀, 쿠키 1회 로드)"""
+    sess = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(8, CAPTION_WORKERS * 2))
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    sess.headers.update(HEADERS)
+    path = _cookies_path()
+    if path:
+        try:
+            jar = MozillaCookieJar(path)
+            jar.load(ignore_discard=True, ignore_expires=True)
+            sess.cookies.update(jar)
+        except Exception:
+            pass
+    sess.hooks["response"].append(_count_response)
+    return sess
+
+@lru_cache(maxsize=1)
+def _transcript_api():
+    """세션을 넘길 수 있는 버전(1.x)이면 인스턴스, 아니면 None(0.6 정적 API 사용)"""
+    try:
+        return YouTubeTranscriptApi(http_client=_http_session())
+    except TypeError:
+        return None
+
+def _list_transcripts(vid: str):
+    api = _transcript_api()
+    if api is not None:
+        return api.list(vid)
+    # 0.6: 세션 주입 불가 — 쿠키는 경로로 전달, 요청 수는 목록 1 + 트랙 1로 추정 집계
+    _count_response(None)
+    return YouTubeTranscriptApi.list_transcripts(vid, cookies=_cookies_path())
+
+def _pick_track(tlist):
+    """
+    목록을 한 번 훑어 최선의 트랙: 수동 ko → 자동 ko → 번역(수동 원문 우선).
+    (트랙, 언어 표기, 번역할 원문 트랙|None) — 번역은 받을 때(_fetch_track) 요청
+    """
+    manual_ko = gen_ko = manual_src = gen_src = None
+    for tr in tlist:
+        if tr.language_code.split("-")[0] == "ko":
+            if tr.is_generated:
+                gen_ko = gen_ko or tr
+            else:
+                manual_ko = manual_ko or tr
+        elif tr.is_translatable:
+            if tr.is_generated:
+                gen_src = gen_src or tr
+            else:
+                manual_src = manual_src or tr
+    if manual_ko:
+        return manual_ko, manual_ko.language_code, None
+    if gen_ko:
+        return gen_ko, f"{gen_ko.language_code}(auto)", None
+    src = manual_src or gen_src
+    if src:
+        return src, f"{src.language_code}→ko", src
+    return None, "", None
+
+def _segments(raw) -> list:
+    """fetch 결과(0.6: dict 목록, 1.x: snippet 객체) → [{start, duration, text}]"""
+    out = []
+    for s in raw or []:
+        if isinstance(s, dict):
+            text, start, dur = s.get("text", ""), s.get("start", 0.0), s.get("duration", 0.0)
+        else:
+            text, start, dur = s.text, s.start, s.duration
+        if text and text.strip():
+            out.append({"start": round(float(start), 2), "duration": round(float(dur), 2), "text": text})
+    return out
+
+def _fetch_track(vid: str):
+    """(segments, lang). 자막이 없으면 NoTranscriptFound/TranscriptsDisabled."""
+    tr, lang, src = _pick_track(_list_transcripts(vid))
+    if tr is None:
+        raise NoTranscriptFound(vid, ["ko"], None)
+    if _transcript_api() is None:
+        _count_response(None)
+    try:
+        # translate()도 여기서 — ko 번역을 못 하는 트랙(TranslationLanguageNotAvailable 등)은 원문으로
+        return _segments((tr.translate("ko") if src is not None else tr).fetch()), lang
+    except Exception as e:
+        if src is None or _caption_status(e) == ts.COOLDOWN:
+            raise
+        # 번역이 막힌 영상: 원문 그대로
+        if _transcript_api() is None:
+            _count_response(None)
+        return _segments(src.fetch()), src.language_code
+
+def _caption_status(e: Exception) -> str:
+    """예외 → 저장소 상태(일시적 실패는 짧은 TTL 후 재시도)"""
+    if isinstance(e, (NoTranscriptFound, TranscriptsDisabled)):
+        return ts.NONE
+    msg = str(e)
+    if type(e).__name__ in ("TooManyRequests", "RequestBlocked", "IpBlocked") \
+            or "Too Many Requests" in msg or "429" in msg:
+        return ts.COOLDOWN
+    if "Forbidden" in msg or "403" in msg:
+        return ts.FORBIDDEN
+    return ts.ERROR
 
 def get_caption_for_url(video_url: str) -> str:
     """
     유튜브 Transcript API만 사용. 한국어 우선, 없으면 번역.
-    디스크 캐시로 재요청 최소화.
+    자막 저장소(색인 조회 한 번)로 재요청 최소화. 실패는 빈 문자열(저장소에는 상태로 기록).
     """
-    vid = _extract_id_from_url(video_url)
+    vid = _extract_id_from_url(video_url or "")
     if not vid:
         return ""
+    return fetch_caption(vid)[0]
 
-    # 0) 캐시
-    cp = _cache_path(vid)
-    try:
-        if os.path.exists(cp):
-            with open(cp, "r", encoding="utf-8") as f:
-                return f.read()
-    except Exception:
-        pass
+def get_caption_segments(video_url: str) -> list:
+    """타이밍 포함 자막 [{start, duration, text}] (없으면 빈 목록)"""
+    vid = _extract_id_from_url(video_url or "")
+    if not vid:
+        return []
+    fetch_caption(vid)
+    hit = ts.STORE.get(vid, with_segments=True)
+    return (hit.segments or []) if hit is not None else []
+
+def fetch_caption(vid: str, retry_transient: bool = False) -> tuple[str, str]:
+    """
+    (자막, 상태). 상태는 transcript_store의 OK/NONE/COOLDOWN/FORBIDDEN/ERROR.
+    retry_transient=True면 저장소의 일시적 실패(429/오류) 기록을 무시하고 다시 요청.
+    """
+    # 0) 저장소 — 실패 기록도 TTL 동안은 다시 요청하지 않음
+    hit = ts.STORE.get(vid)
+    if hit is not None and not (retry_transient and hit.status in (ts.COOLDOWN, ts.ERROR)):
+        return hit.text, hit.status
+    return _download_caption(vid)
 
-    text = ""
+def _download_caption(vid: str) -> tuple[str, str]:
+    """저장소를 거치지 않고 새로 받아 저장"""
+    # 1) 목록 1회 → 트랙 선택 → 받기
+    with _stats_lock:
+        CAPTION_STATS["videos"] += 1
+    segs, lang = [], ""
     try:
-        # 1) 한국어/자동한국어 우선
-        try:
-            segs = YouTubeTranscriptApi.get_transcript(vid, languages=['ko', 'a.ko'])
-        except (NoTranscriptFound, TranscriptsDisabled):
-            segs = None
-
-        # 2) 없다면 다른 언어 → 한국어로 번역
-        if not segs:
-            tlist = YouTubeTranscriptApi.list_transcripts(vid)
-            # 수동 자막 먼저 번역 시도
-            for tr in tlist:
-                if not getattr(tr, "is_generated", False):
-                    try:
-                        segs = tr.translate('ko').fetch(); break
-                    except Exception:
-                        pass
-            # 그래도 없으면 자동 자막 번역
-            if not segs:
-                for tr in tlist:
-                    try:
-                        segs = tr.translate('ko').fetch(); break
-                    except Exception:
-                        pass
-
-        if segs:
-            text = "\n".join(s.get('text','') for s in segs if s.get('text','').strip())
-    except Exception:
-        text = ""
+        segs, lang = _fetch_track(vid)
+        status = ts.OK if segs else ts.NONE
+    except Exception as e:
+        status = _caption_status(e)
+    text = "\n".join(s["text"] for s in segs)
 
-    # 3) 캐시 저장
+    # 2) 저장(본문과 상태 분리, 타이밍 포함)
     try:
-        with open(cp, "w", encoding="utf-8") as f:
-            f.write(text)
+        ts.STORE.put(vid, status, text, lang=lang, segments=segs)
     except Exception:
         pass
 
-    return text
+    return text, status
+
+def search_transcripts(query: str, limit: int = 200) -> list:
+    """
+    받아 둔 자막 전문 검색 → 결과 행(잘 맞는 순). 행에는 match_snippet(강조 표시 포함, tix.snippet_html로 변환).
+    메타 캐시에 없는 영상은 partial 행(제목 등은 화면에 보일 때 상세로 채움).
+    """
+    hits = tix.INDEX.search(query, limit)
+    cached = META_CACHE.get_many([h["video_id"] for h in hits])
+    rows = []
+    for h in hits:
+        vid = h["video_id"]
+        row = cached[vid][0] if vid in cached else _build_row_flat({"id": vid})
+        rows.append(dict(row, match_snippet=h["snippet"], match_score=h["score"]))
+    return rows
+
+def caption_http_stats() -> dict:
+    """영상당 평균 HTTP 요청 수(자막을 새로 받은 영상 기준)"""
+    with _stats_lock:
+        v, n = CAPTION_STATS["videos"], CAPTION_STATS["http_requests"]
+    return {"videos": v, "http_requests": n, "per_video": round(n / v, 2) if v else 0.0}
+
+# -------------------- 자막 일괄 받기 --------------------
+
+class CaptionPrefetcher:
+    """
+    여러 영상의 자막을 우선순위 큐로 받는다(작은 숫자 먼저 — 화면에 보이는 행은 0).
+    - 동시성: CAPTION_LIMIT(adaptive_limit)가 지연이 평탄하면 늘리고 429/시간 초과/지연 증가면 줄임
+      (워커 스레드는 상한만큼 띄워 두고 limit 이상은 대기). 저장소에 있던 자막은 지연 측정에서 제외.
+    - 429가 한 번이라도 나면 모든 워커가 함께 쉼(30초부터 두 배씩, 최대 5분) 후 재시도
+    on_result(vid, text, status)는 워커 스레드에서 호출된다.
+    """
+    PAUSE_MIN, PAUSE_MAX, MAX_TRIES = 30.0, 300.0, 3
+
+    def __init__(self, on_result, limiter: al.AdaptiveLimit = CAPTION_LIMIT):
+        self.on_result = on_result
+        self.limiter = limiter
+        self.max_workers = limiter.max_limit
+        self._cond = threading.Condition()
+        self._heap = []              # (priority, seq, vid)
+        self._prio = {}              # 대기 중 vid -> 현재 우선순위
+        self._tries = {}
+        self._seq = 0
+        self._active = 0
+        self._pause = 0.0
+        self.paused_until = 0.0
+        self.total = self.done = self.failed = 0
+        self._cancelled = False
+        self._threads = [threading.Thread(target=self._worker, name=f"yt-caption-{i}", daemon=True)
+                         for i in range(self.max_workers)]
+        for t in self._threads:
+            t.start()
+
+    @property
+    def limit(self) -> int:
+        return self.limiter.limit
+
+    def submit(self, vids, priority: int = 10):
+        """대기/받는 중이거나 이미 받은(OK/자막 없음) 영상은 건너뜀 — 실패로 끝난 영상은 다시 받음"""
+        with self._cond:
+            for v in vids:
+                if v in self._prio or v in self._tries:
+                    continue
+                self._tries[v] = 0
+                self.total += 1
+                self._push(v, priority)
+            self._cond.notify_all()
+
+    def prioritize(self, vids, priority: int = 0):
+        """대기 중인 영상의 순서를 앞당김(이미 받았거나 받는 중이면 무시)"""
+        with self._cond:
+            for v in vids:
+                if v in self._prio and priority < self._prio[v]:
+                    self._push(v, priority)
+            self._cond.notify_all()
+
+    def _push(self, v, priority):
+        self._prio[v] = priority
+        self._seq += 1
+        heapq.heappush(self._heap, (priority, self._seq, v))
+
+    def _next(self):
+        """실행할 vid(취소되면 None). 일시정지/동시성 상한 동안 대기."""
+        with self._cond:
+            while True:
+                if self._cancelled:
+                    return None
+                left = self.paused_until - time.time()
+                if left <= 0 and self._active < self.limit:
+                    # 우선순위가 바뀌어 남은 옛 항목은 건너뜀
+                    while self._heap:
+                        prio, _, v = heapq.heappop(self._heap)
+                        if self._prio.get(v) == prio:
+                            del self._prio[v]
+                            self._active += 1
+                            return v
+                self._cond.wait(left if left > 0 else 0.5)
+
+    def _worker(self):
+        while True:
+            v = self._next()
+            if v is None:
+                return
+            hit = ts.STORE.get(v)
+            latency = None
+            if hit is not None and hit.status not in (ts.COOLDOWN, ts.ERROR):
+                text, status = hit.text, hit.status
+            else:
+                t0 = time.monotonic()
+                try:
+                    text, status = _download_caption(v)
+                except Exception:
+                    text, status = "", ts.ERROR
+                latency = time.monotonic() - t0
+            if latency is not None:
+                self.limiter.record(latency, {ts.COOLDOWN: al.THROTTLED, ts.ERROR: al.ERROR,
+                                              ts.FORBIDDEN: al.ERROR}.get(status, al.OK))
+            report = True
+            with self._cond:
+                self._active -= 1
+                if status == ts.COOLDOWN:
+                    self._pause = min(self.PAUSE_MAX, self._pause * 2) if self._pause else self.PAUSE_MIN
+                    self.paused_until = max(self.paused_until, time.time() + self._pause)
+                    self._tries[v] += 1
+                    if self._tries[v] < self.MAX_TRIES and not self._cancelled:
+                        self._push(v, -1)   # 쉬고 나서 가장 먼저 다시
+                        report = False
+                else:
+                    self._pause = 0.0
+                if report:
+                    self.done += 1
+                    if status not in (ts.OK, ts.NONE):
+                        self.failed += 1
+                        del self._tries[v]   # 실패로 끝난 영상은 다시 submit하면 새로 받음
+                self._cond.notify_all()
+            if report:
+                try:
+                    self.on_result(v, text, status)
+                except Exception:
+                    pass
+
+    def pending(self) -> int:
+        with self._cond:
+            return self.total - self.done
+
+    def cancel(self):
+        with self._cond:
+            self._cancelled = True
+            self._heap.clear()
+            self._prio.clear()
+            self._cond.notify_all()
+        self.limiter.save()
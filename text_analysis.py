@@ -0,0 +1,299 @@
+# text_analysis.py
+"""
+결과 묶음(영상 제목+자막, 커뮤니티 글 제목)의 키워드/추세 분석.
+- 글자 n-gram(기본 2~3글자) TF-IDF 희소 행렬 — 띄어쓰기/조사와 상관없이 한국어 단어 조각을 잡음
+- 항목별 상위 키워드, 그룹(사이트/검색 키워드/채널)별 상위 키워드, 기간별 상위 단어 비중(추세)
+- n-gram 추출부터 가중치/정렬까지 NumPy 배열 연산(문서 단위 파이썬 반복 없음):
+  문서들을 이어 붙여 코드 포인트 배열로 만들고, n글자 창을 정수 하나로 묶어(글자당 21비트) np.unique로 어휘를 만든다.
+SciPy가 있으면 그룹/기간 합계에 scipy.sparse를 쓰고, 없으면 NumPy만으로 같은 결과를 낸다.
+"""
+import re
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:  # pandas를 쓰면 함께 설치됨
+    np = None
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # 선택 의존성 (requirements-app.txt)
+    sp = None
+
+NGRAMS = (2, 3)
+MIN_DF = 2          # 이보다 적은 문서에 나온 n-gram은 버림(오타/고유 조각)
+MAX_DF = 0.5        # 문서 절반 넘게 나오는 n-gram은 버림(불용어 역할)
+TOP_ITEM = 5
+TOP_GROUP = 15
+TOP_TREND = 10
+MAX_CHARS = 2000    # 문서당 앞부분만(긴 자막이 전체 시간을 좌우하지 않게)
+CHUNK_CHARS = 2_000_000   # n-gram 추출을 이 글자 수 단위로 나눠 임시 메모리 상한
+
+_BITS = 21          # 유니코드 코드 포인트 최대 0x10FFFF < 2^21
+
+
+def available() -> bool:
+    return np is not None
+
+
+def _valid_mask(cp):
+    """n-gram에 들어갈 글자: 한글 음절, 영문 소문자, 숫자"""
+    return ((cp >= 0xAC00) & (cp <= 0xD7A3)) | ((cp >= 0x61) & (cp <= 0x7A)) | ((cp >= 0x30) & (cp <= 0x39))
+
+
+def _chunks(lens, size):
+    """문서 구간 [(a, b)...] — 구간마다 글자 수가 size 정도(임시 배열 크기 상한)"""
+    if not len(lens):
+        return []
+    cum = np.cumsum(lens)
+    cuts = np.searchsorted(cum, np.arange(size, cum[-1], size)) + 1
+    bounds = np.unique(np.concatenate(([0], cuts, [len(lens)])))
+    return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+
+def _ngram_counts(texts, lens, ngrams):
+    """
+    문서 묶음 → (문서 번호, n-gram 코드, 문서 안 횟수) — 문서 번호 순으로 정렬됨.
+    문서를 NUL로 이어 붙인 코드 포인트 배열에서 k글자 창을 밀며 코드를 만든다(구분자/공백/기호가 낀 창은 버림).
+    """
+    cp = np.frombuffer(("\0".join(texts) + "\0").encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    doc_of = np.repeat(np.arange(len(texts), dtype=np.int64), lens)
+    ok = _valid_mask(cp)
+    digit = (cp >= 0x30) & (cp <= 0x39)
+    docs, codes = [], []
+    for k in ngrams:
+        m = len(cp) - k + 1
+        if m <= 0:
+            continue
+        win, num, code = ok[:m].copy(), digit[:m].copy(), cp[:m].copy()
+        for j in range(1, k):
+            win &= ok[j:j + m]
+            num &= digit[j:j + m]
+            code = (code << np.uint64(_BITS)) | cp[j:j + m]
+        keep = win & ~num        # 숫자로만 된 조각은 버림
+        docs.append(doc_of[:m][keep])
+        codes.append(code[keep])
+    if not docs:   # 묶음이 어떤 n보다도 짧음(예: 빈 제목 한 줄)
+        return np.zeros(0, np.int64), np.zeros(0, np.uint64), np.zeros(0, np.int64)
+    d = np.concatenate(docs)
+    c = np.concatenate(codes)
+    order = np.lexsort((c, d))
+    d, c = d[order], c[order]
+    first = np.ones(len(d), dtype=bool)
+    first[1:] = (d[1:] != d[:-1]) | (c[1:] != c[:-1])
+    idx = np.flatnonzero(first)
+    return d[idx], c[idx], np.diff(np.append(idx, len(d)))
+
+
+def _decode(code: int) -> str:
+    chars = []
+    while code:
+        chars.append(chr(code & ((1 << _BITS) - 1)))
+        code >>= _BITS
+    return "".join(reversed(chars))
+
+
+class TfIdf:
+    """
+    CSR 배열(indptr/indices/data)로 들고 있는 문서×n-gram TF-IDF(행마다 L2 정규화).
+    vocab은 n-gram을 묶은 정수 코드(표시할 때만 문자열로 풂).
+    """
+
+    def __init__(self, texts, ngrams=NGRAMS, min_df=MIN_DF, max_df=MAX_DF, max_chars=MAX_CHARS):
+        if np is None:
+            raise RuntimeError("분석에는 numpy가 필요합니다. 'pip install numpy'를 실행하세요.")
+        texts = [(t or "")[:max_chars].lower() for t in texts]
+        self.n_docs = n = len(texts)
+        lens = np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=n)
+        docs, codes, tfs = [], [], []
+        for a, b in _chunks(lens, CHUNK_CHARS):
+            d, c, f = _ngram_counts(texts[a:b], lens[a:b], ngrams)
+            docs.append(d + a); codes.append(c); tfs.append(f)
+        rows = np.concatenate(docs) if docs else np.zeros(0, np.int64)
+        tf = np.concatenate(tfs) if tfs else np.zeros(0, np.int64)
+        vocab, cols = np.unique(np.concatenate(codes) if codes else np.zeros(0, np.uint64), return_inverse=True)
+        v = len(vocab)
+
+        # 문서 빈도로 어휘 거르기(너무 드문/흔한 n-gram)
+        df = np.bincount(cols, minlength=v)
+        good = df >= min(min_df, max(1, n // 2))
+        if n >= 4:
+            good &= df <= max(1, int(max_df * n))
+        remap = np.cumsum(good) - 1
+        sel = good[cols]
+        rows, cols, tf = rows[sel], remap[cols[sel]], tf[sel]
+        self.vocab = vocab[good]
+        self.df = df[good]
+
+        self.idf = np.log((1 + n) / (1 + self.df)) + 1.0
+        w = (1.0 + np.log(tf)) * self.idf[cols]
+        norm = np.sqrt(np.bincount(rows, weights=w * w, minlength=n))
+        w = w / np.where(norm > 0, norm, 1.0)[rows]
+        self.rows, self.indices, self.data = rows, cols, w.astype(np.float32)
+        self.indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=n))))
+
+    def term(self, j) -> str:
+        return _decode(int(self.vocab[j]))
+
+    # ---- 상위 n-gram 고르기 ----
+    def _pick(self, cols, k, names=None) -> list:
+        """
+        점수 순 후보 열 → 상위 k개 열. 겹치는 조각은 하나로: 이미 고른 n-gram의 일부면 건너뛰고,
+        고른 것을 품는 더 긴 n-gram이면 그 자리를 대신함(배터/터리 → 배터리).
+        """
+        out, text = [], []
+        for j in cols:
+            t = names[j] if names is not None else self.term(j)
+            if any(t in o for o in text):
+                continue
+            inner = [i for i, o in enumerate(text) if o in t]
+            if inner:
+                out[inner[0]], text[inner[0]] = j, t
+                for i in reversed(inner[1:]):
+                    del out[i], text[i]
+                continue
+            if len(out) < k:
+                out.append(j); text.append(t)
+        return out
+
+    def _top_per_row(self, rows, cols, score, n_rows, k):
+        """(행, 열, 점수) → 행마다 점수 상위 후보 열(배열 정렬 한 번)"""
+        order = np.lexsort((-score, rows))
+        rows, cols = rows[order], cols[order]
+        start = np.searchsorted(rows, np.arange(n_rows))
+        rank = np.arange(len(rows)) - start[rows]
+        cand = rank < k * 4                      # 중복 조각을 건너뛸 여유
+        rows, cols = rows[cand], cols[cand]
+        bounds = np.searchsorted(rows, np.arange(n_rows + 1))
+        names = {j: self.term(j) for j in np.unique(cols).tolist()}   # 후보 n-gram만 한 번씩 풂
+        cols = cols.tolist()
+        return [[names[j] for j in self._pick(cols[bounds[i]:bounds[i + 1]], k, names)] for i in range(n_rows)]
+
+    def top_terms(self, k=TOP_ITEM) -> list:
+        """문서마다 상위 n-gram 목록"""
+        return self._top_per_row(self.rows, self.indices, self.data, self.n_docs, k)
+
+    def _sum_by(self, labels, n_labels):
+        """문서 라벨별 n-gram 가중치 합 → (라벨, 열, 합) 배열"""
+        lab = labels[self.rows]
+        keep = lab >= 0
+        lab, cols, w = lab[keep], self.indices[keep], self.data[keep].astype(np.float64)
+        v = len(self.vocab)
+        if sp is not None:
+            m = sp.coo_matrix((w, (lab, cols)), shape=(n_labels, v)).tocsr().tocoo()
+            return m.row.astype(np.int64), m.col.astype(np.int64), m.data
+        key, inv = np.unique(lab * v + cols, return_inverse=True)
+        return key // v, key % v, np.bincount(inv, weights=w)
+
+    def group_top(self, groups, k=TOP_GROUP) -> list:
+        """
+        groups: 문서별 그룹 이름. [{"group", "docs", "terms"}] — 그룹 안 문서들의 평균 가중치 순.
+        """
+        names, gid = np.unique(np.array([str(g or "") for g in groups]), return_inverse=True)
+        sizes = np.bincount(gid, minlength=len(names))
+        g, cols, s = self._sum_by(gid.astype(np.int64), len(names))
+        tops = self._top_per_row(g, cols, s / sizes[g], len(names), k)
+        out = [{"group": str(names[i]), "docs": int(sizes[i]), "terms": tops[i]} for i in range(len(names))]
+        out.sort(key=lambda r: r["docs"], reverse=True)
+        return out
+
+    def trends(self, dates, k=TOP_TREND) -> dict:
+        """
+        dates: 문서별 datetime(없으면 None). 전체 상위 k개 n-gram이 기간마다 몇 %의 문서에 나왔는지.
+        기간 단위는 날짜 범위에 맞춰 일/주/월. {"unit", "terms", "rows": [{"period", "docs", term: 비율...}]}
+        """
+        ts = np.array([d.timestamp() if d else np.nan for d in dates], dtype=np.float64)
+        have = ~np.isnan(ts)
+        if not have.any():
+            return {"unit": "", "terms": [], "rows": []}
+        span_days = (np.nanmax(ts) - np.nanmin(ts)) / 86400
+        unit = "day" if span_days <= 31 else ("week" if span_days <= 190 else "month")
+        keys = [_period(d, unit) if d else None for d in dates]
+        periods, pid = np.unique(np.array([p or "" for p in keys]), return_inverse=True)
+        pid = np.where(have, pid, -1).astype(np.int64)
+
+        # 날짜가 있는 문서에서의 상위 n-gram
+        total = np.bincount(self.indices, weights=self.data * have[self.rows], minlength=len(self.vocab))
+        cand = np.argsort(-total)[:k * 4]
+        picked = self._pick(cand[total[cand] > 0].tolist(), k)
+        seen = [self.term(j) for j in picked]
+        docs_per = np.bincount(pid[pid >= 0], minlength=len(periods))
+        col_pos = np.full(len(self.vocab), -1, dtype=np.int64)
+        col_pos[picked] = np.arange(len(picked))
+        hit = col_pos[self.indices] >= 0
+        p = pid[self.rows[hit]]
+        c = col_pos[self.indices[hit]]
+        ok = p >= 0
+        counts = np.bincount(p[ok] * len(picked) + c[ok], minlength=len(periods) * len(picked))
+        counts = counts.reshape(len(periods), len(picked))
+        rows = []
+        for i, name in enumerate(periods):
+            if not name or not docs_per[i]:
+                continue
+            share = counts[i] / docs_per[i]
+            rows.append(dict({"period": str(name), "docs": int(docs_per[i])},
+                             **{seen[x]: round(float(share[x]) * 100, 1) for x in range(len(picked))}))
+        return {"unit": unit, "terms": seen, "rows": rows}
+
+
+def _period(d: datetime, unit: str) -> str:
+    if unit == "day":
+        return d.strftime("%Y-%m-%d")
+    if unit == "week":
+        y, w, _ = d.isocalendar()
+        return f"{y}-W{w:02d}"
+    return d.strftime("%Y-%m")
+
+
+def parse_date(v):
+    """DateISO('2024-05-01 13:00:00') / upload_date('2024-05-01 00:00:00' 또는 '20240501') → datetime"""
+    if not v:
+        return None
+    s = str(v).strip()
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(s[:19] if "-" in s else s[:8], fmt)
+        except ValueError:
+            continue
+    m = re.match(r"(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})", s)
+    return datetime(int(m[1]), int(m[2]), int(m[3])) if m else None
+
+
+def _getter(key):
+    return key if callable(key) else (lambda r: r.get(key))
+
+
+def analyze(rows, text_keys, group_key=None, date_key=None, top_item=TOP_ITEM):
+    """
+    결과 행(dict) 목록 → {"docs", "vocab", "item_terms", "groups", "trends"}.
+    text_keys: 이어 붙여 분석할 칸(예: ("title", "caption")).
+    group_key/date_key: 그룹/날짜 칸 이름 또는 행 → 값 함수(없으면 생략).
+    """
+    texts = [" ".join(str(r.get(k) or "") for k in text_keys) for r in rows]
+    m = TfIdf(texts)
+    out = {"docs": m.n_docs, "vocab": len(m.vocab), "item_terms": m.top_terms(top_item)}
+    out["groups"] = m.group_top(list(map(_getter(group_key), rows))) if group_key else []
+    out["trends"] = m.trends([parse_date(v) for v in map(_getter(date_key), rows)]) if date_key else \
+        {"unit": "", "terms": [], "rows": []}
+    return out
+
+
+def analysis_sheets(result, items=None) -> dict:
+    """
+    analyze 결과 → {시트 이름: (열 목록, 행 목록)} — 엑셀 추가 시트용.
+    items=(열 목록, 행마다 값 목록)을 주면 항목별 키워드 시트도(본문 시트에 칸을 못 붙일 때).
+    """
+    sheets = {}
+    if items is not None:
+        cols, vals = items
+        sheets["분석_항목"] = (list(cols) + ["키워드"],
+                             [list(v) + [", ".join(t)] for v, t in zip(vals, result["item_terms"])])
+    if result["groups"]:
+        sheets["분석_그룹"] = (["그룹", "문서 수", "상위 키워드"],
+                             [[g["group"], g["docs"], ", ".join(g["terms"])] for g in result["groups"]])
+    tr = result["trends"]
+    if tr["rows"] and tr["terms"]:
+        unit = {"day": "일", "week": "주", "month": "월"}[tr["unit"]]
+        sheets["분석_추세"] = ([f"기간({unit})", "문서 수"] + [f"{t} (%)" for t in tr["terms"]],
+                             [[r["period"], r["docs"]] + [r[t] for t in tr["terms"]] for r in tr["rows"]])
+    return sheets
@@ -0,0 +1,157 @@
+# thumbnail_service.py
+"""
+YouTube 썸네일 공용 로더.
+- 스레드 풀(기본 6개) + keep-alive 세션 하나로 받음(행마다 스레드/TLS 연결을 새로 만들지 않음)
+- 표 칸(176x116)에는 mqdefault(320x180)면 충분 — hqdefault(480x360)보다 작고 레터박스 없음
+- 디스크 캐시: video_id.jpg, 전체 크기 상한을 넘으면 오래 안 쓴 파일부터 삭제
+- 디코딩/축소는 워커 스레드에서 QImage로, QPixmap 변환만 GUI 스레드에서
+- 변환된 QPixmap은 메모리 LRU에 보관(같은 영상이 다시 검색되면 즉시 표시)
+"""
+import os, threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from PySide6.QtCore import Qt, QObject, Signal, QSize, QCoreApplication
+from PySide6.QtGui import QImage, QPixmap
+
+from yt_cache import CACHE_ROOT
+
+THUMB_DIR = os.path.join(CACHE_ROOT, "thumbs")
+# 환경변수로 조절: YT_THUMB_WORKERS=8, YT_THUMB_CACHE_MB=200
+THUMB_WORKERS = int(os.environ.get("YT_THUMB_WORKERS", "6"))
+DISK_MAX_BYTES = int(os.environ.get("YT_THUMB_CACHE_MB", "100")) * 1024 * 1024
+MEMORY_ITEMS = 600
+THUMB_SIZE = QSize(172, 112)
+
+_VARIANTS = ("mqdefault", "hqdefault")   # mqdefault가 없을 때만 hqdefault
+
+
+class ThumbnailService(QObject):
+    ready = Signal(str, QPixmap)   # video_id, 표시용 pixmap
+    _decoded = Signal(str, QImage) # 워커 → GUI 스레드
+
+    def __init__(self, parent=None, workers=THUMB_WORKERS, cache_dir=THUMB_DIR, disk_max_bytes=DISK_MAX_BYTES):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.disk_max_bytes = disk_max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yt-thumb")
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=workers)
+        self._session.mount("https://", adapter)
+        self._memory = OrderedDict()   # video_id -> QPixmap (GUI 스레드에서만 접근)
+        self._inflight = {}            # video_id -> Future
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._decoded.connect(self._on_decoded)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def request(self, vid):
+        """메모리에 있으면 QPixmap을 바로 돌려주고, 없으면 받아서 ready로 알림(None 반환)"""
+        pm = self._memory.get(vid)
+        if pm is not None:
+            self._memory.move_to_end(vid)
+            return pm
+        with self._lock:
+            if vid not in self._inflight:
+                self._inflight[vid] = self._pool.submit(self._load, vid)
+        return None
+
+    def cancel_pending(self):
+        """아직 시작하지 않은 요청 취소(새 검색 시)"""
+        with self._lock:
+            for vid, fut in list(self._inflight.items()):
+                if fut.cancel():
+                    del self._inflight[vid]
+
+    def shutdown(self):
+        self.cancel_pending()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+
+    # ---- 워커 스레드 ----
+    def _path(self, vid):
+        return os.path.join(self.cache_dir, f"{vid}.jpg")
+
+    def _load(self, vid):
+        try:
+            data = self._read_disk(vid) or self._download(vid)
+            if not data:
+                return
+            img = QImage.fromData(data)
+            if img.isNull():
+                return
+            self._decoded.emit(vid, img.scaled(THUMB_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        except Exception as e:
+            print(f"이미지 로드 실패: {e}")
+        finally:
+            with self._lock:
+                self._inflight.pop(vid, None)
+
+    def _read_disk(self, vid):
+        p = self._path(vid)
+        try:
+            with open(p, "rb") as f:
+                data = f.read()
+            os.utime(p)   # 최근 사용 표시(LRU)
+            return data
+        except OSError:
+            return None
+
+    def _download(self, vid):
+        for name in _VARIANTS:
+            r = self._session.get(f"https://i.ytimg.com/vi/{vid}/{name}.jpg", timeout=10)
+            if r.status_code == 200 and r.content:
+                self._write_disk(vid, r.content)
+                return r.content
+        return None
+
+    def _write_disk(self, vid, data):
+        tmp = self._path(vid) + ".part"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(vid))
+        except OSError:
+            return
+        with self._lock:
+            self._writes += 1
+            check = self._writes % 100 == 1
+        if check:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """상한의 90%까지 mtime이 오래된 파일부터 삭제"""
+        try:
+            files = []
+            for e in os.scandir(self.cache_dir):
+                if e.is_file() and e.name.endswith(".jpg"):
+                    st = e.stat()
+                    files.append((st.st_mtime, st.st_size, e.path))
+        except OSError:
+            return
+        total = sum(f[1] for f in files)
+        if total <= self.disk_max_bytes:
+            return
+        target = int(self.disk_max_bytes * 0.9)
+        for _, size, path in sorted(files):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    # ---- GUI 스레드 ----
+    def _on_decoded(self, vid, img):
+        pm = QPixmap.fromImage(img)
+        self._memory[vid] = pm
+        self._memory.move_to_end(vid)
+        while len(self._memory) > MEMORY_ITEMS:
+            self._memory.popitem(last=False)
+        self.ready.emit(vid, pm)
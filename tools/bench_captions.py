@@ -0,0 +1,51 @@
+# tools/bench_captions.py
+"""
+자막 엔진의 영상당 HTTP 요청 수/소요 시간 측정(실제 YouTube 접속 필요).
+
+  python tools/bench_captions.py "키워드" [--count 20] [--json out.json]
+  python tools/bench_captions.py --ids VIDEO_ID [VIDEO_ID ...]
+
+저장소 캐시를 거치지 않도록 임시 저장소로 바꿔서 측정한다.
+http_requests는 공용 세션 훅으로 센 실제 응답 수(youtube-transcript-api 0.6에서는 추정치).
+"""
+import os, sys, time, json, argparse, tempfile, statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytube_util as pu  # noqa: E402
+import transcript_store as ts  # noqa: E402
+
+
+def main():
+    ap = argparse.ArgumentParser(description="자막 엔진 영상당 HTTP 요청 수 측정")
+    ap.add_argument("keyword", nargs="?")
+    ap.add_argument("--count", type=int, default=20)
+    ap.add_argument("--ids", nargs="*")
+    ap.add_argument("--json", help="결과 JSON 저장 경로")
+    args = ap.parse_args()
+
+    ids = args.ids or [r["video_id"] for r in pu.search_page(args.keyword, 0, args.count)]
+    if not ids:
+        raise SystemExit("키워드 또는 --ids가 필요합니다.")
+
+    tmp = tempfile.mkdtemp()
+    ts.STORE = ts.TranscriptStore(os.path.join(tmp, "bench.sqlite3"), legacy_dir=os.path.join(tmp, "none"))
+
+    lat, by_status = [], {}
+    for vid in ids:
+        t0 = time.perf_counter()
+        _, status = pu.fetch_caption(vid)
+        lat.append(time.perf_counter() - t0)
+        by_status[status] = by_status.get(status, 0) + 1
+    report = dict(pu.caption_http_stats(), by_status=by_status,
+                  latency_median_s=round(statistics.median(lat), 3),
+                  session_api=pu._transcript_api() is not None)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
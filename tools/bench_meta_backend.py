@@ -0,0 +1,83 @@
+# tools/bench_meta_backend.py
+"""
+상세 추출 백엔드 비교: 스레드 풀 vs 프로세스 풀(yt_procpool) (실제 YouTube 접속 필요).
+
+  python tools/bench_meta_backend.py "키워드" [--count 96] [--workers 4 8 16 24] [--json out.json]
+
+같은 영상 ID 목록을 워커 수별로 두 백엔드에서 캐시 없이 추출한다.
+프로세스 풀은 측정 전에 모든 자식을 띄워 두고(spawn+import 비용은 spawn_s로 따로 표시),
+CPU 사용률 = (부모+자식 CPU 시간) / 경과 시간 — 1.0을 넘으면 코어 여러 개를 쓰고 있다는 뜻.
+스레드가 GIL에 막히는 구간은 workers를 늘려도 videos_per_s가 오르지 않고 cpu_util이 1 근처에 머문다.
+"""
+import os, sys, time, json, argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytube_util as pu  # noqa: E402
+import yt_procpool  # noqa: E402
+
+
+def _cpu():
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def _run(ids, workers, backend):
+    spawn = 0.0
+    if backend == "process":
+        t0 = time.perf_counter()
+        yt_procpool.warm_up()
+        spawn = time.perf_counter() - t0
+    else:
+        pu._get_detail_pool()
+    ok = failed = 0
+    first = None
+    c0, t0 = _cpu(), time.perf_counter()
+    for _, _, good in pu.iter_video_details(ids, workers, use_cache=False, backend=backend):
+        if first is None:
+            first = time.perf_counter() - t0
+        ok += good
+        failed += not good
+    wall = time.perf_counter() - t0
+    # 자식 프로세스 CPU 시간은 종료 후에야 children_*에 잡히므로 풀을 닫고 잼
+    if backend == "process":
+        yt_procpool.shutdown(wait=True)
+    cpu = _cpu() - c0
+    return {
+        "wall_s": round(wall, 2),
+        "videos_per_s": round(len(ids) / wall, 2),
+        "first_row_s": round(first or 0, 3),
+        "cpu_util": round(cpu / wall, 2),
+        "spawn_s": round(spawn, 2),
+        "ok": ok, "failed": failed,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="상세 추출 스레드/프로세스 백엔드 처리량 비교")
+    ap.add_argument("keyword")
+    ap.add_argument("--count", type=int, default=96)
+    ap.add_argument("--workers", type=int, nargs="+", default=[4, 8, 16, 24])
+    ap.add_argument("--json", help="결과 JSON 저장 경로")
+    args = ap.parse_args()
+
+    ids = [r["video_id"] for r in pu.search_page(args.keyword, 0, args.count)]
+    print(f"영상 {len(ids)}개 | CPU {os.cpu_count()}개 | 자식 프로세스 {yt_procpool.PROCESSES}개")
+
+    report = {"keyword": args.keyword, "videos": len(ids), "cpus": os.cpu_count(),
+              "processes": yt_procpool.PROCESSES, "results": []}
+    for w in args.workers:
+        thread = _run(ids, w, "thread")
+        process = _run(ids, w, "process")
+        report["results"].append({"workers": w, "thread": thread, "process": process})
+        print(f"workers={w:>2} | thread  {thread}\n           | process {process}")
+    best = max(report["results"], key=lambda r: r["process"]["videos_per_s"] / max(r["thread"]["videos_per_s"], 1e-9))
+    print(f"프로세스/스레드 처리량 비가 가장 큰 워커 수: {best['workers']}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
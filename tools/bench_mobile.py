@@ -0,0 +1,160 @@
+# tools/bench_mobile.py
+"""
+모바일 모드(m.dcinside.com / m.fmkorea.com) 점검·비교 도구.
+
+  python tools/bench_mobile.py
+      → tools/fixtures/mobile/*.html 로 파서 점검(오프라인).
+        모바일 목록에서 뽑은 Link가 데스크톱 목록의 Link와 같은지 대조하고,
+        HTML 크기와 파싱 시간을 비교한다.
+
+  python tools/bench_mobile.py --live URL [URL ...] [--repeat 3] [--driver]
+      → 데스크톱 목록 URL과 대응하는 모바일 URL을 실제로 받아 바이트/지연을 비교.
+        기본은 HTTP(HTML 문서만), --driver는 크롬으로 열어 하위 리소스까지 합산
+        (performance API transferSize, 모바일은 이미지 차단 상태 그대로).
+"""
+import os, sys, time, json, argparse, statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import crawling as cr  # noqa: E402
+from fetch_scheduler import HEADERS  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tools", "fixtures", "mobile")
+
+
+def _read(name):
+    with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _time_parse(fn, html, n=200):
+    t0 = time.perf_counter()
+    for _ in range(n):
+        out = fn(html)
+    return out, (time.perf_counter() - t0) / n * 1000
+
+
+def _dc_post_key(link):
+    # 데스크톱 목록 링크에는 page 등 부가 파라미터가 붙으므로 id/no만 비교
+    q = cr.parse_qs(cr.urlparse(link).query)
+    return (q.get("id") or [""])[0], (q.get("no") or [""])[0]
+
+
+def check_fixtures():
+    ok = True
+
+    # DCInside: 데스크톱 목록 vs 모바일 목록
+    d_html, m_html = _read("dc_desktop_list.html"), _read("dc_mobile_list.html")
+    desk, d_ms = _time_parse(lambda h: cr.dc_parse_list_html(h, "https://gall.dcinside.com/board/lists/?id=programming"), d_html)
+    mob, m_ms = _time_parse(lambda h: cr.dc_parse_mobile_list_html(h, "https://m.dcinside.com/board/programming"), m_html)
+    print(f"[DC] desktop {len(d_html.encode()):>6} B, {len(desk)}행, 파싱 {d_ms:.3f}ms")
+    print(f"[DC] mobile  {len(m_html.encode()):>6} B, {len(mob)}행, 파싱 {m_ms:.3f}ms")
+    d_links = {_dc_post_key(r["Link"]) for r in desk}
+    for r in mob:
+        hit = _dc_post_key(r["Link"]) in d_links
+        ok &= hit
+        print(f"  {'OK ' if hit else 'MISS'} {r['Link']} | {r['Title']} | {r['Date']} | 조회 {r['Views']}")
+    if len(mob) != len(desk):
+        ok = False
+        print(f"  행 수 불일치: desktop {len(desk)} / mobile {len(mob)}")
+
+    # FMKorea: 모바일 목록 → 데스크톱 정규 링크, 모바일 상세
+    links = cr.fmk_parse_mobile_list_html(_read("fmk_mobile_list.html"), "https://m.fmkorea.com/best")
+    print(f"[FMK] mobile list {len(links)}개")
+    for href in links:
+        print(f"  {href} → {cr.fmk_to_desktop_link(href)}")
+    expect = {"https://www.fmkorea.com/7654321", "https://www.fmkorea.com/7654300"}
+    if {cr.fmk_to_desktop_link(h) for h in links} != expect:
+        ok = False
+        print("  링크 매핑 불일치")
+    title, date_text, views = cr.fmk_parse_mobile_detail_html(_read("fmk_mobile_detail.html"))
+    print(f"[FMK] mobile detail: {title} | {date_text} | 조회 {views}")
+    if not (cr.parse_dt_dot(date_text) and views == 12345 and title.startswith("포텐:")):
+        ok = False
+        print("  상세 파싱 불일치")
+
+    print("픽스처 점검:", "통과" if ok else "실패")
+    return ok
+
+
+def _mobile_url(url):
+    host = cr.urlparse(url).netloc.lower()
+    if "dcinside.com" in host:
+        return cr.dc_to_mobile_url(url)
+    if "fmkorea.com" in host:
+        return cr.fmk_to_mobile_url(url)
+    raise SystemExit(f"지원하지 않는 URL: {url}")
+
+
+def _measure_http(url, mobile, repeat):
+    import httpx
+    ua = cr.MOBILE_UA if mobile else HEADERS["User-Agent"]
+    lat, size, wire, status = [], 0, 0, None
+    with httpx.Client(headers={"User-Agent": ua, "Accept-Language": "ko-KR,ko;q=0.9"},
+                      follow_redirects=True, timeout=20) as c:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            r = c.get(url)
+            lat.append((time.perf_counter() - t0) * 1000)
+            size, wire, status = len(r.content), r.num_bytes_downloaded, r.status_code
+    return {"status": status, "html_bytes": size, "wire_bytes": wire,
+            "latency_ms_median": round(statistics.median(lat), 1)}
+
+
+_TRANSFER_JS = (
+    "const n = performance.getEntriesByType('navigation')[0];"
+    "const r = performance.getEntriesByType('resource');"
+    "return {bytes: (n ? n.transferSize : 0) + r.reduce((a, e) => a + (e.transferSize || 0), 0),"
+    " requests: r.length + 1, load_ms: n ? n.loadEventEnd - n.startTime : 0};"
+)
+
+
+def _measure_driver(url, mobile, repeat):
+    driver = cr.initialize_driver(False, mobile=mobile)
+    try:
+        runs = []
+        for _ in range(repeat):
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            driver.get(url)
+            runs.append(driver.execute_script(_TRANSFER_JS))
+        return {"transfer_bytes": int(statistics.median(r["bytes"] for r in runs)),
+                "requests": int(statistics.median(r["requests"] for r in runs)),
+                "load_ms_median": round(statistics.median(r["load_ms"] for r in runs), 1)}
+    finally:
+        cr.quit_driver(driver)
+
+
+def compare_live(urls, repeat, use_driver):
+    measure = _measure_driver if use_driver else _measure_http
+    report = []
+    for url in urls:
+        m_url = _mobile_url(url)
+        desk = measure(url, False, repeat)
+        mob = measure(m_url, True, repeat)
+        report.append({"desktop_url": url, "mobile_url": m_url, "desktop": desk, "mobile": mob})
+        key = "transfer_bytes" if use_driver else "wire_bytes"
+        ratio = mob[key] / desk[key] if desk.get(key) else float("nan")
+        print(f"{url}\n  desktop {desk}\n  mobile  {mob}\n  바이트 비율(mobile/desktop) = {ratio:.2f}")
+    return report
+
+
+def main():
+    ap = argparse.ArgumentParser(description="모바일 모드 픽스처 점검 / 데스크톱 대비 바이트·지연 비교")
+    ap.add_argument("--live", nargs="*", metavar="URL", help="데스크톱 목록 URL(들)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--driver", action="store_true", help="크롬으로 측정(하위 리소스 포함)")
+    ap.add_argument("--json", help="결과 JSON 저장 경로")
+    args = ap.parse_args()
+
+    if args.live:
+        report = compare_live(args.live, args.repeat, args.driver)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+    else:
+        sys.exit(0 if check_fixtures() else 1)
+
+
+if __name__ == "__main__":
+    main()
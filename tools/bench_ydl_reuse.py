@@ -0,0 +1,90 @@
+# tools/bench_ydl_reuse.py
+"""
+상세 추출 시 YoutubeDL 재사용 효과 측정(실제 YouTube 접속 필요).
+
+  python tools/bench_ydl_reuse.py "키워드" [--count 48] [--workers 4 12 24] [--json out.json]
+
+같은 영상 ID 목록을 두 방식으로 추출한다.
+  fresh : 영상마다 YoutubeDL(YDL_DETAIL)을 새로 생성(이전 방식)
+  reuse : 스레드별 YoutubeDL 재사용(pytube_util._extract_detail)
+영상당 오버헤드 = (워커 수 × 전체 소요) / 영상 수 — 워커 한 개가 영상 하나에 쓰는 평균 시간.
+두 방식 모두 jitter(0.02~0.12초)는 같게 적용된다.
+"""
+import os, sys, time, json, random, argparse, statistics
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytube_util as pu  # noqa: E402
+from yt_dlp import YoutubeDL  # noqa: E402
+
+
+def _fresh(vid):
+    time.sleep(random.uniform(0.02, 0.12))
+    t0 = time.perf_counter()
+    with YoutubeDL(pu.YDL_DETAIL) as ydl:
+        ydl.extract_info(f"https://www.youtube.com/watch?v={vid}", download=False)
+    return time.perf_counter() - t0
+
+
+def _reuse(vid):
+    time.sleep(random.uniform(0.02, 0.12))
+    t0 = time.perf_counter()
+    pu._ydl_extract(pu.YDL_DETAIL, f"https://www.youtube.com/watch?v={vid}")
+    return time.perf_counter() - t0
+
+
+def _run(fn, ids, workers):
+    lat, errors = [], 0
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futs = [ex.submit(fn, v) for v in ids]
+        for f in futs:
+            try:
+                lat.append(f.result())
+            except Exception:
+                errors += 1
+    wall = time.perf_counter() - t0
+    return {
+        "wall_s": round(wall, 2),
+        "videos_per_s": round(len(ids) / wall, 2),
+        "per_video_overhead_s": round(workers * wall / len(ids), 3),
+        "extract_median_s": round(statistics.median(lat), 3) if lat else None,
+        "errors": errors,
+    }
+
+
+def _construct_cost(n=20):
+    t0 = time.perf_counter()
+    for _ in range(n):
+        with YoutubeDL(pu.YDL_DETAIL):
+            pass
+    return (time.perf_counter() - t0) / n
+
+
+def main():
+    ap = argparse.ArgumentParser(description="YoutubeDL 재사용 전/후 영상당 오버헤드 비교")
+    ap.add_argument("keyword")
+    ap.add_argument("--count", type=int, default=48)
+    ap.add_argument("--workers", type=int, nargs="+", default=[4, 12, 24])
+    ap.add_argument("--json", help="결과 JSON 저장 경로")
+    args = ap.parse_args()
+
+    ids = [r["video_id"] for r in pu.search_page(args.keyword, 0, args.count)]
+    print(f"영상 {len(ids)}개 | YoutubeDL 생성 비용 ≈ {_construct_cost() * 1000:.1f}ms/회")
+
+    report = {"keyword": args.keyword, "videos": len(ids), "results": []}
+    for w in args.workers:
+        # 스레드별 인스턴스를 새로 시작하도록 풀마다 새 executor 사용
+        fresh = _run(_fresh, ids, w)
+        reuse = _run(_reuse, ids, w)
+        report["results"].append({"workers": w, "fresh": fresh, "reuse": reuse})
+        print(f"workers={w:>2} | fresh {fresh} \n           | reuse {reuse}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+# tools/bench_youtube.py
+"""
+YouTube 메타데이터/자막 파이프라인 오프라인 벤치마크(네트워크 없이, 버전 간 비교용).
+
+  python tools/bench_youtube.py [--workers 4 8 16 adaptive] [--sizes 20 50 100]
+                                [--latency-ms 150] [--jitter-ms 100] [--p429 0.02]
+                                [--caption-latency-ms 200] [--p-no-caption 0.1] [--json out.json]
+
+yt-dlp와 youtube-transcript-api를 이 파일의 가짜 모듈로 바꿔 끼운 뒤 pytube_util을 import한다.
+가짜 백엔드는 요청마다 지연(평균 ± jitter, 균등분포)을 두고 p429 확률로 429를 던진다
+(검색은 20개 페이지마다 --search-page-ms 지연, 429 없음). 같은 --seed면 같은 영상/실패 패턴.
+캐시는 임시 폴더(LOCALAPPDATA)에 만들어 실제 캐시를 건드리지 않고, 끝나면 지운다(--keep-cache면 남김).
+
+칸(workers × sizes)마다 새 키워드로:
+  meta cold : search_page → iter_video_details(상세 max_workers=workers, adaptive면 자동 조절)
+  meta warm : 같은 키워드 다시(검색/메타 캐시 적중)
+  caption cold/warm : 같은 영상들을 workers개 스레드로 fetch_caption(get_caption_for_url의 본체)
+지표: wall_s(끝까지), first_row_s, rows_per_s, 행 도착 시각 p50/p95, 실패 수,
+      캐시 적중률(검색/메타/자막 저장소), peak_mb(tracemalloc — --no-memory로 끔).
+프로세스 백엔드는 자식 프로세스에 가짜 모듈이 없으므로 측정하지 않는다.
+"""
+import os, sys, time, json, random, shutil, base64, hashlib, argparse, tempfile, threading, subprocess, types
+import atexit, tracemalloc
+from itertools import count
+from urllib.parse import urlparse, parse_qs
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PAGE = 20
+
+
+# ---------- 가짜 백엔드 ----------
+class FakeNet:
+    """요청 하나 = 지연 + 확률적 429. 영상별 결과(자막 유무)는 seed로 고정."""
+
+    def __init__(self, latency_ms, jitter_ms, p429, seed):
+        self.latency, self.jitter, self.p429, self.seed = latency_ms / 1000, jitter_ms / 1000, p429, seed
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = self.throttled = 0
+
+    def call(self, exc=None):
+        with self._lock:
+            self.calls += 1
+            delay = max(0.0, self._rng.uniform(self.latency - self.jitter, self.latency + self.jitter))
+            hit = self._rng.random() < self.p429
+            self.throttled += hit
+        time.sleep(delay)
+        if hit:
+            raise (exc or RuntimeError)("HTTP Error 429: Too Many Requests")
+
+    def stable(self, key) -> float:
+        """같은 key면 항상 같은 [0, 1) 값"""
+        h = hashlib.sha1(f"{self.seed}/{key}".encode()).digest()
+        return int.from_bytes(h[:4], "big") / 2 ** 32
+
+
+def fake_vid(keyword, i) -> str:
+    return base64.urlsafe_b64encode(hashlib.sha1(f"{keyword}/{i}".encode()).digest()[:8]).decode()[:11]
+
+
+def install_fakes(meta_net, search_net, cap_net, p_no_caption, caption_lines):
+    """sys.modules에 yt_dlp / youtube_transcript_api 가짜를 넣음(pytube_util import 전에 호출)"""
+    yd = types.ModuleType("yt_dlp")
+
+    class DownloadError(Exception):
+        pass
+
+    def _info(vid):
+        ch = int(meta_net.stable(vid) * 50)
+        return {"id": vid, "webpage_url": f"https://www.youtube.com/watch?v={vid}",
+                "thumbnail": f"https://img.youtube.com/vi/{vid}/hqdefault.jpg",
+                "title": f"벤치 영상 {vid}", "channel": f"채널{ch}", "uploader": f"채널{ch}",
+                "channel_id": f"UCbench{ch:016d}", "view_count": int(meta_net.stable(vid + "v") * 1e6),
+                "channel_follower_count": 1000 + ch * 37, "upload_date": "20240101",
+                "formats": [{"format_id": str(i), "url": "x" * 200} for i in range(20)]}
+
+    def _entries(keyword):
+        for i in count():
+            if i % PAGE == 0:
+                search_net.call()
+            vid = fake_vid(keyword, i)
+            ch = int(meta_net.stable(vid) * 50)
+            yield {"id": vid, "url": f"https://www.youtube.com/watch?v={vid}", "title": f"벤치 영상 {vid}",
+                   "channel": f"채널{ch}", "channel_id": f"UCbench{ch:016d}",
+                   "view_count": int(meta_net.stable(vid + "v") * 1e6)}
+
+    class YoutubeDL:
+        def __init__(self, opts=None):
+            self.opts = opts or {}
+
+        def extract_info(self, url, download=False, process=True):
+            if "/results?" in url:
+                return {"entries": _entries(parse_qs(urlparse(url).query)["search_query"][0])}
+            meta_net.call(DownloadError)
+            if "/channel/" in url:
+                cid = url.rstrip("/").split("/")[-1]
+                return {"channel_id": cid, "channel": cid, "channel_follower_count": 1234}
+            return _info(parse_qs(urlparse(url).query).get("v", [url[-11:]])[0])
+
+        def close(self):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.close()
+
+    yd.YoutubeDL, yd.DownloadError = YoutubeDL, DownloadError
+
+    ta = types.ModuleType("youtube_transcript_api")
+
+    class TranscriptsDisabled(Exception):
+        pass
+
+    class NoTranscriptFound(Exception):
+        pass
+
+    class TooManyRequests(Exception):
+        pass
+
+    class Transcript:
+        language_code, is_generated, is_translatable = "ko", True, False
+
+        def __init__(self, vid):
+            self.vid = vid
+
+        def fetch(self):
+            cap_net.call(TooManyRequests)
+            return [{"text": f"{self.vid} 자막 {i}번째 문장입니다", "start": i * 2.0, "duration": 2.0}
+                    for i in range(caption_lines)]
+
+        def translate(self, lang):
+            return self
+
+    class YouTubeTranscriptApi:
+        def __init__(self, http_client=None):
+            pass
+
+        def list(self, vid):
+            cap_net.call(TooManyRequests)
+            return [] if cap_net.stable(vid) < p_no_caption else [Transcript(vid)]
+
+        @classmethod
+        def list_transcripts(cls, vid, cookies=None):
+            return cls().list(vid)
+
+    ta.YouTubeTranscriptApi, ta.TranscriptsDisabled, ta.NoTranscriptFound = \
+        YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+    sys.modules["yt_dlp"] = yd
+    sys.modules["youtube_transcript_api"] = ta
+
+
+# ---------- 측정 ----------
+def _pct(xs, q):
+    if not xs:
+        return 0.0
+    xs = sorted(xs)
+    return round(xs[min(len(xs) - 1, int(q * len(xs)))], 3)
+
+
+def _counters(pu, ts):
+    m = pu.META_CACHE
+    return {"meta_hit": m.hits + m.stale_hits, "meta_miss": m.misses,
+            "search_hit": pu.SEARCH_CACHE.hits, "search_miss": pu.SEARCH_CACHE.misses,
+            "caption_hit": ts.STORE.hits, "caption_miss": ts.STORE.misses}
+
+
+def _rate(before, after, name):
+    hit = after[f"{name}_hit"] - before[f"{name}_hit"]
+    miss = after[f"{name}_miss"] - before[f"{name}_miss"]
+    return round(hit / (hit + miss), 3) if hit + miss else None
+
+
+class _Measure:
+    """wall/도착 시각/캐시 적중률/메모리 한 묶음"""
+
+    def __init__(self, pu, ts, memory):
+        self.pu, self.ts, self.memory = pu, ts, memory
+
+    def __enter__(self):
+        self.c0 = _counters(self.pu, self.ts)
+        if self.memory:
+            tracemalloc.start()
+        self.t0 = time.perf_counter()
+        self.arrivals, self.failed = [], 0
+        return self
+
+    def arrived(self, ok=True):
+        self.arrivals.append(time.perf_counter() - self.t0)
+        self.failed += not ok
+
+    def __exit__(self, *exc):
+        self.wall = time.perf_counter() - self.t0
+        self.peak = tracemalloc.get_traced_memory()[1] if self.memory else 0
+        if self.memory:
+            tracemalloc.stop()
+        self.c1 = _counters(self.pu, self.ts)
+
+    def report(self, **extra):
+        n = len(self.arrivals)
+        out = {
+            "rows": n, "failed": self.failed,
+            "wall_s": round(self.wall, 3),
+            "first_row_s": round(self.arrivals[0], 3) if n else None,
+            "rows_per_s": round(n / self.wall, 2) if self.wall else 0.0,
+            "row_p50_s": _pct(self.arrivals, 0.5), "row_p95_s": _pct(self.arrivals, 0.95),
+            "hit_rate": {k: _rate(self.c0, self.c1, k) for k in ("search", "meta", "caption")},
+        }
+        if self.memory:
+            out["peak_mb"] = round(self.peak / 1e6, 2)
+        out.update(extra)
+        return out
+
+
+def run_meta(pu, ts, keyword, size, workers, memory):
+    with _Measure(pu, ts, memory) as m:
+        rows = pu.search_page(keyword, 0, size)
+        search_s = time.perf_counter() - m.t0
+        for _, _, ok in pu.iter_video_details([r["video_id"] for r in rows], max_workers=workers):
+            m.arrived(ok)
+    return m.report(search_s=round(search_s, 3)), [r["video_id"] for r in rows]
+
+
+def run_captions(pu, ts, ids, workers, memory):
+    by_status = {}
+    with _Measure(pu, ts, memory) as m:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bench-cap") as ex:
+            for fut in as_completed([ex.submit(pu.fetch_caption, v) for v in ids]):
+                _, status = fut.result()
+                by_status[status] = by_status.get(status, 0) + 1
+                m.arrived(status in (ts.OK, ts.NONE))
+    return m.report(by_status=by_status)
+
+
+def _git_rev():
+    try:
+        return subprocess.run(["git", "-C", ROOT, "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def main():
+    ap = argparse.ArgumentParser(description="YouTube 메타/자막 파이프라인 오프라인 벤치마크")
+    ap.add_argument("--workers", nargs="+", default=["4", "8", "16", "adaptive"])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[20, 50, 100])
+    ap.add_argument("--latency-ms", type=float, default=150)
+    ap.add_argument("--jitter-ms", type=float, default=100)
+    ap.add_argument("--p429", type=float, default=0.02)
+    ap.add_argument("--search-page-ms", type=float, default=300)
+    ap.add_argument("--caption-latency-ms", type=float, default=200)
+    ap.add_argument("--p-no-caption", type=float, default=0.1)
+    ap.add_argument("--caption-lines", type=int, default=300)
+    ap.add_argument("--skip-captions", action="store_true")
+    ap.add_argument("--no-memory", action="store_true", help="tracemalloc 끄기(추적 비용 없이 시간만)")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--keep-cache", action="store_true", help="임시 캐시 폴더를 지우지 않고 남김")
+    ap.add_argument("--json", help="결과 JSON 저장 경로")
+    args = ap.parse_args()
+
+    cache_home = tempfile.mkdtemp(prefix="bench-yt-")
+    if not args.keep_cache:
+        atexit.register(shutil.rmtree, cache_home, ignore_errors=True)
+    os.environ["LOCALAPPDATA"] = cache_home   # yt_cache import 전에(CACHE_ROOT가 여기로)
+    meta_net = FakeNet(args.latency_ms, args.jitter_ms, args.p429, args.seed)
+    search_net = FakeNet(args.search_page_ms, args.jitter_ms, 0.0, args.seed)
+    cap_net = FakeNet(args.caption_latency_ms, args.jitter_ms, args.p429, args.seed)
+    install_fakes(meta_net, search_net, cap_net, args.p_no_caption, args.caption_lines)
+
+    import pytube_util as pu  # noqa: E402
+    import transcript_store as ts  # noqa: E402
+
+    report = {
+        "git": _git_rev(), "started": time.strftime("%Y-%m-%d %H:%M:%S"), "cpus": os.cpu_count(),
+        "params": {k: v for k, v in vars(args).items() if k != "json"},
+        "cache_dir": cache_home if args.keep_cache else None, "results": [],
+    }
+    for size in args.sizes:
+        for w in args.workers:
+            workers = None if w == "adaptive" else int(w)
+            kw = f"bench-{size}-{w}-{args.seed}"
+            cold, ids = run_meta(pu, ts, kw, size, workers, not args.no_memory)
+            warm, _ = run_meta(pu, ts, kw, size, workers, not args.no_memory)
+            cell = {"size": size, "workers": w, "meta_cold": cold, "meta_warm": warm}
+            if not args.skip_captions:
+                cw = workers or pu.CAPTION_WORKERS
+                cell["caption_cold"] = run_captions(pu, ts, ids, cw, not args.no_memory)
+                cell["caption_warm"] = run_captions(pu, ts, ids, cw, not args.no_memory)
+            if workers is None:
+                cell["meta_limit"] = pu.META_LIMIT.stats()
+            report["results"].append(cell)
+            line = (f"size={size:>4} workers={w:>8} | meta cold {cold['wall_s']:>6.2f}s "
+                    f"first {cold['first_row_s'] or 0:.2f}s {cold['rows_per_s']:>6.1f}/s fail {cold['failed']}"
+                    f" | warm {warm['wall_s']:.3f}s hit {warm['hit_rate']['meta']}")
+            if "caption_cold" in cell:
+                cc = cell["caption_cold"]
+                line += f" | caption {cc['wall_s']:.2f}s {cc['rows_per_s']:.1f}/s {cc['by_status']}"
+            print(line, flush=True)
+    report["backend_calls"] = {"meta": meta_net.calls, "meta_429": meta_net.throttled,
+                               "search_pages": search_net.calls,
+                               "caption": cap_net.calls, "caption_429": cap_net.throttled}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+# transcript_index.py
+"""
+자막 전문 검색 색인(SQLite FTS5, trigram 토크나이저).
+- 자막 저장소와 같은 파일(transcripts.sqlite3)에 둠: transcript_fts(색인) + transcript_docs(video_id ↔ 색인 번호)
+- 본문은 저장소에 압축해 둔 것 하나뿐 — 색인은 contentless(content='')라 본문을 다시 저장하지 않고,
+  스니펫은 검색 결과 몇 건의 본문만 풀어서 만든다
+- 저장소에 자막이 들어올 때마다 그 영상만 색인(STORE._on_put 훅), 저장소에서 지우거나 바꾸기 직전에
+  색인에서도 뺌(STORE._on_remove 훅 — contentless 삭제는 색인했던 본문을 그대로 넘겨야 함)
+- 색인 크기는 저장소 크기 상한(YT_TRANSCRIPT_CACHE_MB)에 함께 들어감(STORE._extra_bytes)
+- 이미 저장돼 있던 자막은 첫 검색 때 한 번 색인(backfill)
+trigram은 띄어쓰기/형태소와 상관없이 3글자 이상 부분 문자열로 찾으므로 조사가 붙은 한국어에도 맞는다.
+2글자 이하 검색어(예: "삼성")는 색인을 쓸 수 없어 본문을 풀어 비교한다 — 그것만으로 찾으면 자막이 많을 때 느림.
+검색어: 공백으로 나눈 단어가 모두 들어간 자막(AND), "큰따옴표"로 묶으면 구절 그대로.
+"""
+import re, html
+
+import transcript_store as ts
+
+# 스니펫 강조 구간 표시(자막 본문에 나오지 않는 사설 영역 문자)
+HL_OPEN, HL_CLOSE = "\ue000", "\ue001"
+SNIPPET_CHARS = 40          # 스니펫 길이(첫 일치 앞뒤 글자 수)
+BACKFILL_BATCH = 200
+MIN_INDEXED = 3             # trigram 색인을 쓸 수 있는 최소 글자 수
+MEASURE_EVERY = 50          # 색인 크기를 이만큼 넣을 때마다 실제로 잼(그 사이는 어림값)
+
+
+def parse_query(query: str) -> list:
+    """'삼성 "갤럭시 S24"' → ['삼성', '갤럭시 S24']"""
+    return [t.strip() for a, b in re.findall(r'"([^"]+)"|(\S+)', query or "") for t in (a or b,) if t.strip()]
+
+
+def snippet_html(snippet: str) -> str:
+    """강조 표시 → HTML(<b>), 나머지는 이스케이프"""
+    return html.escape(snippet).replace(HL_OPEN, "<b>").replace(HL_CLOSE, "</b>")
+
+
+def plain(snippet: str) -> str:
+    return snippet.replace(HL_OPEN, "").replace(HL_CLOSE, "")
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _py_snippet(text: str, terms: list) -> str:
+    """스니펫: 첫 일치 주변 + 모든 검색어 강조"""
+    low = text.lower()
+    pos = min((p for p in (low.find(t.lower()) for t in terms) if p >= 0), default=0)
+    start = max(0, pos - SNIPPET_CHARS // 2)
+    end = min(len(text), start + SNIPPET_CHARS * 2)
+    part = text[start:end]
+    pat = re.compile("|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)), re.I)
+    part = pat.sub(lambda m: HL_OPEN + m.group(0) + HL_CLOSE, part)
+    return ("…" if start else "") + part + ("…" if end < len(text) else "")
+
+
+class TranscriptIndex:
+    def __init__(self, store: ts.TranscriptStore = ts.STORE):
+        self.store = store
+        self.db = store.db
+        self._ready = False
+        self._backfilled = False
+        self._bytes = 0
+        self._puts = 0
+
+    def _ensure(self):
+        if self._ready:
+            return
+        self.store._ensure()
+        with self.db.lock:
+            self._create(self.db.conn())
+
+    def _create(self, c):
+        """db.lock 안에서 호출(저장소 훅에서도 부르므로 다른 잠금은 잡지 않음)"""
+        if self._ready:
+            return
+        old = c.execute("SELECT sql FROM sqlite_master WHERE name = 'transcript_fts'").fetchone()
+        if old is not None and "content=''" not in old[0]:
+            # 예전 형식(본문을 한 번 더 저장하던 색인) → 지우고 다음 검색 때 다시 색인
+            c.execute("DROP TRIGGER IF EXISTS transcripts_fts_delete")
+            c.execute("DROP TABLE transcript_fts")
+            c.execute("DROP TABLE IF EXISTS transcript_docs")
+            c.commit()
+            c.execute("VACUUM")
+        # AUTOINCREMENT: contentless 색인에 남은 항목이 있어도 번호를 다시 쓰지 않음
+        c.execute("CREATE TABLE IF NOT EXISTS transcript_docs ("
+                  " doc INTEGER PRIMARY KEY AUTOINCREMENT, video_id TEXT UNIQUE NOT NULL)")
+        c.execute("CREATE VIRTUAL TABLE IF NOT EXISTS transcript_fts USING fts5(text, tokenize='trigram', content='')")
+        c.commit()
+        self._bytes = self._measure(c)
+        self._ready = True
+
+    @staticmethod
+    def _measure(c) -> int:
+        return c.execute("SELECT COALESCE(SUM(length(block)), 0) FROM transcript_fts_data").fetchone()[0]
+
+    def size(self) -> int:
+        """색인 크기(바이트, 어림) — 저장소 크기 상한에 함께 셈(이전 실행에서 만든 색인도)"""
+        if not self._ready:
+            with self.db.lock:
+                self._create(self.db.conn())
+        return self._bytes
+
+    # ---- 색인 갱신 ----
+    def _add(self, c, video_id, text):
+        """db.lock 안에서 호출. 예전 항목은 on_remove로 이미 빠져 있음."""
+        c.execute("DELETE FROM transcript_docs WHERE video_id = ?", (video_id,))   # 남은 매핑(정상이면 없음)
+        doc = c.execute("INSERT INTO transcript_docs (video_id) VALUES (?)", (video_id,)).lastrowid
+        c.execute("INSERT INTO transcript_fts (rowid, text) VALUES (?, ?)", (doc, text))
+        self._puts += 1
+        if self._puts % MEASURE_EVERY == 0:
+            self._bytes = self._measure(c)
+        else:
+            self._bytes += 3 * len(text.encode("utf-8"))
+
+    def on_put(self, video_id, status, text):
+        """TranscriptStore.put 훅 — 그 영상만 색인"""
+        if status != ts.OK or not text:
+            return
+        self._ensure()
+        with self.db.lock:
+            c = self.db.conn()
+            # put과 이 훅 사이에 다른 put의 크기 정리로 행이 지워졌으면 색인하지 않음(지울 수 없는 항목이 남음)
+            if c.execute("SELECT 1 FROM transcripts WHERE video_id = ?", (video_id,)).fetchone() is None:
+                return
+            self._add(c, video_id, text)
+            c.commit()
+
+    def on_remove(self, c, video_ids):
+        """
+        TranscriptStore 훅(db.lock 안, 행을 지우거나 바꾸기 직전) — 색인에서 뺌.
+        contentless 색인은 색인했던 본문을 그대로 넘겨야 지워지므로 아직 남아 있는 저장소 본문을 풀어서 씀.
+        여러 건(크기 상한 정리)이면 색인을 합쳐 지운 자리를 실제로 비움.
+        """
+        self._create(c)
+        video_ids = list(video_ids)
+        for i in range(0, len(video_ids), BACKFILL_BATCH):
+            chunk = video_ids[i:i + BACKFILL_BATCH]
+            q = ",".join("?" * len(chunk))
+            for doc, codec, body in c.execute(
+                    "SELECT d.doc, t.codec, t.body FROM transcript_docs d JOIN transcripts t ON t.video_id = d.video_id"
+                    f" WHERE d.video_id IN ({q})", chunk).fetchall():
+                try:
+                    text = ts._unpack(body, codec)
+                except Exception:
+                    continue   # 못 풀면 매핑만 지움(색인 항목은 검색에 안 나옴)
+                if text:
+                    c.execute("INSERT INTO transcript_fts (transcript_fts, rowid, text) VALUES ('delete', ?, ?)",
+                              (doc, text))
+            c.execute(f"DELETE FROM transcript_docs WHERE video_id IN ({q})", chunk)
+        if len(video_ids) > 1:
+            c.execute("INSERT INTO transcript_fts (transcript_fts) VALUES ('optimize')")
+            self._bytes = self._measure(c)
+
+    def backfill(self) -> int:
+        """색인에 없는 저장된 자막을 색인(묶음마다 잠금을 풀어 자막 받기를 막지 않음)"""
+        self._ensure()
+        with self.db.lock:
+            todo = [v for (v,) in self.db.conn().execute(
+                "SELECT video_id FROM transcripts WHERE status = ? AND body IS NOT NULL"
+                " AND video_id NOT IN (SELECT video_id FROM transcript_docs)", (ts.OK,))]
+        for i in range(0, len(todo), BACKFILL_BATCH):
+            chunk = todo[i:i + BACKFILL_BATCH]
+            with self.db.lock:
+                c = self.db.conn()
+                q = ",".join("?" * len(chunk))
+                for vid, codec, body in c.execute(
+                        f"SELECT video_id, codec, body FROM transcripts WHERE video_id IN ({q})", chunk).fetchall():
+                    try:
+                        text = ts._unpack(body, codec)
+                    except Exception:
+                        continue
+                    if text:
+                        self._add(c, vid, text)
+                c.commit()
+        if todo:
+            with self.db.lock:
+                self._bytes = self._measure(self.db.conn())
+        self._backfilled = True
+        return len(todo)
+
+    # ---- 검색 ----
+    def search(self, query: str, limit: int = 200) -> list:
+        """
+        [{"video_id", "snippet", "score"}] — 잘 맞는 순(bm25).
+        snippet의 일치 구간은 HL_OPEN/HL_CLOSE로 감쌈(snippet_html로 변환).
+        """
+        terms = parse_query(query)
+        if not terms:
+            return []
+        self._ensure()
+        if not self._backfilled:
+            self.backfill()
+        long_terms = [t for t in terms if len(t) >= MIN_INDEXED]
+        short = [t.lower() for t in terms if len(t) < MIN_INDEXED]
+        out = []
+        with self.db.lock:
+            c = self.db.conn()
+            if long_terms:
+                cur = c.execute(
+                    "SELECT d.video_id, t.codec, t.body, bm25(transcript_fts) FROM transcript_fts"
+                    " JOIN transcript_docs d ON d.doc = transcript_fts.rowid JOIN transcripts t ON t.video_id = d.video_id"
+                    " WHERE transcript_fts MATCH ? ORDER BY bm25(transcript_fts)",
+                    (" AND ".join(map(_fts_phrase, long_terms)),))
+            else:
+                cur = c.execute("SELECT video_id, codec, body, 0.0 FROM transcripts"
+                                " WHERE status = ? AND body IS NOT NULL ORDER BY fetched_at DESC", (ts.OK,))
+            for vid, codec, body, score in cur:
+                try:
+                    text = ts._unpack(body, codec)
+                except Exception:
+                    continue
+                if short:
+                    low = text.lower()
+                    if not all(t in low for t in short):
+                        continue
+                out.append({"video_id": vid, "snippet": _py_snippet(text, terms), "score": round(-score, 3)})
+                if len(out) >= limit:
+                    break
+        return out
+
+    def count(self) -> int:
+        self._ensure()
+        with self.db.lock:
+            return self.db.conn().execute("SELECT COUNT(*) FROM transcript_docs").fetchone()[0]
+
+
+INDEX = TranscriptIndex()
+ts.STORE._on_put.append(INDEX.on_put)
+ts.STORE._on_remove.append(INDEX.on_remove)
+ts.STORE._extra_bytes.append(INDEX.size)
@@ -0,0 +1,219 @@
+# transcript_store.py
+"""
+자막 저장소(SQLite 파일 하나, 본문은 압축 BLOB).
+- 상태(status)와 본문을 분리: 실패 마커를 자막처럼 저장하지 않음
+- 일시적 실패(429/403/오류)와 "자막 없음"은 짧은 TTL 후 다시 시도
+- 전체 크기 상한을 넘으면 오래 안 읽은 자막부터 삭제(LRU) — 같은 파일에 붙은 검색 색인 크기도 함께 셈
+- 예전 영상별 .txt 캐시는 처음 열 때 한 번 옮기고 지움
+zstandard가 있으면 zstd, 없으면 zlib으로 압축한다.
+"""
+import os, json, time, zlib, threading
+from collections import namedtuple
+
+try:
+    import zstandard as zstd
+except ImportError:  # 선택 의존성 (requirements-app.txt)
+    zstd = None
+
+from yt_cache import CACHE_ROOT, shared_db
+
+STORE_PATH = os.path.join(CACHE_ROOT, "transcripts.sqlite3")
+# 예전 .txt 캐시 위치(마이그레이션 대상)
+LEGACY_DIR = os.path.join(CACHE_ROOT, "transcripts")
+
+# 크기 상한(MB) — 환경변수 YT_TRANSCRIPT_CACHE_MB=500
+MAX_BYTES = int(os.environ.get("YT_TRANSCRIPT_CACHE_MB", "200")) * 1024 * 1024
+
+OK, NONE, COOLDOWN, FORBIDDEN, ERROR = "ok", "none", "cooldown", "forbidden", "error"
+
+# 상태별 유효 시간(초). OK는 만료 없음(크기 상한으로만 삭제).
+NEGATIVE_TTL = {
+    NONE: 3 * 24 * 3600,   # 나중에 자막이 올라올 수 있음
+    FORBIDDEN: 6 * 3600,
+    COOLDOWN: 15 * 60,
+    ERROR: 30 * 60,
+}
+
+Transcript = namedtuple("Transcript", "status text lang segments fetched_at")
+
+_CODEC = "zstd" if zstd is not None else "zlib"
+
+
+def _pack(obj) -> bytes:
+    raw = (obj if isinstance(obj, str) else json.dumps(obj, ensure_ascii=False)).encode("utf-8")
+    if _CODEC == "zstd":
+        return zstd.ZstdCompressor(level=6).compress(raw)
+    return zlib.compress(raw, 6)
+
+
+def _unpack(blob, codec) -> str:
+    if blob is None:
+        return ""
+    if codec == "zstd":
+        if zstd is None:
+            raise RuntimeError("zstd로 저장된 자막을 읽으려면 zstandard가 필요합니다.")
+        return zstd.ZstdDecompressor().decompress(blob).decode("utf-8")
+    return zlib.decompress(blob).decode("utf-8")
+
+
+class TranscriptStore:
+    def __init__(self, path=STORE_PATH, max_bytes=MAX_BYTES, legacy_dir=LEGACY_DIR):
+        self.db = shared_db(path)
+        self.max_bytes = max_bytes
+        self.legacy_dir = legacy_dir
+        self._ready = False
+        self._init_lock = threading.Lock()
+        self._bytes = 0
+        self.hits = self.misses = 0
+        self._on_put = []        # put 후 호출(video_id, status, text) — 검색 색인 등
+        self._on_remove = []     # 행을 지우거나 바꾸기 직전 호출(conn, [video_id]) — db.lock 안
+        self._extra_bytes = []   # 같은 파일에 붙은 데이터(검색 색인 등)의 크기 → 크기 상한에 함께 셈
+
+    def _ensure(self):
+        if self._ready:
+            return
+        with self._init_lock:
+            if self._ready:
+                return
+            with self.db.lock:
+                c = self.db.conn()
+                c.execute(
+                    "CREATE TABLE IF NOT EXISTS transcripts ("
+                    " video_id TEXT PRIMARY KEY, status TEXT NOT NULL, lang TEXT NOT NULL DEFAULT '',"
+                    " codec TEXT NOT NULL DEFAULT '', body BLOB, segments BLOB, size INTEGER NOT NULL DEFAULT 0,"
+                    " fetched_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                c.execute("CREATE INDEX IF NOT EXISTS transcripts_accessed ON transcripts (accessed_at)")
+                c.execute("CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT)")
+                c.commit()
+                self._bytes = c.execute("SELECT COALESCE(SUM(size), 0) FROM transcripts").fetchone()[0]
+            self._ready = True
+        self._migrate_legacy()
+
+    # ---- 조회/저장 ----
+    def get(self, video_id, with_segments=False):
+        """유효한 항목이면 Transcript, 없거나 TTL 지난 실패 기록이면 None"""
+        self._ensure()
+        with self.db.lock:
+            c = self.db.conn()
+            r = c.execute(
+                "SELECT status, lang, codec, body, fetched_at" + (", segments" if with_segments else "") +
+                " FROM transcripts WHERE video_id = ?", (video_id,)
+            ).fetchone()
+            now = time.time()
+            if r is None or (r[0] in NEGATIVE_TTL and now - r[4] > NEGATIVE_TTL[r[0]]):
+                self.misses += 1
+                return None
+            c.execute("UPDATE transcripts SET accessed_at = ? WHERE video_id = ?", (now, video_id))
+            c.commit()
+        self.hits += 1
+        status, lang, codec, body, fetched_at = r[:5]
+        segs = json.loads(_unpack(r[5], codec)) if with_segments and r[5] is not None else None
+        return Transcript(status, _unpack(body, codec), lang, segs, fetched_at)
+
+    def put(self, video_id, status, text="", lang="", segments=None):
+        self._ensure()
+        body = _pack(text) if status == OK and text else None
+        seg_blob = _pack(segments) if status == OK and segments else None
+        size = len(body or b"") + len(seg_blob or b"")
+        now = time.time()
+        with self.db.lock:
+            c = self.db.conn()
+            old = c.execute("SELECT size FROM transcripts WHERE video_id = ?", (video_id,)).fetchone()
+            if old is not None:
+                self._notify_remove(c, [video_id])
+            c.execute("INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                      (video_id, status, lang or "", _CODEC, body, seg_blob, size, now, now))
+            c.commit()
+            self._bytes += size - (old[0] if old else 0)
+            if self.total_bytes() > self.max_bytes:
+                self._evict(keep=video_id)
+        for cb in self._on_put:
+            try:
+                cb(video_id, status, text if status == OK else "")
+            except Exception:
+                pass
+
+    def _extra(self) -> int:
+        return sum(f() for f in self._extra_bytes)
+
+    def total_bytes(self) -> int:
+        return self._bytes + self._extra()
+
+    def _notify_remove(self, c, video_ids):
+        for cb in self._on_remove:
+            try:
+                cb(c, video_ids)
+            except Exception:
+                pass
+
+    def _evict(self, keep=None):
+        """
+        오래 안 읽은 것부터 지워 상한의 90%까지 줄임(db.lock 안에서 호출).
+        keep: 방금 넣은 영상 — 지우면 뒤이은 _on_put 훅이 사라진 행을 색인하게 되므로 남김.
+        """
+        c = self.db.conn()
+        target = int(self.max_bytes * 0.9)
+        extra = self._extra()
+        # 색인 등은 본문 크기에 비례한다고 보고, 행을 지우면 그 몫만큼 함께 줄어드는 것으로 셈
+        scale = 1 + extra / self._bytes if self._bytes else 1
+        victims, freed = [], 0
+        for vid, size in c.execute("SELECT video_id, size FROM transcripts WHERE size > 0 ORDER BY accessed_at"):
+            if self._bytes + extra - freed * scale <= target:
+                break
+            if vid == keep:
+                continue
+            victims.append(vid)
+            freed += size
+        self._notify_remove(c, victims)
+        c.executemany("DELETE FROM transcripts WHERE video_id = ?", [(v,) for v in victims])
+        c.commit()
+        self._bytes -= freed
+
+    def stats(self) -> dict:
+        self._ensure()
+        with self.db.lock:
+            counts = dict(self.db.conn().execute("SELECT status, COUNT(*) FROM transcripts GROUP BY status"))
+        return {"hits": self.hits, "misses": self.misses, "bytes": self._bytes, "extra_bytes": self._extra(),
+                "by_status": counts}
+
+    # ---- 예전 .txt 캐시 옮기기(1회) ----
+    def _migrate_legacy(self):
+        with self.db.lock:
+            c = self.db.conn()
+            if c.execute("SELECT 1 FROM store_meta WHERE key = 'legacy_migrated'").fetchone():
+                return
+        moved = 0
+        if os.path.isdir(self.legacy_dir):
+            for name in os.listdir(self.legacy_dir):
+                path = os.path.join(self.legacy_dir, name)
+                vid = name[:-4] if name.endswith(".txt") else None
+                if not vid:
+                    continue
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        text = f.read()
+                except Exception:
+                    continue
+                # 실패 마커/빈 값은 옮기지 않음(다음 요청 때 다시 받음)
+                if text.strip() == "(자막 없음)":
+                    self.put(vid, NONE)
+                    moved += 1
+                elif text.strip() and not text.startswith("["):
+                    self.put(vid, OK, text)
+                    moved += 1
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            try:
+                os.rmdir(self.legacy_dir)
+            except OSError:
+                pass
+        with self.db.lock:
+            c = self.db.conn()
+            c.execute("INSERT OR REPLACE INTO store_meta VALUES ('legacy_migrated', ?)", (str(moved),))
+            c.commit()
+
+
+STORE = TranscriptStore()
@@ -1,52 +1,426 @@
 # youtube_tab.py
-import pandas as pd
-from urllib.request import urlopen
-from functools import partial
+import html
+import time
 
-from PySide6.QtCore import Qt, QThread, Signal, QUrl
-from PySide6.QtGui import QPixmap, QDesktopServices
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QUrl, QTimer, QObject, QEvent, QRect, QSize,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+from PySide6.QtGui import QDesktopServices, QColor
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QTextEdit, QFileDialog, QMessageBox,
-    QHeaderView
+    QTableView, QTextEdit, QFileDialog, QMessageBox, QAbstractItemView,
+    QHeaderView, QCheckBox, QComboBox, QStyledItemDelegate, QStyleOptionButton,
+    QStyle, QApplication, QInputDialog
 )
 import webbrowser
 
 import pytube_util as pu
+import transcript_index as tix
+import yt_export
+import yt_watch
+from thumbnail_service import ThumbnailService
 
-class ImageLoader(QThread):
-    imageLoaded = Signal(int, QPixmap)
-    def __init__(self, row, url):
+# ▶ 자막 비동기 로더
+class CaptionLoader(QThread):
+    loaded = Signal(str, str)
+    def __init__(self, vid, url):
         super().__init__()
-        self.row = row
+        self.vid = vid
         self.url = url
+    def run(self):
+        text = pu.get_caption_for_url(self.url)  # pytube_util.py에 이미 구현
+        self.loaded.emit(self.vid, text or "")
+
+# ▶ 빠른 검색 행의 상세(구독자/업로드 날짜) 지연 로더 — 보이는 행만
+class DetailLoader(QThread):
+    loaded = Signal(str, dict)
+    def __init__(self, vids):
+        super().__init__()
+        self.vids = list(vids)
+        self._cancelled = False
+    def cancel(self):
+        self._cancelled = True
+    def run(self):
+        for vid, info, ok in pu.iter_video_details(self.vids):
+            if self._cancelled:
+                break
+            if ok:
+                self.loaded.emit(vid, info)
+
+# ▶ 검색 워커 — 검색(flat) 결과를 먼저 한 번에, 상세는 끝나는 순서대로 하나씩 보냄
+class SearchWorker(QThread):
+    page = Signal(int, list, bool)    # 검색 번호, 검색 순서의 행들, 결과 끝 여부
+    detail = Signal(int, str, dict)   # 검색 번호, video_id, 상세 행
+    failed = Signal(int, str)
+    def __init__(self, gen, keyword, count, start, sort, period, fast):
+        super().__init__()
+        self.gen, self.keyword, self.count, self.start = gen, keyword, count, start
+        self.sort, self.period, self.fast = sort, period, fast
+        self._cancelled = False
+    def cancel(self):
+        self._cancelled = True
     def run(self):
         try:
-            with urlopen(self.url) as response:
-                data = response.read()
-            pixmap = QPixmap()
-            pixmap.loadFromData(data)
-            scaled = pixmap.scaled(200, 112, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.imageLoaded.emit(self.row, scaled)
+            # flat 검색(캐시에 상세가 있으면 그 행으로) — 왕복 1회라 바로 표에 올림
+            rows = pu.get_keyword_videos(self.keyword, self.count, fast=True, start=self.start,
+                                         sort=self.sort, period=self.period)
+            done = pu.search_exhausted(self.keyword, self.sort, self.period)
         except Exception as e:
-            print(f"이미지 로드 실패: {e}")
+            self.failed.emit(self.gen, str(e)); return
+        if self._cancelled:
+            return
+        self.page.emit(self.gen, rows, done)
+        if self.fast:
+            self._fill_subscribers(rows)
+            return
+        # 전체 상세: 끝나는 대로 한 행씩(as_completed). 취소하면 남은 작업은 제출 취소.
+        it = pu.iter_video_details([r["video_id"] for r in rows if r.get("partial")])
+        try:
+            for vid, info, ok in it:
+                if self._cancelled:
+                    break
+                if ok:
+                    self.detail.emit(self.gen, vid, info)
+        finally:
+            it.close()
 
-# ▶ 자막 비동기 로더
-class CaptionLoader(QThread):
-    loaded = Signal(int, str)
-    def __init__(self, row, url):
+    def _fill_subscribers(self, rows):
+        """빠른 검색: 캐시에 없는 채널만 채널당 한 번 조회해 같은 채널 행 전부에 구독자 수 반영"""
+        missing = pu.apply_channel_cache(rows)
+        by_channel = {}
+        for r in rows:
+            if r.get("channel_id") in missing:
+                by_channel.setdefault(r["channel_id"], []).append(r["video_id"])
+        if not by_channel:
+            return
+        it = pu.iter_channel_info(by_channel)
+        try:
+            for cid, ch in it:
+                if self._cancelled:
+                    break
+                if ch and ch["subscribers"]:
+                    for vid in by_channel[cid]:
+                        self.detail.emit(self.gen, vid, {"subscribers": ch["subscribers"], "partial": True})
+        finally:
+            it.close()
+
+# ▶ 여러 키워드 검색 — 키워드별 flat 검색은 동시에, 상세는 겹치지 않는 영상만 한 번씩
+class BatchSearchWorker(SearchWorker):
+    progress = Signal(int, dict)      # 검색 번호, KeywordBatch.stats()
+    def __init__(self, gen, keywords, count, sort, period, fast):
+        super().__init__(gen, "", count, 0, sort, period, fast)
+        self.keywords = keywords
+        self.batch = pu.KeywordBatch()
+    def run(self):
+        b = self.batch
+        it = pu.iter_keyword_searches(self.keywords, self.count, self.sort, self.period)
+        try:
+            for kw, rows, err in it:
+                if self._cancelled:
+                    return
+                new = b.add(kw, rows, err)
+                ids = {r["video_id"] for r in new}
+                self.page.emit(self.gen, [dict(r, **b.provenance(r["video_id"])) for r in new], False)
+                # 이미 표에 있는 영상은 출처(키워드/순위)만 갱신
+                for r in rows:
+                    if r["video_id"] not in ids:
+                        self.detail.emit(self.gen, r["video_id"], dict(b.provenance(r["video_id"]), partial=True))
+                self.progress.emit(self.gen, b.stats())
+        finally:
+            it.close()
+        rows = list(b.rows.values())
+        if self.fast:
+            self._fill_subscribers(rows)
+            return
+        it = pu.iter_video_details([r["video_id"] for r in rows if r.get("partial")])
+        try:
+            for vid, info, ok in it:
+                if self._cancelled:
+                    break
+                if ok:
+                    self.detail.emit(self.gen, vid, info)
+        finally:
+            it.close()
+
+# ▶ 키워드 감시 — 감시 중인 키워드를 동시에 확인(flat 검색 + 새 영상만 상세)
+class WatchWorker(QThread):
+    report = Signal(dict)
+    failed = Signal(str, str)   # 키워드, 오류
+    def __init__(self, entries):
         super().__init__()
-        self.row = row
-        self.url = url
+        self.entries = entries
     def run(self):
-        text = pu.get_caption_for_url(self.url)  # pytube_util.py에 이미 구현
-        self.loaded.emit(self.row, text or "")
+        for entry, rep, err in yt_watch.check_many(self.entries):
+            if err:
+                self.failed.emit(entry["keyword"], err)
+            else:
+                self.report.emit(rep)
+
+# ▶ 받아 둔 자막 전문 검색(첫 검색은 기존 자막 색인 때문에 오래 걸릴 수 있음)
+class TranscriptSearchWorker(QThread):
+    done = Signal(str, list, float)   # 검색어, 결과 행, 걸린 시간(초)
+    failed = Signal(str)
+    def __init__(self, query):
+        super().__init__()
+        self.query = query
+    def run(self):
+        t0 = time.perf_counter()
+        try:
+            rows = pu.search_transcripts(self.query)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.done.emit(self.query, rows, time.perf_counter() - t0)
+
+# ▶ 결과 저장(CSV/JSONL/HTML/XLSX) — 모델에서 한 행씩 읽어 바로 파일에 씀
+class ExportWorker(QThread):
+    progress = Signal(int, int)   # 쓴 행, 전체
+    done = Signal(str, int)
+    failed = Signal(str)
+    def __init__(self, rows_factory, total, columns, path):
+        super().__init__()
+        self.rows_factory, self.total, self.columns, self.path = rows_factory, total, columns, path
+        self.notes = []   # 건너뛴 단계(분석 실패 등) — 완료 알림에 덧붙임
+        self._cancelled = False
+    def cancel(self):
+        self._cancelled = True
+    def run(self):
+        try:
+            n = yt_export.export(self.rows_factory, self.path, self.columns,
+                                 progress=lambda n: self.progress.emit(n, self.total),
+                                 cancelled=lambda: self._cancelled, log=self.notes.append)
+        except yt_export.ExportCancelled:
+            self.failed.emit("취소됨")
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.done.emit(self.path, n)
+
+# ▶ 자막 일괄 받기 결과를 GUI 스레드로 넘기는 다리(워커 스레드에서 emit)
+class CaptionBridge(QObject):
+    result = Signal(str, str, str)  # video_id, text, status
+
+class YouTubeResultsModel(QAbstractTableModel):
+    """
+    검색 결과 행(dict) 저장소. 표에는 화면에 보이는 칸만 그려진다.
+    썸네일(QPixmap)과 자막 본문은 행 밖의 dict(video_id 키)에 따로 둔다.
+    """
+    COLUMNS = [("thumbnail", "썸네일"), ("title", "제목"), ("video_link", "영상 링크"), ("channel", "채널명"),
+               ("channel_link", "채널링크"), ("views", "영상 조회수"), ("subscribers", "구독자 수"),
+               ("upload_date", "업로드 날짜"), ("script", "스크립트")]
+    COL_THUMB, COL_SCRIPT = 0, 8
+    LINK_COLS = (2, 4)
+    NUM_COLS = (5, 6)
+    SORT_ROLE = Qt.UserRole + 1   # 정렬용 원값(숫자는 숫자로, 썸네일 칸은 검색 순위)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._index = {}      # video_id -> 행 번호
+        self.pixmaps = {}     # video_id -> QPixmap
+        self.captions = {}    # video_id -> 자막 본문
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = self._rows[index.row()], index.column()
+        key = self.COLUMNS[col][0]
+        if col == self.COL_THUMB:
+            if role == Qt.DecorationRole:
+                return self.pixmaps.get(row["video_id"])
+            if role == self.SORT_ROLE:
+                return index.row()
+            return None
+        if col == self.COL_SCRIPT:
+            return "스크립트" if role == Qt.DisplayRole else None
+        v = row.get(key)
+        if role == Qt.DisplayRole:
+            return "" if v is None else str(v)
+        if role == self.SORT_ROLE:
+            return (v or 0) if col in self.NUM_COLS else str(v or "")
+        if role == Qt.ToolTipRole:
+            if col in self.LINK_COLS:
+                return "클릭하여 영상 보기" if col == 2 else "클릭하여 채널 보기"
+            if key == "title":
+                if row.get("match_snippet"):
+                    return f"{v}\n자막: {tix.plain(row['match_snippet'])}"
+                return f"{v}\n검색어: {row['keywords']}" if row.get("keywords") else v
+        if role == Qt.ForegroundRole and col in self.LINK_COLS:
+            return QColor(Qt.blue)
+        if role == Qt.TextAlignmentRole and col in self.NUM_COLS:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][1]
+        return super().headerData(section, orientation, role)
+
+    def append_rows(self, rows):
+        rows = [r for r in rows if r["video_id"] not in self._index]
+        if not rows:
+            return
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n + len(rows) - 1)
+        for i, r in enumerate(rows, start=n):
+            self._index[r["video_id"]] = i
+            self._rows.append(r)
+        self.endInsertRows()
+
+    def update_row(self, vid, info):
+        """상세가 도착한 행 갱신(썸네일 URL은 유지)"""
+        r = self._index.get(vid)
+        if r is None:
+            return
+        row = self._rows[r]
+        # info에 partial=True면 일부 값만 온 것 — 행의 partial 상태는 그대로
+        row.update({k: v for k, v in info.items() if k not in ("thumbnail", "caption", "partial")})
+        if not info.get("partial"):
+            row.pop("partial", None)
+        self.dataChanged.emit(self.index(r, 1), self.index(r, len(self.COLUMNS) - 1))
+
+    def set_pixmap(self, vid, pixmap):
+        r = self._index.get(vid)
+        if r is None:
+            return
+        self.pixmaps[vid] = pixmap
+        idx = self.index(r, self.COL_THUMB)
+        self.dataChanged.emit(idx, idx, [Qt.DecorationRole])
+
+    def set_caption(self, vid, text):
+        if vid in self._index:
+            self.captions[vid] = text or ""
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows, self._index = [], {}
+        self.pixmaps, self.captions = {}, {}
+        self.endResetModel()
+
+    def row_at(self, r):
+        return self._rows[r]
+
+    def vid_at(self, r):
+        return self._rows[r]["video_id"]
+
+    def export_row(self, r):
+        return self._export(self._rows[r], self.captions)
+
+    @staticmethod
+    def _export(row, captions):
+        out = {k: row.get(k, "") for k, _ in YouTubeResultsModel.COLUMNS if k not in ("thumbnail", "script")}
+        if "keywords" in row:   # 여러 키워드 검색: 어떤 키워드 몇 위로 잡혔는지
+            out.update(keywords=row["keywords"], keyword_hits=row.get("keyword_hits", 0),
+                       best_rank=row.get("best_rank", 0))
+        if "watch" in row:      # 감시 결과: 신규/조회수 증가
+            out.update(watch_keyword=row.get("watch_keyword", ""), watch=row["watch"],
+                       views_gain=row.get("gain", 0), gain_per_hour=row.get("per_hour", 0))
+        if "match_snippet" in row:   # 자막 검색: 일치 구간
+            out["match_snippet"] = tix.plain(row["match_snippet"])
+        out["caption"] = captions.get(row["video_id"], "")
+        return out
+
+    def export_columns(self):
+        """저장할 칸 — 여러 키워드/감시/자막 검색 결과에만 있는 칸은 그런 행이 있을 때만"""
+        cols = [k for k, _ in self.COLUMNS if k not in ("thumbnail", "script")]
+        if any("keywords" in r for r in self._rows):
+            cols += ["keywords", "keyword_hits", "best_rank"]
+        if any("watch" in r for r in self._rows):
+            cols += ["watch_keyword", "watch", "views_gain", "gain_per_hour"]
+        if any("match_snippet" in r for r in self._rows):
+            cols.append("match_snippet")
+        return cols + ["caption"]
+
+    def export_source(self, source_rows):
+        """
+        저장용 행 이터레이터를 만드는 함수(저장 스레드에서 호출, XLSX는 분석 때문에 두 번).
+        지금의 행 목록/자막 dict를 붙잡아 두므로 저장 도중 새 검색으로 clear()돼도 이 저장은 그대로 끝난다.
+        """
+        rows, caps = self._rows, self.captions
+        return lambda: (self._export(rows[r], caps) for r in source_rows)
+
+class ResultsFilterProxy(QSortFilterProxyModel):
+    """제목/채널명에 검색어가 들어간 행만(대소문자 무시)"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+        self.setSortRole(YouTubeResultsModel.SORT_ROLE)
+    def set_needle(self, text):
+        self._needle = (text or "").strip().lower()
+        self.invalidateFilter()
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._needle:
+            return True
+        row = self.sourceModel().row_at(source_row)
+        return self._needle in (row.get("title") or "").lower() or self._needle in (row.get("channel") or "").lower()
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """셀 위젯 없이 썸네일을 직접 그림(없으면 '로딩중...')"""
+    def paint(self, painter, option, index):
+        painter.save()
+        rect = option.rect.adjusted(2, 2, -2, -2)
+        painter.fillRect(rect, QColor("#111"))
+        pm = index.data(Qt.DecorationRole)
+        if pm is not None and not pm.isNull():
+            size = pm.size().scaled(rect.size(), Qt.KeepAspectRatio)
+            target = QRect(0, 0, size.width(), size.height())
+            target.moveCenter(rect.center())
+            painter.drawPixmap(target, pm)
+        else:
+            painter.setPen(QColor(Qt.gray))
+            painter.drawText(rect, Qt.AlignCenter, "로딩중...")
+        painter.restore()
+    def sizeHint(self, option, index):
+        return QSize(176, 116)
+
+class ButtonDelegate(QStyledItemDelegate):
+    """버튼 모양만 그리고 클릭은 editorEvent로 받음(행마다 QPushButton을 만들지 않음)"""
+    clicked = Signal(QModelIndex)
+    def _button_rect(self, rect):
+        h = 28
+        return QRect(rect.x() + 6, rect.center().y() - h // 2, rect.width() - 12, h)
+    def paint(self, painter, option, index):
+        opt = QStyleOptionButton()
+        opt.rect = self._button_rect(option.rect)
+        opt.text = index.data(Qt.DisplayRole) or ""
+        opt.state = QStyle.State_Enabled | QStyle.State_Raised
+        QApplication.style().drawControl(QStyle.CE_PushButton, opt, painter)
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton \
+                and self._button_rect(option.rect).contains(event.position().toPoint()):
+            self.clicked.emit(index)
+            return True
+        return False
+    def sizeHint(self, option, index):
+        return QSize(90, 116)
 
 class YouTubeSearchWidget(QWidget):
     def __init__(self):
         super().__init__()
-        self.image_loaders = []
-        self._cap_loaders = {}  # row -> loader
+        self.thumbs = ThumbnailService(self)   # 공용 풀 + 디스크/메모리 캐시
+        self._cap_loaders = {}     # video_id -> loader
+        self._detail_loaders = []
+        self._pending_detail = set()  # 빠른 검색으로 아직 상세가 없는 video_id
+        self._worker_detail = set()   # 전체 상세 검색 워커가 상세를 받아 올 video_id(보이는 행 로더와 겹치지 않게)
+        self._search_gen = 0       # 검색마다 증가 — 이전 검색의 늦은 결과는 버림
+        self._query = None         # 현재 검색 (keyword, sort, period) — "더 보기"가 이어 받음
+        self._query_exhausted = False
+        self._batch_text = ""       # 마지막 여러 키워드 목록(다시 열 때 채워 둠)
+        self._batch_stats = None    # 여러 키워드 검색 합치기 결과(KeywordBatch.stats)
+        self._prefetcher = None    # 자막 일괄 받기(pu.CaptionPrefetcher)
+        self._export_after = None  # 자막이 다 모이면 저장할 엑셀 경로
+        self._cap_bridge = CaptionBridge()
+        self._cap_bridge.result.connect(self._on_bulk_caption)
+        self._search_worker = None
+        self._retired = []         # 취소했지만 아직 끝나지 않은 스레드(끝날 때까지 참조 유지)
         self._build_ui()
 
     def _build_ui(self):
@@ -57,32 +431,102 @@ class YouTubeSearchWidget(QWidget):
         self.keyword_input = QLineEdit(); self.keyword_input.setPlaceholderText("키워드 입력")
         self.count_input   = QLineEdit(); self.count_input.setPlaceholderText("검색 개수 (예: 5)")
         self.search_button = QPushButton("검색"); self.search_button.clicked.connect(self.on_search)
+        self.fast_check = QCheckBox("빠른 검색"); self.fast_check.setChecked(True)
+        self.fast_check.setToolTip("검색 결과만으로 바로 표시하고, 구독자 수/업로드 날짜는 화면에 보이는 행만 나중에 채웁니다.")
+        self.sort_combo = QComboBox()
+        for label, key in (("관련도순", "relevance"), ("업로드순", "upload_date"), ("조회수순", "view_count")):
+            self.sort_combo.addItem(label, key)
+        self.period_combo = QComboBox()
+        for label, key in (("전체 기간", None), ("1시간", "hour"), ("오늘", "today"), ("이번 주", "week"),
+                           ("이번 달", "month"), ("올해", "year")):
+            self.period_combo.addItem(label, key)
+        self.more_button = QPushButton(f"다음 {pu.PAGE_SIZE}개"); self.more_button.setEnabled(False)
+        self.more_button.clicked.connect(self.on_more)
+        self.batch_button = QPushButton("여러 키워드…"); self.batch_button.clicked.connect(self.on_batch_search)
+        self.batch_button.setToolTip("키워드 목록(한 줄에 하나 또는 쉼표 구분)을 한 번에 검색합니다.\n"
+                                     "여러 키워드에 걸린 영상은 한 번만 표시하고 상세도 한 번만 받습니다.")
+        self.batch_file_button = QPushButton("목록 파일…"); self.batch_file_button.clicked.connect(self.on_batch_file)
+        self.cancel_button = QPushButton("취소"); self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.on_cancel_search)
+        self.lbl_status = QLabel("")
         search_layout.addWidget(QLabel("키워드")); search_layout.addWidget(self.keyword_input)
-        search_layout.addWidget(self.count_input); search_layout.addWidget(self.search_button)
+        search_layout.addWidget(self.count_input); search_layout.addWidget(self.sort_combo)
+        search_layout.addWidget(self.period_combo); search_layout.addWidget(self.fast_check)
+        search_layout.addWidget(self.search_button); search_layout.addWidget(self.more_button)
+        search_layout.addWidget(self.batch_button); search_layout.addWidget(self.batch_file_button)
+        search_layout.addWidget(self.cancel_button); search_layout.addWidget(self.lbl_status)
         main_layout.addLayout(search_layout)
 
+        # 결과 내 필터(제목/채널명)
+        filter_layout = QHBoxLayout()
+        self.filter_input = QLineEdit(); self.filter_input.setPlaceholderText("결과 내 필터 (제목/채널명)")
+        filter_layout.addWidget(QLabel("필터")); filter_layout.addWidget(self.filter_input)
+        # 받아 둔 자막 전체에서 찾기(자막 검색 색인) — 결과는 표, 일치 구간은 오른쪽에
+        self.transcript_input = QLineEdit(); self.transcript_input.setPlaceholderText("받아 둔 자막에서 검색")
+        self.transcript_input.setToolTip("지금까지 받은 모든 자막에서 찾습니다. 띄어 쓴 단어는 모두 포함(AND),\n"
+                                         "\"큰따옴표\"로 묶으면 구절 그대로 찾습니다. 3글자 이상 단어가 빠릅니다.")
+        self.transcript_input.returnPressed.connect(self.on_transcript_search)
+        self.transcript_button = QPushButton("자막 검색"); self.transcript_button.clicked.connect(self.on_transcript_search)
+        filter_layout.addWidget(self.transcript_input); filter_layout.addWidget(self.transcript_button)
+        self._transcript_worker = None
+        main_layout.addLayout(filter_layout)
+
+        # 키워드 감시: 같은 검색을 주기적으로 다시 확인해 새 영상/조회수 증가만
+        watch_layout = QHBoxLayout()
+        self.watch_add_btn = QPushButton("감시 추가"); self.watch_add_btn.clicked.connect(self.on_watch_add)
+        self.watch_add_btn.setToolTip("현재 키워드/정렬/기간을 감시 목록에 추가합니다.")
+        self.watch_remove_btn = QPushButton("감시 해제…"); self.watch_remove_btn.clicked.connect(self.on_watch_remove)
+        self.watch_check_btn = QPushButton("지금 확인"); self.watch_check_btn.clicked.connect(self.on_watch_check)
+        self.watch_show_btn = QPushButton("감시 결과"); self.watch_show_btn.clicked.connect(self.show_watch_results)
+        self.watch_show_btn.setEnabled(False)
+        self.watch_auto = QCheckBox(f"자동 확인({yt_watch.WATCH_INTERVAL // 60}분마다)")
+        self.watch_auto.toggled.connect(self._on_watch_auto)
+        self.lbl_watch = QLabel("")
+        for w in (QLabel("감시"), self.watch_add_btn, self.watch_remove_btn, self.watch_check_btn,
+                  self.watch_show_btn, self.watch_auto, self.lbl_watch):
+            watch_layout.addWidget(w)
+        watch_layout.addStretch()
+        main_layout.addLayout(watch_layout)
+        self._watch_worker = None
+        self._watch_reports = []
+        self._watch_show_after = False   # "지금 확인"이면 끝난 뒤 결과를 표에
+        self._watch_timer = QTimer(self)
+        self._watch_timer.setInterval(60 * 1000)   # 1분마다 확인할 때가 된 키워드만
+        self._watch_timer.timeout.connect(self._watch_due)
+        self._update_watch_label()
+
         # 테이블 + 우측 패널(B)
-        # 컬럼: 썸, 제목, 영상링크, 채널명, 채널링크, 조회수, 구독자, 업로드, 자막(숨김 캐시), 스크립트(버튼)
-        self.table = QTableWidget(0, 10)
-        self.table.setHorizontalHeaderLabels([
-            "썸네일","제목","영상 링크","채널명","채널링크","영상 조회수","구독자 수","업로드 날짜","자막","스크립트"
-        ])
-        self.table.cellClicked.connect(self.on_table_click)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # 모델 → 정렬/필터 프록시 → 뷰. 헤더를 눌러 정렬, 썸네일 헤더는 검색 순서로 되돌림.
+        self.model = YouTubeResultsModel(self)
+        self.thumbs.ready.connect(self.model.set_pixmap)   # 현재 결과에 없는 영상이면 모델이 무시
+        self.proxy = ResultsFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.filter_input.textChanged.connect(self.proxy.set_needle)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.verticalHeader().setDefaultSectionSize(116)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.table.setSortingEnabled(True)
+        self.table.clicked.connect(self.on_table_click)
+
+        self._thumb_delegate = ThumbnailDelegate(self.table)
+        self._button_delegate = ButtonDelegate(self.table)
+        self._button_delegate.clicked.connect(lambda idx: self._on_script_clicked(self._source_row(idx)))
+        self.table.setItemDelegateForColumn(YouTubeResultsModel.COL_THUMB, self._thumb_delegate)
+        self.table.setItemDelegateForColumn(YouTubeResultsModel.COL_SCRIPT, self._button_delegate)
 
-        # 헤더 리사이즈 정책 (보기 좋게)
+        # 헤더 폭 (행 수와 무관하게 고정/대화형 — 내용 맞춤은 행이 많으면 느려짐)
         h = self.table.horizontalHeader()
+        h.setSectionResizeMode(QHeaderView.Interactive)
         h.setSectionResizeMode(0, QHeaderView.Fixed)         # 썸네일
         self.table.setColumnWidth(0, 176)
-        for col in (1,):  # 제목
-            h.setSectionResizeMode(col, QHeaderView.Stretch)
-        for col in (2,4,7):  # 링크/날짜
-            h.setSectionResizeMode(col, QHeaderView.ResizeToContents)
-        for col in (3,5,6):  # 채널/숫자
-            h.setSectionResizeMode(col, QHeaderView.ResizeToContents)
-        h.setSectionResizeMode(8, QHeaderView.ResizeToContents)  # 자막(숨김)
-        h.setSectionResizeMode(9, QHeaderView.ResizeToContents)  # 스크립트 버튼
+        h.setSectionResizeMode(1, QHeaderView.Stretch)       # 제목
+        for col, w in ((2, 240), (3, 140), (4, 240), (5, 90), (6, 90), (7, 140), (8, 90)):
+            self.table.setColumnWidth(col, w)
 
         # 우측 자막 보기(B)
         self.detail_text = QTextEdit()
@@ -99,13 +543,38 @@ class YouTubeSearchWidget(QWidget):
         function_layout = QHBoxLayout()
         self.export_html_btn  = QPushButton("<HTML 저장>");  self.export_html_btn.clicked.connect(self.export_html)
         self.export_excel_btn = QPushButton("<엑셀 저장>");  self.export_excel_btn.clicked.connect(self.export_excel)
+        self.bulk_caption_btn = QPushButton("자막 일괄 받기"); self.bulk_caption_btn.clicked.connect(self.on_bulk_captions)
+        self.bulk_caption_btn.setToolTip("선택한 행(없으면 전체)의 자막을 한꺼번에 받습니다. 화면에 보이는 행부터 받습니다.")
+        self.export_cap_btn = QPushButton("<자막 포함 엑셀 저장>"); self.export_cap_btn.clicked.connect(self.export_excel_with_captions)
+        self.export_data_btn = QPushButton("<CSV/JSONL 저장>"); self.export_data_btn.clicked.connect(self.export_data)
+        self.export_cancel_btn = QPushButton("저장 취소"); self.export_cancel_btn.setVisible(False)
+        self.export_cancel_btn.clicked.connect(self.on_cancel_export)
+        self.lbl_export = QLabel("")
+        self._export_worker = None
+        self.lbl_caption = QLabel("")
+        function_layout.addWidget(self.bulk_caption_btn)
+        function_layout.addWidget(self.lbl_caption)
         function_layout.addStretch()
+        function_layout.addWidget(self.lbl_export)
+        function_layout.addWidget(self.export_cancel_btn)
+        function_layout.addWidget(self.export_cap_btn)
+        function_layout.addWidget(self.export_data_btn)
         function_layout.addWidget(self.export_html_btn)
         function_layout.addWidget(self.export_excel_btn)
         main_layout.addLayout(function_layout)
 
-        # 표가 너무 넓으면 자막 컬럼(8)을 숨겨 UI를 깔끔하게
-        self.table.setColumnHidden(8, True)
+        # 스크롤/정렬/필터가 바뀌면 새로 보이는 행의 상세를 채움
+        self._enrich_timer = QTimer(self)
+        self._enrich_timer.setSingleShot(True)
+        self._enrich_timer.setInterval(150)
+        self._enrich_timer.timeout.connect(self._enrich_visible)
+        self.table.verticalScrollBar().valueChanged.connect(lambda _: self._enrich_timer.start())
+        self.proxy.layoutChanged.connect(self._enrich_timer.start)
+
+        # 자막 일괄 받기 진행/일시정지 남은 시간 표시
+        self._caption_timer = QTimer(self)
+        self._caption_timer.setInterval(1000)
+        self._caption_timer.timeout.connect(self._update_caption_status)
 
     def on_search(self):
         keyword = self.keyword_input.text().strip()
@@ -116,160 +585,479 @@ class YouTubeSearchWidget(QWidget):
         if not keyword:
             QMessageBox.warning(self, "입력 확인", "키워드를 입력하세요.")
             return
+        self._reset_results()
+        # ▶ 빠른 검색(자막은 지연 로딩) — 결과 순서는 (키워드, 정렬, 기간)별로 캐시
+        self._query = (keyword, self.sort_combo.currentData(), self.period_combo.currentData())
+        self._load_page(count)
 
-        # 기존 로더 정리
-        for loader in self.image_loaders:
-            if loader.isRunning(): loader.terminate()
-        self.image_loaders.clear()
+    def _reset_results(self):
+        # 이전 검색 정리 — 강제 종료(terminate) 대신 취소 요청 후 늦게 온 결과는 검색 번호로 버림
+        self._cancel_search_worker()
+        self.thumbs.cancel_pending()
         for loader in self._cap_loaders.values():
-            if loader.isRunning(): loader.terminate()
+            self._retire(loader)
         self._cap_loaders.clear()
+        for loader in self._detail_loaders:
+            loader.cancel()
+            self._retire(loader)
+        self._detail_loaders.clear()
+        self._pending_detail.clear()
+        self._worker_detail.clear()
+        self._stop_prefetch()
+        self._search_gen += 1
+        self._query = None
+        self._batch_stats = None
+        self.model.clear()
+
+    # ▶ 여러 키워드 검색
+    def on_batch_search(self):
+        text, ok = QInputDialog.getMultiLineText(self, "여러 키워드 검색",
+                                                 "키워드 (한 줄에 하나, 쉼표 구분도 가능)", self._batch_text)
+        if ok:
+            self._run_batch(text)
 
-        # ▶ 빠른 검색(자막은 지연 로딩)
-        results = pu.get_keyword_videos(keyword, count)
-
-        self.table.setRowCount(0)
-        for row, item in enumerate(results):
-            self.table.insertRow(row)
-            self.table.setRowHeight(row, 116)
-
-            # 썸네일
-            thumb_label = QLabel("로딩중...")
-            thumb_label.setAlignment(Qt.AlignCenter)
-            thumb_label.setStyleSheet("border: 1px solid gray; background:#111;")
-            self.table.setCellWidget(row, 0, thumb_label)
-            self.table.setColumnWidth(0, 176)
-
-            # 제목
-            self.table.setItem(row, 1, QTableWidgetItem(item["title"]))
-
-            # 영상 링크(클릭 열기)
-            v_item = QTableWidgetItem(item["video_link"])
-            v_item.setData(Qt.UserRole, item["video_link"])
-            v_item.setForeground(Qt.blue)
-            v_item.setToolTip("클릭하여 영상 보기")
-            self.table.setItem(row, 2, v_item)
-
-            # 채널명/링크
-            self.table.setItem(row, 3, QTableWidgetItem(item["channel"]))
-            c_item = QTableWidgetItem(item["channel_link"])
-            c_item.setData(Qt.UserRole, item["channel_link"])
-            c_item.setForeground(Qt.blue)
-            c_item.setToolTip("클릭하여 채널 보기")
-            self.table.setItem(row, 4, c_item)
-
-            self.table.setItem(row, 5, QTableWidgetItem(str(item["views"])))
-            self.table.setItem(row, 6, QTableWidgetItem(str(item["subscribers"])))
-            self.table.setItem(row, 7, QTableWidgetItem(item["upload_date"]))
-
-            # 자막(캐시용, 기본은 빈칸)
-            self.table.setItem(row, 8, QTableWidgetItem(item.get("caption","") or ""))
-
-            # ▶ 스크립트 보기 버튼 (A 영역)
-            btn = QPushButton("스크립트")
-            btn.setCursor(Qt.PointingHandCursor)
-            # 안정적으로 URL 보관
-            btn.setProperty("video_url", item["video_link"])
-            btn.clicked.connect(partial(self._on_script_clicked, row))
-            self.table.setCellWidget(row, 9, btn)
-
-            # 썸네일 비동기 로딩
-            loader = ImageLoader(row, item["thumbnail"])
-            loader.imageLoaded.connect(self.set_thumbnail)
-            self.image_loaders.append(loader)
-            loader.start()
-
-    def set_thumbnail(self, row, pixmap):
-        lab = self.table.cellWidget(row, 0)
-        if lab:
-            lab.setPixmap(pixmap)
-            lab.setText("")
-            lab.setScaledContents(True)
-
-    def on_table_click(self, row, col):
+    def on_batch_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "키워드 목록", "", "텍스트/CSV (*.txt *.csv);;모든 파일 (*)")
+        if not path:
+            return
+        try:
+            with open(path, "r", encoding="utf-8-sig") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            QMessageBox.warning(self, "파일 오류", str(e)); return
+        self._run_batch(text)
+
+    def _run_batch(self, text):
+        keywords = pu.parse_keywords(text)
+        if not keywords:
+            QMessageBox.warning(self, "입력 확인", "키워드를 입력하세요."); return
+        self._batch_text = "\n".join(keywords)
+        try:
+            count = int(self.count_input.text().strip() or str(pu.PAGE_SIZE))
+        except ValueError:
+            count = pu.PAGE_SIZE
+        self._reset_results()
+        w = BatchSearchWorker(self._search_gen, keywords, count, self.sort_combo.currentData(),
+                              self.period_combo.currentData(), self.fast_check.isChecked())
+        w.progress.connect(self._on_batch_progress)
+        self._start_worker(w)
+        self.lbl_status.setText(f"키워드 0/{len(keywords)} 검색 중…")
+
+    # ▶ 키워드 감시
+    def on_watch_add(self):
+        keyword = self.keyword_input.text().strip()
+        if not keyword:
+            QMessageBox.warning(self, "입력 확인", "감시할 키워드를 입력하세요."); return
+        yt_watch.STORE.add(keyword, self.sort_combo.currentData(), self.period_combo.currentData())
+        self._update_watch_label()
+
+    def on_watch_remove(self):
+        entries = yt_watch.STORE.entries()
+        if not entries:
+            QMessageBox.information(self, "알림", "감시 중인 키워드가 없습니다."); return
+        labels = [f"{e['keyword']} ({e['sort']}, {e['period'] or '전체 기간'})" for e in entries]
+        label, ok = QInputDialog.getItem(self, "감시 해제", "해제할 키워드", labels, 0, False)
+        if ok:
+            yt_watch.STORE.remove(entries[labels.index(label)]["key"])
+            self._update_watch_label()
+
+    def on_watch_check(self):
+        self._watch_show_after = True
+        self._run_watch(yt_watch.STORE.entries())
+
+    def _on_watch_auto(self, on):
+        if on:
+            self._watch_timer.start()
+            self._watch_due()
+        else:
+            self._watch_timer.stop()
+
+    def _watch_due(self):
+        self._run_watch(yt_watch.STORE.due())
+
+    def _run_watch(self, entries):
+        if not entries:
+            self._update_watch_label()
+            return
+        if self._watch_worker is not None:
+            return   # 이전 확인이 아직 도는 중
+        self._watch_reports = []
+        w = WatchWorker(entries)
+        w.report.connect(self._on_watch_report)
+        w.failed.connect(lambda kw, err: self._watch_reports.append(
+            {"keyword": kw, "error": err}))
+        w.finished.connect(self._on_watch_finished)
+        self._watch_worker = w
+        self.watch_check_btn.setEnabled(False)
+        self.lbl_watch.setText(f"키워드 {len(entries)}개 확인 중…")
+        w.start()
+
+    def _on_watch_report(self, rep):
+        self._watch_reports.append(rep)
+        self.lbl_watch.setText(f"확인 {len(self._watch_reports)}/{len(self._watch_worker.entries)}")
+
+    def _on_watch_finished(self):
+        self._watch_worker = None
+        self.watch_check_btn.setEnabled(True)
+        self.watch_show_btn.setEnabled(bool(self._watch_reports))
+        self._update_watch_label()
+        if self._watch_show_after:
+            self._watch_show_after = False
+            self.show_watch_results()
+
+    def _update_watch_label(self):
+        entries = yt_watch.STORE.entries()
+        ok = [r for r in self._watch_reports if "error" not in r]
+        msg = f"감시 {len(entries)}개"
+        backoff = sum(e["retry_at"] > time.time() for e in entries)
+        if backoff:
+            msg += f" · 실패 후 재시도 대기 {backoff}개"
+        if ok:
+            msg += f" · 마지막 확인: 새 영상 {sum(len(r['new']) for r in ok)}개"
+        failed = len(self._watch_reports) - len(ok)
+        if failed:
+            msg += f" · 실패 {failed}"
+        self.lbl_watch.setText(msg)
+
+    def show_watch_results(self):
+        """마지막 감시 결과를 표(새 영상 → 조회수 증가 순)와 오른쪽 요약으로"""
+        reports = [r for r in self._watch_reports if "error" not in r]
+        self._reset_results()
+        rows, seen = [], set()
+        for rep in reports:
+            for n in rep["new"]:
+                rows.append(dict(n, watch="신규", watch_keyword=rep["keyword"]))
+        for rep in reports:
+            for g in rep["gains"]:
+                if g["gain"] > 0:
+                    rows.append(dict(g, watch=f"+{g['gain']:,}", watch_keyword=rep["keyword"]))
+        rows = [r for r in rows if not (r["video_id"] in seen or seen.add(r["video_id"]))]
+        self._append_results(rows)
+        self._update_search_status()
+        errors = [f"■ {r['keyword']} — 확인 실패: {r['error']}" for r in self._watch_reports if "error" in r]
+        self.detail_text.setText("\n".join([yt_watch.format_report(reports)] + errors).strip()
+                                 or "변화 없음")
+
+    # ▶ 자막 전문 검색
+    def on_transcript_search(self):
+        query = self.transcript_input.text().strip()
+        if not query or self._transcript_worker is not None:
+            return
+        w = TranscriptSearchWorker(query)
+        w.done.connect(self._on_transcript_results)
+        w.failed.connect(lambda m: self.lbl_status.setText(f"자막 검색 실패: {m}"))
+        w.finished.connect(self._on_transcript_finished)
+        self._transcript_worker = w
+        self.transcript_button.setEnabled(False)
+        self.lbl_status.setText("자막 검색 중…")
+        w.start()
+
+    def _on_transcript_finished(self):
+        self._transcript_worker = None
+        self.transcript_button.setEnabled(True)
+
+    def _on_transcript_results(self, query, rows, secs):
+        self._reset_results()
+        self._append_results(rows)
+        self.lbl_status.setText(f"자막 검색 '{query}' · {len(rows)}개 · {secs * 1000:.0f}ms")
+        parts = [f"<p><b>{html.escape(r.get('title') or r['video_id'])}</b>"
+                 + (f" — {html.escape(r['channel'])}" if r.get("channel") else "")
+                 + f"<br>{tix.snippet_html(r['match_snippet'])}</p>" for r in rows]
+        self.detail_text.setHtml("".join(parts) or "일치하는 자막이 없습니다.")
+
+    def _on_batch_progress(self, gen, st):
+        if gen != self._search_gen:
+            return
+        self._batch_stats = st
+        w = self._search_worker
+        msg = f"키워드 {st['keywords']}/{len(w.keywords) if w else st['keywords']} · 영상 {st['videos']}개"
+        if st["duplicates"]:
+            msg += f" (중복 {st['duplicates']}개 제외)"
+        if st["errors"]:
+            msg += f" · 검색 실패 {st['errors']}"
+        self.lbl_status.setText(msg)
+
+    def on_more(self):
+        """같은 검색의 다음 페이지를 이어 받아 표 아래에 붙임(처음부터 다시 검색하지 않음)"""
+        if self._query:
+            self._load_page(pu.PAGE_SIZE)
+
+    def on_cancel_search(self):
+        self._cancel_search_worker()
+        self.lbl_status.setText(f"취소됨 · {self.model.rowCount()}개")
+
+    def _retire(self, thread):
+        """실행 중인 스레드는 끝날 때까지 참조만 유지(도중에 파괴되지 않게)"""
+        if thread.isRunning():
+            self._retired.append(thread)
+            thread.finished.connect(lambda t=thread: t in self._retired and self._retired.remove(t))
+
+    def _cancel_search_worker(self):
+        w, self._search_worker = self._search_worker, None
+        if w is not None:
+            w.cancel()
+            self._retire(w)
+        self._release_worker_detail()
+        self.cancel_button.setEnabled(False)
+        self.search_button.setEnabled(True)
+        self.more_button.setEnabled(bool(self._query))
+
+    def _load_page(self, count):
+        keyword, sort, period = self._query
+        self._start_worker(SearchWorker(self._search_gen, keyword, count, self.model.rowCount(), sort, period,
+                                        self.fast_check.isChecked()))
+        self.lbl_status.setText("검색 중…")
+
+    def _start_worker(self, w):
+        w.page.connect(self._on_search_page)
+        w.detail.connect(self._on_search_detail)
+        w.failed.connect(self._on_search_failed)
+        w.finished.connect(lambda w=w: w is self._search_worker and self._on_search_finished())
+        self._search_worker = w
+        self.search_button.setEnabled(False)
+        self.more_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        w.start()
+
+    def _on_search_page(self, gen, rows, exhausted):
+        if gen != self._search_gen:
+            return
+        self._query_exhausted = exhausted
+        # 전체 상세 모드면 워커가 partial 행의 상세를 이어서 받으므로 보이는 행 로더에는 넘기지 않음
+        w = self._search_worker
+        self._append_results(rows, worker_details=w is not None and not w.fast)
+        self._update_search_status()
+
+    def _on_search_detail(self, gen, vid, info):
+        if gen != self._search_gen:
+            return
+        if not info.get("partial"):
+            self._pending_detail.discard(vid)
+            self._worker_detail.discard(vid)
+        self.model.update_row(vid, info)
+
+    def _on_search_failed(self, gen, msg):
+        if gen == self._search_gen:
+            QMessageBox.warning(self, "검색 실패", msg)
+
+    def _on_search_finished(self):
+        self._search_worker = None
+        self._release_worker_detail()
+        self.cancel_button.setEnabled(False)
+        self.search_button.setEnabled(True)
+        self.more_button.setEnabled(bool(self._query) and not self._query_exhausted)
+        self._update_search_status()
+
+    def _update_search_status(self):
+        """결과 수 + 상세 추출 동시 수(자동 조절)와 이번 실행의 실패 수"""
+        lim = pu.META_LIMIT
+        msg = f"{self.model.rowCount()}개 · 동시 {lim.limit}"
+        st = self._batch_stats
+        if st:
+            msg += f" · 키워드 {st['keywords']}개(중복 {st['duplicates']}개 제외)"
+        if lim.failures():
+            msg += f" · 실패 {lim.failures()}"
+        self.lbl_status.setText(msg)
+
+    def _release_worker_detail(self):
+        """검색 워커가 끝나거나 취소됨 — 상세를 못 받은 행은 보이는 행 로더가 맡음"""
+        if self._worker_detail:
+            self._pending_detail |= self._worker_detail
+            self._worker_detail.clear()
+            QTimer.singleShot(0, self._enrich_visible)
+
+    def _append_results(self, results, worker_details=False):
+        self.model.append_rows(results)
+        pending = self._worker_detail if worker_details else self._pending_detail
+        for item in results:
+            # 썸네일: 메모리에 있으면 바로, 없으면 공용 로더가 받아서 ready로 알림
+            pm = self.thumbs.request(item["video_id"])
+            if pm is not None:
+                self.model.set_pixmap(item["video_id"], pm)
+
+            if item.get("partial"):
+                pending.add(item["video_id"])
+
+        if self._pending_detail:
+            QTimer.singleShot(0, self._enrich_visible)
+
+    def _source_row(self, proxy_index):
+        return self.proxy.mapToSource(proxy_index).row()
+
+    def _visible_vids(self):
+        """현재 화면에 보이는 행의 video_id(정렬/필터 반영)"""
+        top = self.table.rowAt(0)
+        if top < 0:
+            return []
+        bottom = self.table.rowAt(self.table.viewport().height() - 1)
+        if bottom < 0:
+            bottom = self.proxy.rowCount() - 1
+        return [self.model.vid_at(self._source_row(self.proxy.index(r, 0))) for r in range(top, bottom + 1)]
+
+    def _enrich_visible(self):
+        """보이는 행 중 아직 상세가 없는 행만 모아서 한 번에 요청(자막 일괄 받기 중이면 보이는 행 먼저)"""
+        visible = self._visible_vids()
+        if self._prefetcher is not None:
+            self._prefetcher.prioritize(visible)
+        want = [v for v in visible if v in self._pending_detail]
+        if not want:
+            return
+        self._pending_detail.difference_update(want)
+        loader = DetailLoader(want)
+        gen = self._search_gen
+        loader.loaded.connect(lambda v, info: gen == self._search_gen and self.model.update_row(v, info))
+        loader.finished.connect(lambda l=loader: l in self._detail_loaders and self._detail_loaders.remove(l))
+        self._detail_loaders.append(loader)
+        loader.start()
+
+    def on_table_click(self, index):
         # 링크 컬럼: 2=영상, 4=채널
-        if col in (2, 4):
-            item = self.table.item(row, col)
-            if item:
-                url = item.data(Qt.UserRole) or item.text()
-                if url:
-                    try:
-                        QDesktopServices.openUrl(QUrl(url))
-                    except Exception:
-                        try: webbrowser.open(url)
-                        except Exception: pass
+        if index.column() in YouTubeResultsModel.LINK_COLS:
+            url = index.data(Qt.DisplayRole)
+            if url:
+                try:
+                    QDesktopServices.openUrl(QUrl(url))
+                except Exception:
+                    try: webbrowser.open(url)
+                    except Exception: pass
 
     # ▶ 스크립트 버튼 핸들러
-    def _on_script_clicked(self, row):
-        # 이미 캐시되어 있으면 즉시 표시
-        cached_item = self.table.item(row, 8)
-        if cached_item and cached_item.text().strip():
-            self.detail_text.setText(cached_item.text())
+    def _on_script_clicked(self, source_row):
+        row = self.model.row_at(source_row)
+        vid = row["video_id"]
+        # 이미 받아 둔 자막이면 즉시 표시
+        text = self.model.captions.get(vid, "")
+        if text.strip():
+            self.detail_text.setText(text)
             return
 
-        # URL 취득
-        btn = self.table.cellWidget(row, 9)
-        url = btn.property("video_url") if btn else None
-        if not url:
-            link_item = self.table.item(row, 2)
-            url = link_item.data(Qt.UserRole) if link_item else ""
-
         self.detail_text.setText("자막 로딩 중…")
-        loader = CaptionLoader(row, url)
-        loader.loaded.connect(self._on_caption_loaded)
-        self._cap_loaders[row] = loader
+        loader = CaptionLoader(vid, row["video_link"])
+        gen = self._search_gen
+        loader.loaded.connect(lambda v, text, gen=gen: gen == self._search_gen and self._on_caption_loaded(v, text))
+        if vid in self._cap_loaders:
+            self._retire(self._cap_loaders[vid])
+        self._cap_loaders[vid] = loader
         loader.start()
 
-    def _on_caption_loaded(self, row, text):
+    def _on_caption_loaded(self, vid, text):
         self.detail_text.setText(text or "(자막 없음)")
-        # 테이블에도 캐시
-        self.table.setItem(row, 8, QTableWidgetItem(text or ""))
-
-    # 저장 유틸
-    def _collect_rows(self):
-        rows=[]
-        for r in range(self.table.rowCount()):
-            rows.append({
-                "title": self.table.item(r,1).text() if self.table.item(r,1) else "",
-                "video_link": self.table.item(r,2).text() if self.table.item(r,2) else "",
-                "channel": self.table.item(r,3).text() if self.table.item(r,3) else "",
-                "channel_link": self.table.item(r,4).text() if self.table.item(r,4) else "",
-                "views": self.table.item(r,5).text() if self.table.item(r,5) else "",
-                "subscribers": self.table.item(r,6).text() if self.table.item(r,6) else "",
-                "upload_date": self.table.item(r,7).text() if self.table.item(r,7) else "",
-                "caption": self.table.item(r,8).text() if self.table.item(r,8) else "",
-            })
-        return rows
+        self.model.set_caption(vid, text)
 
-    def export_excel(self):
-        rows = self._collect_rows()
-        if not rows:
+    # ▶ 자막 일괄 받기
+    def on_bulk_captions(self):
+        rows = sorted({self._source_row(i) for i in self.table.selectionModel().selectedRows()}) \
+            or range(self.model.rowCount())
+        self._start_prefetch(self.model.vid_at(r) for r in rows)
+
+    def _start_prefetch(self, vids):
+        vids = [v for v in vids if not self.model.captions.get(v, "").strip()]
+        if not vids:
+            self._update_caption_status()
+            return 0
+        if self._prefetcher is None:
+            bridge = self._cap_bridge
+            self._prefetcher = pu.CaptionPrefetcher(lambda v, t, st: bridge.result.emit(v, t or "", st))
+        visible = set(self._visible_vids())
+        for v in vids:
+            self._prefetcher.submit([v], 0 if v in visible else 10)
+        self._caption_timer.start()
+        self._update_caption_status()
+        return len(vids)
+
+    def _stop_prefetch(self):
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+            self._prefetcher = None
+        self._export_after = None
+        self._caption_timer.stop()
+        self.lbl_caption.setText("")
+
+    def _on_bulk_caption(self, vid, text, status):
+        self.model.set_caption(vid, text)
+        self._update_caption_status()
+
+    def _update_caption_status(self):
+        p = self._prefetcher
+        if p is None:
+            return
+        msg = f"자막 {p.done}/{p.total} · 동시 {p.limit}"
+        if p.failed:
+            msg += f" · 실패 {p.failed}"
+        wait = p.paused_until - time.time()
+        if wait > 0:
+            msg += f" · 요청 제한(429) {int(wait) + 1}초 대기"
+        if p.pending() == 0:
+            self._caption_timer.stop()
+            if self._export_after:
+                path, self._export_after = self._export_after, None
+                self._start_export(path)
+        self.lbl_caption.setText(msg)
+
+    def export_excel_with_captions(self):
+        """자막이 빠진 행을 일괄로 받은 뒤(이미 받는 중이면 끝나길 기다렸다가) 엑셀 저장"""
+        if not self.model.rowCount():
             QMessageBox.information(self,"알림","저장할 데이터가 없습니다."); return
         path,_ = QFileDialog.getSaveFileName(self,"엑셀 저장","youtube_results.xlsx","Excel 파일 (*.xlsx)")
         if not path: return
-        pd.DataFrame(rows).to_excel(path, index=False)
-        QMessageBox.information(self,"완료",f"엑셀 저장 완료\n{path}")
+        self._export_after = path
+        self._start_prefetch(self.model.vid_at(r) for r in range(self.model.rowCount()))
+        if self._prefetcher is None:
+            path, self._export_after = self._export_after, None
+            self._start_export(path)
+
+    # 저장 — 모델에서 한 행씩 읽어 백그라운드에서 씀(화면의 정렬/필터 순서 그대로)
+    def _ask_path(self, title, default, filters):
+        if not self.proxy.rowCount():
+            QMessageBox.information(self,"알림","저장할 데이터가 없습니다."); return None
+        path,_ = QFileDialog.getSaveFileName(self, title, default, filters)
+        return path or None
+
+    def export_excel(self):
+        path = self._ask_path("엑셀 저장", "youtube_results.xlsx", "Excel 파일 (*.xlsx)")
+        if path: self._start_export(path)
 
     def export_html(self):
-        rows = self._collect_rows()
-        if not rows:
-            QMessageBox.information(self,"알림","저장할 데이터가 없습니다."); return
-        path,_ = QFileDialog.getSaveFileName(self,"HTML 저장","youtube_results.html","HTML 파일 (*.html)")
-        if not path: return
-        html = ["<html><head><meta charset='utf-8'></head><body><table border='1' cellspacing='0' cellpadding='6'>"]
-        html.append("<tr><th>제목</th><th>영상 링크</th><th>채널</th><th>채널 링크</th><th>조회수</th><th>구독자</th><th>업로드</th></tr>")
-        for r in rows:
-            html.append(
-                f"<tr>"
-                f"<td>{r['title']}</td>"
-                f"<td><a href='{r['video_link']}'>{r['video_link']}</a></td>"
-                f"<td>{r['channel']}</td>"
-                f"<td><a href='{r['channel_link']}'>{r['channel_link']}</a></td>"
-                f"<td>{r['views']}</td>"
-                f"<td>{r['subscribers']}</td>"
-                f"<td>{r['upload_date']}</td>"
-                f"</tr>"
-            )
-        html.append("</table></body></html>")
-        with open(path,"w",encoding="utf-8") as f: f.write("\n".join(html))
-        QMessageBox.information(self,"완료",f"HTML 저장 완료\n{path}")
+        path = self._ask_path("HTML 저장", "youtube_results.html", "HTML 파일 (*.html)")
+        if path: self._start_export(path)
+
+    def export_data(self):
+        path = self._ask_path("CSV/JSONL 저장", "youtube_results.csv", "CSV 파일 (*.csv);;JSON Lines (*.jsonl)")
+        if path: self._start_export(path)
+
+    def _start_export(self, path):
+        if self._export_worker is not None:
+            QMessageBox.information(self, "알림", "이전 저장이 아직 진행 중입니다."); return
+        try:
+            yt_export.format_of(path)
+        except ValueError as e:
+            QMessageBox.warning(self, "저장", str(e)); return
+        # 정렬/필터 순서(행 번호 목록)만 지금 잡고, 행 내용은 저장 스레드가 모델에서 하나씩 읽음
+        order = [self._source_row(self.proxy.index(r, 0)) for r in range(self.proxy.rowCount())]
+        w = ExportWorker(self.model.export_source(order), len(order), self.model.export_columns(), path)
+        w.progress.connect(lambda n, total: self.lbl_export.setText(f"저장 중 {n}/{total}"))
+        w.done.connect(self._on_export_done)
+        w.failed.connect(lambda m: (self.lbl_export.setText(f"저장 실패: {m}"),
+                                    m != "취소됨" and QMessageBox.critical(self, "오류", m)))
+        w.finished.connect(self._on_export_finished)
+        self._export_worker = w
+        for b in (self.export_html_btn, self.export_excel_btn, self.export_cap_btn, self.export_data_btn):
+            b.setEnabled(False)
+        self.export_cancel_btn.setVisible(True)
+        self.lbl_export.setText(f"저장 중 0/{len(order)}")
+        w.start()
+
+    def on_cancel_export(self):
+        if self._export_worker is not None:
+            self._export_worker.cancel()
+
+    def _on_export_done(self, path, n):
+        notes = self._export_worker.notes if self._export_worker is not None else []
+        self.lbl_export.setText(f"저장 완료 {n}개" + (" (분석 생략)" if notes else ""))
+        QMessageBox.information(self,"완료",f"저장 완료\n{path}" + "".join(f"\n{m}" for m in notes))
+
+    def _on_export_finished(self):
+        self._export_worker = None
+        for b in (self.export_html_btn, self.export_excel_btn, self.export_cap_btn, self.export_data_btn):
+            b.setEnabled(True)
+        self.export_cancel_btn.setVisible(False)
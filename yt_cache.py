@@ -0,0 +1,356 @@
+# yt_cache.py
+"""
+YouTube 캐시(SQLite 파일 하나 + 메모리 LRU).
+MetaCache   : 영상 ID 단위로 _build_row 결과 저장
+  - 느리게 바뀌는 값(제목/채널/업로드 날짜)과 빨리 바뀌는 값(조회수/구독자)의 TTL을 따로 둠
+  · 느린 TTL 초과 → 없는 것으로 취급(다시 추출)
+  · 빠른 TTL만 초과 → 캐시 값을 바로 쓰고 백그라운드에서 갱신(stale-while-revalidate)
+SearchCache : (키워드, 필터)별 검색 결과 순서(flat 행)를 위치 단위로 저장 — 다음 페이지는 이어 붙임
+ChannelCache: 채널 ID 단위 채널명/링크/구독자 수(같은 채널 영상들이 공유)
+"""
+import os, json, time, sqlite3, threading
+from collections import OrderedDict
+
+CACHE_ROOT = os.path.join(
+    os.getenv("LOCALAPPDATA") or os.path.expanduser("~"),
+    "OneInsight", "UnifiedCrawler", "cache"
+)
+DB_PATH = os.path.join(CACHE_ROOT, "yt_cache.sqlite3")
+
+# TTL(초) — 환경변수로 조절: YT_META_SLOW_TTL=604800, YT_META_FAST_TTL=21600
+SLOW_TTL = int(os.environ.get("YT_META_SLOW_TTL", str(7 * 24 * 3600)))
+FAST_TTL = int(os.environ.get("YT_META_FAST_TTL", str(6 * 3600)))
+# 검색 결과 순서는 금방 바뀌므로 짧게: YT_SEARCH_TTL=3600
+SEARCH_TTL = int(os.environ.get("YT_SEARCH_TTL", "3600"))
+# 구독자 수는 하루 정도 지나도 충분: YT_CHANNEL_TTL=86400
+CHANNEL_TTL = int(os.environ.get("YT_CHANNEL_TTL", str(24 * 3600)))
+
+# 캐시에 넣지 않는 키(행마다 달라지거나 화면 전용)
+_VOLATILE_KEYS = ("caption", "partial")
+
+FRESH, STALE = "fresh", "stale"
+
+
+class _Db:
+    """스레드 간 공유하는 SQLite 연결 하나(WAL, 잠금으로 직렬화)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        self._conn = None
+
+    def conn(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            c = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            c.execute("PRAGMA journal_mode=WAL")
+            c.execute("PRAGMA synchronous=NORMAL")
+            self._conn = c
+        return self._conn
+
+
+_DBS = {}
+_DBS_LOCK = threading.Lock()
+
+
+def shared_db(path=DB_PATH) -> _Db:
+    """같은 파일을 쓰는 캐시들이 연결 하나를 나눠 쓰도록"""
+    with _DBS_LOCK:
+        db = _DBS.get(path)
+        if db is None:
+            db = _DBS[path] = _Db(path)
+        return db
+
+
+class MetaCache:
+    def __init__(self, path=DB_PATH, lru_size=5000, slow_ttl=SLOW_TTL, fast_ttl=FAST_TTL):
+        self.db = shared_db(path)
+        self.lru_size = lru_size
+        self.slow_ttl = slow_ttl
+        self.fast_ttl = fast_ttl
+        self._lru = OrderedDict()   # video_id -> (row, slow_at, fast_at)
+        self._lock = threading.Lock()
+        self._ready = False
+        self.hits = self.stale_hits = self.misses = 0
+
+    def _ensure(self):
+        if self._ready:
+            return
+        with self.db.lock:
+            self.db.conn().execute(
+                "CREATE TABLE IF NOT EXISTS video_meta ("
+                " video_id TEXT PRIMARY KEY, row_json TEXT NOT NULL,"
+                " slow_at REAL NOT NULL, fast_at REAL NOT NULL)"
+            )
+            self.db.conn().commit()
+        self._ready = True
+
+    def _remember(self, vid, entry):
+        with self._lock:
+            self._lru[vid] = entry
+            self._lru.move_to_end(vid)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def _state(self, entry, now):
+        _, slow_at, fast_at = entry
+        if now - slow_at > self.slow_ttl:
+            return None
+        return FRESH if now - fast_at <= self.fast_ttl else STALE
+
+    def get_many(self, ids):
+        """{video_id: (row 사본, FRESH|STALE)} — 없거나 만료된 ID는 빠짐. 적중/실패 횟수 집계."""
+        self._ensure()
+        now = time.time()
+        found, missing = {}, []
+        with self._lock:
+            for vid in ids:
+                entry = self._lru.get(vid)
+                if entry is not None:
+                    self._lru.move_to_end(vid)
+                    found[vid] = entry
+                else:
+                    missing.append(vid)
+        if missing:
+            with self.db.lock:
+                c = self.db.conn()
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i:i + 500]
+                    q = ",".join("?" * len(chunk))
+                    for vid, row_json, slow_at, fast_at in c.execute(
+                        f"SELECT video_id, row_json, slow_at, fast_at FROM video_meta WHERE video_id IN ({q})", chunk
+                    ):
+                        entry = (json.loads(row_json), slow_at, fast_at)
+                        found[vid] = entry
+                        self._remember(vid, entry)
+        out = {}
+        for vid in ids:
+            entry = found.get(vid)
+            state = self._state(entry, now) if entry else None
+            if state is None:
+                self.misses += 1
+                continue
+            if state == FRESH:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+            out[vid] = (dict(entry[0], caption=""), state)
+        return out
+
+    def get(self, vid):
+        return self.get_many([vid]).get(vid)
+
+    def put_many(self, rows):
+        """상세 추출이 끝난 행 저장(느린/빠른 값 모두 지금 시각으로 갱신)"""
+        self._ensure()
+        now = time.time()
+        recs = []
+        for row in rows:
+            vid = row.get("video_id")
+            if not vid:
+                continue
+            clean = {k: v for k, v in row.items() if k not in _VOLATILE_KEYS}
+            self._remember(vid, (clean, now, now))
+            recs.append((vid, json.dumps(clean, ensure_ascii=False), now, now))
+        if recs:
+            with self.db.lock:
+                c = self.db.conn()
+                c.executemany("INSERT OR REPLACE INTO video_meta VALUES (?, ?, ?, ?)", recs)
+                c.commit()
+
+    def put(self, row):
+        self.put_many([row])
+
+    def stats(self) -> dict:
+        total = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits, "stale_hits": self.stale_hits, "misses": self.misses,
+            "hit_rate": round((self.hits + self.stale_hits) / total, 3) if total else 0.0,
+        }
+
+
+class SearchCache:
+    """
+    search_meta : key → 처음 받은 시각, 끝까지 받았는지
+    search_rows : (key, pos) → flat 행. 페이지 읽기는 pos 범위 조회 한 번.
+    TTL이 지난 key는 통째로 버리고 처음부터 다시 검색한다.
+    """
+
+    def __init__(self, path=DB_PATH, ttl=SEARCH_TTL):
+        self.db = shared_db(path)
+        self.ttl = ttl
+        self._ready = False
+        self.hits = self.misses = 0   # 페이지 단위
+
+    def _ensure(self):
+        if self._ready:
+            return
+        with self.db.lock:
+            c = self.db.conn()
+            c.execute("CREATE TABLE IF NOT EXISTS search_meta ("
+                      " key TEXT PRIMARY KEY, created_at REAL NOT NULL, exhausted INTEGER NOT NULL DEFAULT 0)")
+            c.execute("CREATE TABLE IF NOT EXISTS search_rows ("
+                      " key TEXT NOT NULL, pos INTEGER NOT NULL, video_id TEXT NOT NULL, row_json TEXT NOT NULL,"
+                      " PRIMARY KEY (key, pos))")
+            # 세션 시작 시 만료된 검색 정리(파일이 계속 커지지 않게)
+            old = [(k,) for k, in c.execute("SELECT key FROM search_meta WHERE created_at < ?",
+                                            (time.time() - self.ttl,))]
+            c.executemany("DELETE FROM search_rows WHERE key = ?", old)
+            c.executemany("DELETE FROM search_meta WHERE key = ?", old)
+            c.commit()
+        self._ready = True
+
+    def state(self, key):
+        """(저장된 행 수, 끝까지 받았는지). 만료됐으면 지우고 (0, False)."""
+        self._ensure()
+        with self.db.lock:
+            c = self.db.conn()
+            meta = c.execute("SELECT created_at, exhausted FROM search_meta WHERE key = ?", (key,)).fetchone()
+            if meta is None:
+                return 0, False
+            if time.time() - meta[0] > self.ttl:
+                c.execute("DELETE FROM search_rows WHERE key = ?", (key,))
+                c.execute("DELETE FROM search_meta WHERE key = ?", (key,))
+                c.commit()
+                return 0, False
+            n = c.execute("SELECT COUNT(*) FROM search_rows WHERE key = ?", (key,)).fetchone()[0]
+            return n, bool(meta[1])
+
+    def read(self, key, start, count):
+        self._ensure()
+        with self.db.lock:
+            rows = [json.loads(r) for r, in self.db.conn().execute(
+                "SELECT row_json FROM search_rows WHERE key = ? AND pos >= ? AND pos < ? ORDER BY pos",
+                (key, start, start + count))]
+        return rows
+
+    def ids(self, key):
+        self._ensure()
+        with self.db.lock:
+            return [v for v, in self.db.conn().execute(
+                "SELECT video_id FROM search_rows WHERE key = ? ORDER BY pos", (key,))]
+
+    def append(self, key, rows, exhausted=False):
+        """기존 끝 위치 뒤에 이어 붙임(처음이면 created_at 기록)"""
+        self._ensure()
+        with self.db.lock:
+            c = self.db.conn()
+            c.execute("INSERT OR IGNORE INTO search_meta (key, created_at) VALUES (?, ?)", (key, time.time()))
+            base = c.execute("SELECT COALESCE(MAX(pos) + 1, 0) FROM search_rows WHERE key = ?", (key,)).fetchone()[0]
+            c.executemany(
+                "INSERT INTO search_rows VALUES (?, ?, ?, ?)",
+                [(key, base + i, r["video_id"], json.dumps(r, ensure_ascii=False)) for i, r in enumerate(rows)]
+            )
+            if exhausted:
+                c.execute("UPDATE search_meta SET exhausted = 1 WHERE key = ?", (key,))
+            c.commit()
+
+    def drop(self, key):
+        """저장된 검색 결과를 버림(다음 조회는 새 검색)"""
+        self._ensure()
+        with self.db.lock:
+            c = self.db.conn()
+            c.execute("DELETE FROM search_rows WHERE key = ?", (key,))
+            c.execute("DELETE FROM search_meta WHERE key = ?", (key,))
+            c.commit()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0}
+
+
+class ChannelCache:
+    """channel_id → {channel_id, channel, channel_link, subscribers}. TTL 지나면 없는 것으로 취급."""
+
+    def __init__(self, path=DB_PATH, ttl=CHANNEL_TTL, lru_size=5000):
+        self.db = shared_db(path)
+        self.ttl = ttl
+        self.lru_size = lru_size
+        self._lru = OrderedDict()   # channel_id -> (row, fetched_at)
+        self._lock = threading.Lock()
+        self._ready = False
+        self.hits = self.misses = 0
+
+    def _ensure(self):
+        if self._ready:
+            return
+        with self.db.lock:
+            self.db.conn().execute(
+                "CREATE TABLE IF NOT EXISTS channel_meta ("
+                " channel_id TEXT PRIMARY KEY, row_json TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            self.db.conn().commit()
+        self._ready = True
+
+    def get_many(self, ids):
+        """{channel_id: row 사본} — 없거나 만료된 ID는 빠짐"""
+        self._ensure()
+        now = time.time()
+        found, missing = {}, []
+        with self._lock:
+            for cid in ids:
+                entry = self._lru.get(cid)
+                if entry is not None:
+                    self._lru.move_to_end(cid)
+                    found[cid] = entry
+                else:
+                    missing.append(cid)
+        if missing:
+            with self.db.lock:
+                c = self.db.conn()
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i:i + 500]
+                    q = ",".join("?" * len(chunk))
+                    for cid, row_json, at in c.execute(
+                        f"SELECT channel_id, row_json, fetched_at FROM channel_meta WHERE channel_id IN ({q})", chunk
+                    ):
+                        found[cid] = (json.loads(row_json), at)
+            with self._lock:
+                for cid in missing:
+                    if cid in found:
+                        self._lru[cid] = found[cid]
+                while len(self._lru) > self.lru_size:
+                    self._lru.popitem(last=False)
+        out = {}
+        for cid in ids:
+            entry = found.get(cid)
+            if entry is None or now - entry[1] > self.ttl:
+                self.misses += 1
+                continue
+            self.hits += 1
+            out[cid] = dict(entry[0])
+        return out
+
+    def put_many(self, rows):
+        self._ensure()
+        now = time.time()
+        recs = []
+        with self._lock:
+            for row in rows:
+                cid = row.get("channel_id")
+                if not cid:
+                    continue
+                self._lru[cid] = (dict(row), now)
+                self._lru.move_to_end(cid)
+                recs.append((cid, json.dumps(row, ensure_ascii=False), now))
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+        if recs:
+            with self.db.lock:
+                c = self.db.conn()
+                c.executemany("INSERT OR REPLACE INTO channel_meta VALUES (?, ?, ?)", recs)
+                c.commit()
+
+    def put(self, row):
+        self.put_many([row])
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0}
+
+
+META_CACHE = MetaCache()
+SEARCH_CACHE = SearchCache()
+CHANNEL_CACHE = ChannelCache()
@@ -0,0 +1,153 @@
+# yt_export.py
+"""
+YouTube 결과 저장기 — 행을 하나씩 받아 바로 파일에 씀(결과 전체를 문자열/표로 다시 모으지 않음).
+CSV(엑셀 호환 UTF-8 BOM) / JSONL / HTML(제목 등 이스케이프) / XLSX(openpyxl write_only, 메모리 일정)
+- 임시 파일(.part)에 쓰고 끝나면 바꿔 끼움 — 취소/오류면 기존 파일은 그대로
+- progress(n)는 PROGRESS_EVERY 행마다 호출, cancelled()가 참이 되면 ExportCancelled
+- XLSX는 키워드 분석(text_analysis)을 먼저 한 번 돌려 top_terms 칸과 분석 시트를 붙임
+  (분석 패스는 제목/앞부분 자막만 들고 있음). 분석이 실패하면 log로 알리고 본문만 저장
+"""
+import os, re, csv, json, html
+
+import text_analysis as ta
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".html": "html", ".htm": "html", ".xlsx": "xlsx"}
+PROGRESS_EVERY = 200
+
+# HTML 표에 넣는 칸(링크 칸은 <a>로)
+HTML_COLUMNS = [("title", "제목"), ("video_link", "영상 링크"), ("channel", "채널"), ("channel_link", "채널 링크"),
+                ("views", "조회수"), ("subscribers", "구독자"), ("upload_date", "업로드")]
+HTML_LINKS = ("video_link", "channel_link")
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+def format_of(path: str) -> str:
+    fmt = FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise ValueError(f"지원하지 않는 형식입니다: {path}")
+    return fmt
+
+
+def _cell(v):
+    return "" if v is None else v
+
+
+# ---- 형식별 쓰기(rows: dict 이터레이터) ----
+def _write_csv(f, rows, columns, tick):
+    w = csv.writer(f)
+    w.writerow(columns)
+    for r in rows:
+        w.writerow([_cell(r.get(c)) for c in columns])
+        tick()
+
+
+def _write_jsonl(f, rows, columns, tick):
+    for r in rows:
+        f.write(json.dumps({c: r.get(c) for c in columns}, ensure_ascii=False))
+        f.write("\n")
+        tick()
+
+
+def _write_html(f, rows, columns, tick):
+    esc = html.escape
+    f.write("<!DOCTYPE html>\n<html><head><meta charset='utf-8'><title>YouTube 검색 결과</title></head><body>\n"
+            "<table border='1' cellspacing='0' cellpadding='6'>\n<tr>")
+    f.write("".join(f"<th>{esc(label)}</th>" for _, label in HTML_COLUMNS))
+    f.write("</tr>\n")
+    for r in rows:
+        cells = []
+        for key, _ in HTML_COLUMNS:
+            v = esc(str(_cell(r.get(key))))
+            if key in HTML_LINKS and v.startswith("http"):
+                v = f"<a href=\"{v}\">{v}</a>"
+            cells.append(f"<td>{v}</td>")
+        f.write("<tr>" + "".join(cells) + "</tr>\n")
+        tick()
+    f.write("</table></body></html>\n")
+
+
+def _write_xlsx(path, rows, columns, tick, sheets):
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(columns)
+    for r in rows:
+        ws.append([_cell(r.get(c)) for c in columns])
+        tick()
+    for name, (cols, vals) in (sheets or {}).items():
+        extra = wb.create_sheet(name)
+        extra.append(list(cols))
+        for v in vals:
+            extra.append(list(v))
+    wb.save(path)
+
+
+def analyze_rows(rows):
+    """
+    제목+자막 키워드 분석 → (행별 top_terms 목록, 분석 시트). numpy가 없으면 (None, {}).
+    그룹: 여러 키워드 검색 결과면 가장 높은 순위로 잡힌 키워드, 아니면 채널.
+    """
+    if not ta.available():
+        return None, {}
+    light = [{"title": r.get("title"), "caption": (r.get("caption") or "")[:ta.MAX_CHARS],
+              "keywords": r.get("keywords"), "channel": r.get("channel"), "upload_date": r.get("upload_date")}
+             for r in rows]
+    if not light:
+        return None, {}
+    batch = any(r["keywords"] for r in light)
+    group = (lambda r: re.sub(r"\(\d+\)$", "", (r["keywords"] or "").split(", ")[0])) if batch else "channel"
+    res = ta.analyze(light, ("title", "caption"), group, "upload_date")
+    return [", ".join(t) for t in res["item_terms"]], ta.analysis_sheets(res)
+
+
+def export(rows_factory, path, columns, fmt=None, progress=None, cancelled=None, analysis=True, log=None) -> int:
+    """
+    rows_factory() → 행 dict 이터레이터(XLSX 분석 때문에 두 번 부를 수 있음).
+    log(msg): 건너뛴 단계 알림(분석 실패 등).
+    반환: 쓴 행 수.
+    """
+    fmt = fmt or format_of(path)
+    columns = list(columns)
+    count = 0
+
+    def tick():
+        nonlocal count
+        count += 1
+        if count % PROGRESS_EVERY == 0:
+            if cancelled is not None and cancelled():
+                raise ExportCancelled()
+            if progress is not None:
+                progress(count)
+
+    tmp = path + ".part"
+    try:
+        if fmt == "xlsx":
+            terms, sheets = None, {}
+            if analysis:
+                try:
+                    terms, sheets = analyze_rows(rows_factory())
+                except Exception as e:   # 분석 실패는 본문 저장에 영향 없음
+                    if log is not None:
+                        log(f"분석 시트 생략: {e}")
+            rows = rows_factory()
+            if terms is not None:
+                columns.append("top_terms")
+                rows = (dict(r, top_terms=t) for r, t in zip(rows, terms))
+            _write_xlsx(tmp, rows, columns, tick, sheets)
+        else:
+            writer = {"csv": _write_csv, "jsonl": _write_jsonl, "html": _write_html}[fmt]
+            with open(tmp, "w", encoding="utf-8-sig" if fmt == "csv" else "utf-8", newline="") as f:
+                writer(f, rows_factory(), columns, tick)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    if progress is not None:
+        progress(count)
+    return count
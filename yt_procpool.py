@@ -0,0 +1,91 @@
+# yt_procpool.py
+"""
+yt-dlp 상세 추출용 프로세스 풀(선택 백엔드, YT_META_BACKEND=process).
+- yt-dlp의 영상당 비용 중 상당 부분이 파이썬 CPU 작업(JSON/JS 파싱, 정규식, 포맷 정렬)이라
+  스레드를 8개 이상 늘려도 GIL 때문에 처리량이 잘 안 오름 → 프로세스로 나눔
+- 프로세스마다 YoutubeDL 하나를 만들어 풀이 살아 있는 동안 재사용(warm)
+- 주고받는 건 작게: 영상 ID 하나 → 행을 만드는 데 필요한 필드만 담은 dict
+  (info 전체는 포맷 목록 때문에 수백 KB라 프로세스 간 pickle 비용이 큼)
+행 구성/캐시 저장은 부모 프로세스(pytube_util)에서 한다.
+이 모듈은 자식 프로세스에서도 import되므로 yt_dlp 외에는 가져오지 않는다.
+"""
+import os, time, random, atexit, threading, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from yt_dlp import YoutubeDL
+
+# pytube_util.YDL_DETAIL과 같은 옵션
+YDL_DETAIL = {
+    "quiet": True, "skip_download": True, "noplaylist": True,
+    "socket_timeout": 10,
+}
+
+# _build_row가 읽는 필드만 돌려줌
+TRIM_KEYS = ("id", "webpage_url", "thumbnail", "title", "channel", "uploader", "channel_id",
+             "view_count", "channel_follower_count", "upload_date")
+
+_ydl = None   # 자식 프로세스별 YoutubeDL
+
+
+def _init():
+    global _ydl
+    _ydl = YoutubeDL(YDL_DETAIL)
+
+
+def extract(vid: str) -> dict:
+    """(자식 프로세스) 영상 ID → 필요한 필드만 남긴 info"""
+    global _ydl
+    time.sleep(random.uniform(0.02, 0.12))
+    url = vid if str(vid).startswith("http") else f"https://www.youtube.com/watch?v={vid}"
+    if _ydl is None:
+        _init()
+    try:
+        info = _ydl.extract_info(url, download=False)
+    except Exception:
+        # 스레드 백엔드와 같게: 오류 난 인스턴스는 버리고 다음 호출에서 새로
+        try:
+            _ydl.close()
+        except Exception:
+            pass
+        _ydl = None
+        raise
+    return {k: info.get(k) for k in TRIM_KEYS}
+
+
+# ---- 부모 프로세스: 풀은 앱 세션 동안 유지 ----
+# YT_META_PROCESSES: 자식 프로세스 수(기본 CPU 수). 호출 쪽 제출 창(META_LIMIT 등)과는 따로 —
+# 창이 더 크면 남는 작업은 풀 안에서 줄 서서 기다림(프로세스를 창 크기만큼 띄우지 않음)
+PROCESSES = max(1, int(os.environ.get("YT_META_PROCESSES", "0")) or os.cpu_count() or 4)
+
+_pool = None
+_lock = threading.Lock()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """
+    처음 한 번만 PROCESSES 크기로 만들고 이후엔 그대로 돌려줌
+    (다시 만들면 다른 호출이 기다리는 future가 취소되므로 shutdown 전에는 바꾸지 않음).
+    Windows와 같게 항상 spawn으로 띄움(GUI/스레드가 돌고 있는 프로세스를 fork하지 않음).
+    """
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=PROCESSES, initializer=_init,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def warm_up():
+    """자식 프로세스를 미리 모두 띄움(첫 검색에서 spawn+import 지연을 피하려면 앱 시작 때 호출)"""
+    ex = get_pool()
+    for f in [ex.submit(os.getpid) for _ in range(PROCESSES)]:
+        f.result()
+
+
+@atexit.register
+def shutdown(wait: bool = False):
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait, cancel_futures=True)
+            _pool = None
@@ -0,0 +1,219 @@
+# yt_watch.py
+"""
+키워드 감시: 같은 검색을 주기적으로 다시 돌려 새 영상과 조회수 변화만 뽑는다.
+- 키워드마다 마지막으로 본 영상 ID 집합과 영상별 조회수 스냅샷(직전/최근)을 저장
+- 한 주기 = flat 검색 한 번(캐시 무시) — 결과에 있는 영상의 조회수는 여기서 함께 갱신(추가 요청 없음)
+- 상세(구독자/업로드 날짜)는 처음 보는 영상만 추출
+- 첫 확인은 기준만 잡음(전부 "신규"로 보고하지 않음)
+- 검색이 실패하면(429/네트워크) 그 키워드만 WATCH_RETRY부터 두 배씩(최대 WATCH_INTERVAL) 쉬었다가 다시 확인
+감시 목록은 캐시가 아니라 사용자 데이터라 캐시 폴더 밖(UnifiedCrawler/watch.sqlite3)에 둔다.
+"""
+import os, json, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from yt_cache import CACHE_ROOT, shared_db
+import pytube_util as pu
+
+WATCH_PATH = os.path.join(os.path.dirname(CACHE_ROOT), "watch.sqlite3")
+# 환경변수로 조절: YT_WATCH_INTERVAL_MIN=60, YT_WATCH_DEPTH=200, YT_WATCH_RETRY_MIN=10
+WATCH_INTERVAL = int(os.environ.get("YT_WATCH_INTERVAL_MIN", "180")) * 60
+WATCH_RETRY = int(os.environ.get("YT_WATCH_RETRY_MIN", "5")) * 60   # 실패 후 첫 재시도 간격
+WATCH_DEPTH = int(os.environ.get("YT_WATCH_DEPTH", "100"))   # 키워드당 살펴볼 검색 결과 수
+TOP_GAINS = 20
+
+
+def watch_key(keyword: str, sort: str = "relevance", period: str | None = None) -> str:
+    return json.dumps([keyword.strip().lower(), sort or "relevance", period or ""], ensure_ascii=False)
+
+
+class WatchStore:
+    """
+    watch_keywords : 감시 중인 (키워드, 정렬, 기간)과 마지막 확인 시각, 연속 실패 수/다음 재시도 시각
+    watch_videos   : (키워드, 영상) → 처음/마지막으로 본 시각, 직전/최근 조회수, 행
+    """
+
+    def __init__(self, path=WATCH_PATH):
+        self.db = shared_db(path)
+        self._ready = False
+
+    def _ensure(self):
+        if self._ready:
+            return
+        with self.db.lock:
+            c = self.db.conn()
+            c.execute("CREATE TABLE IF NOT EXISTS watch_keywords ("
+                      " key TEXT PRIMARY KEY, keyword TEXT NOT NULL, sort TEXT NOT NULL, period TEXT NOT NULL,"
+                      " created_at REAL NOT NULL, checked_at REAL NOT NULL DEFAULT 0,"
+                      " failures INTEGER NOT NULL DEFAULT 0, retry_at REAL NOT NULL DEFAULT 0)")
+            cols = {r[1] for r in c.execute("PRAGMA table_info(watch_keywords)")}
+            for col, decl in (("failures", "INTEGER NOT NULL DEFAULT 0"), ("retry_at", "REAL NOT NULL DEFAULT 0")):
+                if col not in cols:   # 이전 버전에서 만든 파일
+                    c.execute(f"ALTER TABLE watch_keywords ADD COLUMN {col} {decl}")
+            c.execute("CREATE TABLE IF NOT EXISTS watch_videos ("
+                      " key TEXT NOT NULL, video_id TEXT NOT NULL, first_seen REAL NOT NULL, last_seen REAL NOT NULL,"
+                      " prev_views INTEGER, prev_at REAL, views INTEGER NOT NULL, views_at REAL NOT NULL,"
+                      " row_json TEXT NOT NULL, PRIMARY KEY (key, video_id))")
+            c.commit()
+        self._ready = True
+
+    # ---- 감시 목록 ----
+    def add(self, keyword, sort="relevance", period=None) -> str:
+        self._ensure()
+        key = watch_key(keyword, sort, period)
+        with self.db.lock:
+            c = self.db.conn()
+            c.execute("INSERT OR IGNORE INTO watch_keywords (key, keyword, sort, period, created_at)"
+                      " VALUES (?, ?, ?, ?, ?)", (key, keyword.strip(), sort or "relevance", period or "", time.time()))
+            c.commit()
+        return key
+
+    def remove(self, key):
+        self._ensure()
+        with self.db.lock:
+            c = self.db.conn()
+            c.execute("DELETE FROM watch_videos WHERE key = ?", (key,))
+            c.execute("DELETE FROM watch_keywords WHERE key = ?", (key,))
+            c.commit()
+
+    def entries(self) -> list:
+        self._ensure()
+        with self.db.lock:
+            cur = self.db.conn().execute(
+                "SELECT key, keyword, sort, period, checked_at, failures, retry_at FROM watch_keywords"
+                " ORDER BY created_at")
+            return [{"key": k, "keyword": kw, "sort": s, "period": p or None, "checked_at": at,
+                     "failures": nf, "retry_at": ra}
+                    for k, kw, s, p, at, nf, ra in cur]
+
+    def due(self, interval=WATCH_INTERVAL, now=None) -> list:
+        """확인할 때가 된 키워드(실패 후 쉬는 중인 키워드는 retry_at까지 제외)"""
+        now = now or time.time()
+        return [e for e in self.entries() if now - e["checked_at"] >= interval and now >= e["retry_at"]]
+
+    def failed(self, key, now=None, interval=WATCH_INTERVAL):
+        """확인 실패 기록 — 연속 실패마다 재시도 간격을 두 배로(WATCH_RETRY ~ interval)"""
+        self._ensure()
+        now = now or time.time()
+        with self.db.lock:
+            c = self.db.conn()
+            row = c.execute("SELECT failures FROM watch_keywords WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return
+            n = row[0] + 1
+            wait = min(interval, WATCH_RETRY * 2 ** min(n - 1, 16))
+            c.execute("UPDATE watch_keywords SET failures = ?, retry_at = ? WHERE key = ?", (n, now + wait, key))
+            c.commit()
+
+    # ---- 스냅샷 ----
+    def known(self, key) -> dict:
+        """video_id → (조회수, 그 시각)"""
+        self._ensure()
+        with self.db.lock:
+            return {v: (n, at) for v, n, at in self.db.conn().execute(
+                "SELECT video_id, views, views_at FROM watch_videos WHERE key = ?", (key,))}
+
+    def record(self, key, rows, now):
+        """
+        이번 검색에 나온 행 저장. 이미 있던 영상은 조회수를 직전→최근으로 밀고,
+        새 영상은 행과 함께 추가.
+        """
+        self._ensure()
+        with self.db.lock:
+            c = self.db.conn()
+            for r in rows:
+                vid, views = r["video_id"], r.get("views") or 0
+                cur = c.execute("UPDATE watch_videos SET prev_views = views, prev_at = views_at, views = ?,"
+                                " views_at = ?, last_seen = ? WHERE key = ? AND video_id = ?",
+                                (views, now, now, key, vid))
+                if cur.rowcount == 0:
+                    c.execute("INSERT INTO watch_videos (key, video_id, first_seen, last_seen, views, views_at, row_json)"
+                              " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                              (key, vid, now, now, views, now, json.dumps(r, ensure_ascii=False)))
+            c.execute("UPDATE watch_keywords SET checked_at = ?, failures = 0, retry_at = 0 WHERE key = ?",
+                      (now, key))
+            c.commit()
+
+    def count(self, key) -> int:
+        self._ensure()
+        with self.db.lock:
+            return self.db.conn().execute("SELECT COUNT(*) FROM watch_videos WHERE key = ?", (key,)).fetchone()[0]
+
+
+STORE = WatchStore()
+
+
+def check(entry: dict, store: WatchStore = STORE, depth: int = WATCH_DEPTH) -> dict:
+    """
+    한 키워드 한 주기. 반환(변화 보고):
+      new      : 새 영상 행(상세 포함, 첫 확인이면 빈 목록)
+      gains    : 직전 확인 대비 조회수 증가 상위(flat 행 + gain, per_hour)
+      baseline : 첫 확인이었는지
+    """
+    key, now = entry["key"], time.time()
+    known = store.known(key)
+    try:
+        rows = pu.search_page(entry["keyword"], 0, depth, entry["sort"], entry["period"], refresh=True)
+    except Exception:
+        store.failed(key, now)   # 자동 확인이 매 주기 같은 키워드를 두드리지 않도록
+        raise
+    baseline = not known
+    new_ids = [] if baseline else [r["video_id"] for r in rows if r["video_id"] not in known]
+
+    # 상세는 새 영상만(캐시에 있으면 요청 없음). 조회수는 방금 받은 flat 값이 더 최신.
+    details = {v: row for v, row, ok in pu.iter_video_details(new_ids) if ok}
+    flat = {r["video_id"]: r for r in rows}
+    new = [dict(details.get(v, flat[v]), views=flat[v]["views"] or details.get(v, {}).get("views", 0))
+           for v in new_ids]
+    by_new = {n["video_id"]: n for n in new}
+    store.record(key, [by_new.get(r["video_id"], r) for r in rows], now)
+
+    gains = []
+    for r in rows:
+        old = known.get(r["video_id"])
+        if old is None or not r["views"]:
+            continue
+        gain = r["views"] - (old[0] or 0)
+        hours = max((now - old[1]) / 3600, 1e-6)
+        gains.append(dict(r, gain=gain, per_hour=round(gain / hours, 1)))
+    gains.sort(key=lambda g: g["gain"], reverse=True)
+    return {
+        "key": key, "keyword": entry["keyword"], "checked_at": now, "baseline": baseline,
+        "in_results": len(rows), "tracked": store.count(key),
+        "dropped": len(set(known) - set(flat)),
+        "new": new, "gains": gains[:TOP_GAINS],
+    }
+
+
+def check_many(entries, store: WatchStore = STORE, max_workers: int = pu.BATCH_SEARCH_WORKERS):
+    """여러 키워드를 동시에 확인 — 끝나는 순서대로 (entry, report, error)"""
+    entries = list(entries)
+    if not entries:
+        return
+    ex = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(entries))), thread_name_prefix="yt-watch")
+    futs = {ex.submit(check, e, store): e for e in entries}
+    try:
+        for fut in as_completed(futs):
+            try:
+                yield futs[fut], fut.result(), None
+            except Exception as e:
+                yield futs[fut], None, str(e)
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
+
+def format_report(reports) -> str:
+    """변화 보고 목록 → 사람이 읽는 요약"""
+    out = []
+    for rep in reports:
+        head = f"■ {rep['keyword']} — {time.strftime('%Y-%m-%d %H:%M', time.localtime(rep['checked_at']))}"
+        if rep["baseline"]:
+            out.append(f"{head}\n  기준 설정: 영상 {rep['in_results']}개 (다음 확인부터 변화 표시)")
+            continue
+        out.append(f"{head}\n  새 영상 {len(rep['new'])}개 · 추적 {rep['tracked']}개 · 결과에서 빠짐 {rep['dropped']}개")
+        for n in rep["new"]:
+            ch = f"{n['channel']}, " if n.get("channel") else ""
+            out.append(f"  [신규] {n['title']} ({ch}조회수 {n.get('views', 0):,})")
+        for g in rep["gains"][:10]:
+            if g["gain"] > 0:
+                out.append(f"  [+{g['gain']:,}] {g['title']} (시간당 {g['per_hour']:,.0f})")
+    return "\n".join(out)